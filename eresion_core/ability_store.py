@@ -0,0 +1,60 @@
+# eresion_core/ability_store.py
+"""
+Columnar store for the abilities a player has unlocked.
+
+Ability ids are assigned by the store in unlock order, so they are simply
+row numbers. The numeric state that changes every frame (cooldowns, costs)
+lives in parallel numpy arrays; the AssembledAbility objects are kept
+alongside for names, triggers and primitives.
+"""
+
+from typing import List
+import numpy as np
+from shared.interfaces import AssembledAbility
+
+
+class AbilityStore:
+    """
+    Growable structure-of-arrays keyed by numeric ability id.
+
+    Cooldowns for every ability are ticked with one vector op per frame
+    instead of iterating over ability objects.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.cooldown_s = np.empty(capacity, dtype=np.float32)
+        self.remaining_cooldown_s = np.empty(capacity, dtype=np.float32)
+        self.resource_costs = np.empty(capacity, dtype=np.float32)
+        self.meta: List[AssembledAbility] = []
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, ability_id: int) -> AssembledAbility:
+        if not 0 <= ability_id < self.size:
+            raise IndexError("AbilityStore id out of range")
+        return self.meta[ability_id]
+
+    def add(self, ability: AssembledAbility) -> int:
+        """Store an unlocked ability, ready to use, and return its numeric id."""
+        ability_id = self.size
+        if ability_id == len(self.cooldown_s):
+            # Double every column; player ability counts stay small
+            for name in ('cooldown_s', 'remaining_cooldown_s', 'resource_costs'):
+                column = getattr(self, name)
+                grown = np.empty(2 * len(column), dtype=column.dtype)
+                grown[:ability_id] = column
+                setattr(self, name, grown)
+        self.cooldown_s[ability_id] = ability.cooldown_s
+        self.remaining_cooldown_s[ability_id] = 0.0
+        self.resource_costs[ability_id] = ability.resource_cost
+        self.meta.append(ability)
+        self.size += 1
+        return ability_id
+
+    def tick(self, delta_time_s: float):
+        """Advance every cooldown by delta_time_s, clamped at zero."""
+        remaining = self.remaining_cooldown_s[:self.size]
+        remaining -= delta_time_s
+        np.maximum(remaining, 0.0, out=remaining)
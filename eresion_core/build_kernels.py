@@ -0,0 +1,41 @@
+# eresion_core/build_kernels.py
+"""
+Ahead-of-time build of the hot Eresion kernels.
+
+Run ``python -m eresion_core.build_kernels`` once per platform to produce the
+``eresion_core._kernels_aot`` extension. When that extension is present,
+``eresion_core.kernels`` uses it instead of the JIT dispatchers, so the first
+crystallization cycle pays no compile or cache-load cost. The exported
+functions are the kernels' own Python sources, compiled with fixed signatures.
+
+The build uses ``numba.pycc``, which numba has marked pending deprecation
+(importing it emits ``NumbaPendingDeprecationWarning``) and plans to remove
+once its replacement ships. The extension is optional: ``kernels`` only uses
+it if it imports. Otherwise the kernels run as cached JIT dispatchers, or as
+their numpy fallbacks when numba is missing. All three produce the same
+results, which ``test_kernels.py`` checks. Delete ``_kernels_aot`` after
+changing an exported kernel and rebuild, or it keeps running the old code.
+"""
+
+import os
+from numba.pycc import CC
+from eresion_core import kernels
+
+EXPORTS = {
+    'count_bigrams': 'i4[:, :](i2[:], i8)',
+    'ingest_edge_pairs': 'void(i8[:], f8[:], b1[:], f8, f8, f4[:], f8[:], f8[:], i8[:], i8[:])',
+}
+
+
+def build(output_dir: str = os.path.dirname(os.path.abspath(__file__))):
+    """Compile every exported kernel into eresion_core/_kernels_aot."""
+    cc = CC('_kernels_aot')
+    cc.output_dir = output_dir
+    for name, signature in EXPORTS.items():
+        kernel = getattr(kernels, name)
+        cc.export(name, signature)(getattr(kernel, 'py_func', kernel))
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -1,16 +1,20 @@
-from collections import deque
 from typing import Dict, List, Optional, Any
 import time
-from itertools import combinations
+import asyncio
+import numpy as np
 from shared.interfaces import Token, AssembledAbility, IGameBridge
+from eresion_core.token_store import TokenStore
+from eresion_core.ability_store import AbilityStore
 from eresion_core.modules import SimpleNeuronalGraph, SimpleDataAnalytics, SimplePrimitiveComposer, SimpleBalancer, MockLLMConnector, SimpleManifestationDirector
 
+SILENCE_NODE_ID = "action:SILENCE"
+
 class CrystallizationPipeline:
     def __init__(self, analytics: SimpleDataAnalytics, composer: SimplePrimitiveComposer, balancer: SimpleBalancer, llm: MockLLMConnector, manifestor: SimpleManifestationDirector):
         self.analytics, self.composer, self.balancer, self.llm, self.manifestor = analytics, composer, balancer, llm, manifestor
 
-    async def process(self, graph: Any, current_session: int) -> Optional[Dict]:
-        stable_motifs = await self.analytics.find_stable_motifs(graph, current_session)
+    async def process(self, graph: Any, current_session: int, token_history: Optional[TokenStore] = None) -> Optional[Dict]:
+        stable_motifs = await self.analytics.find_stable_motifs(graph, current_session, token_history)
         if not stable_motifs:
             return None
         
@@ -20,28 +24,53 @@ class CrystallizationPipeline:
             return None
         
         final_package = {"source_motif": motif, "options": []}
-        for ability in options:
-            balanced = self.balancer.balance_ability(ability)
-            if not balanced:
-                continue
-            
-            balanced.name, balanced.narrative = await self.llm.generate_narrative_for_ability(balanced, motif)
+        balanced_options = [balanced for balanced in map(self.balancer.balance_ability, options) if balanced]
+        if len(balanced_options) < 2:
+            return None
+
+        # One batched narrative request for every surviving option
+        narratives = await self.llm.generate_narratives_for_abilities(balanced_options, motif)
+        for balanced, (name, narrative) in zip(balanced_options, narratives):
+            balanced.name, balanced.narrative = name, narrative
             directives = self.manifestor.generate_manifestation_directives(balanced)
             final_package["options"].append({"ability": balanced, "manifest_directives": directives})
 
-        if len(final_package["options"]) < 2:
-            return None
-            
         return final_package
 
 class EresionCore:
     def __init__(self, tokenizer: Any, graph: SimpleNeuronalGraph, pipeline: CrystallizationPipeline, bridge: IGameBridge):
         self.tokenizer, self.neuronal_graph, self.pipeline, self.bridge = tokenizer, graph, pipeline, bridge
-        self.token_history: deque[Token] = deque(maxlen=200000)
+        self.token_history = TokenStore(capacity=200000)
+        # Give the tokenizer's vocabulary the first codes, in its own order
+        if hasattr(tokenizer, 'type_names'):
+            self.token_history.intern_types(tokenizer.type_names)
+        # Seeded with a sentinel so succession tracking never has to check for a predecessor
+        self.last_action_node = SILENCE_NODE_ID
+        # Unlocked abilities, keyed by numeric id; cooldowns tick in update()
+        self.player_abilities = AbilityStore()
+        self._last_update_s: Optional[float] = None
         self.current_session = 0
+        self.session_start_s = 0.0
         self.last_slow_think_turn = 0
+        # Slow thinking is fed to one long-lived worker through a one-slot queue;
+        # both are created on the first update(), inside the running loop
+        self._cycle_queue: Optional[asyncio.Queue] = None
+        self._crystallization_worker: Optional[asyncio.Task] = None
+        self._crystallization_pending = False
+        # The worker and bulk ingest both start cycles; a cycle mines from the
+        # history's reusable snapshot buffer, so they must never overlap
+        self._cycle_lock = asyncio.Lock()
+        self.frame_budget_s = 0.008
+        self._frame_start: Optional[float] = None
 
     def start_new_session(self):
+        # Archive the finished session's tokens for cross-session motif stability
+        self.pipeline.analytics.archive_session(self.current_session,
+                                                self.token_history.snapshot_since(self.session_start_s),
+                                                self.token_history.type_names)
+        self.session_start_s = time.time()
+        # Offsets are most precise near the epoch, so put it on the new boundary
+        self.token_history.rebase(self.session_start_s)
         self.current_session += 1
         # The core no longer resets state; this is the head's responsibility.
         print(f"\n--- Eresion Core starting new session {self.current_session} ---")
@@ -50,51 +79,122 @@ class EresionCore:
         return f"{token.type}:{token.metadata.get('value', 'UNKNOWN')}"
 
     def process_token_batch(self, token_batch: List[Token]):
+        self._frame_start = time.perf_counter()
+        # One clock read per batch, shared by every edge it reinforces
+        now = time.time()
+        history = self.token_history
+
+        # One pass over the batch gathers everything the steps below need
+        type_codes, node_codes, timestamps, intensities = [], [], [], []
+        batch_nodes = set()
+        first_action_node = last_action_node = None
+        for token in token_batch:
+            node = self._get_node_id(token)
+            batch_nodes.add(node)
+            if token.type == "action":
+                if first_action_node is None:
+                    first_action_node = node
+                last_action_node = node
+            type_codes.append(history.intern_type(token.type))
+            node_codes.append(history.intern_node(node))
+            timestamps.append(token.timestamp_s)
+            intensities.append(token.metadata.get('intensity', 0.0))
+
         # --- Succession Tracking (between action primitives) --- 
-        action_tokens = [t for t in token_batch if t.type == "action"]
-        if action_tokens:
-            new_action_token = action_tokens[0]
-            last_action_token = None
-            for token in reversed(self.token_history):
-                if token.type == "action":
-                    last_action_token = token
-                    break
-            
-            if last_action_token and new_action_token:
-                node_a = self._get_node_id(last_action_token)
-                node_b = self._get_node_id(new_action_token)
-                self.neuronal_graph.reinforce_succession(node_a, node_b)
+        if first_action_node is not None:
+            self.neuronal_graph.reinforce_succession(self.last_action_node, first_action_node, now)
+            self.last_action_node = last_action_node
 
         # --- Co-occurrence Tracking (within a snapshot) --- 
-        unique_nodes = sorted(list(set(self._get_node_id(t) for t in token_batch)))
-        for node_a, node_b in combinations(unique_nodes, 2):
-            self.neuronal_graph.reinforce_cooccurrence(node_a, node_b)
+        self.neuronal_graph.reinforce_cooccurrences(sorted(batch_nodes), now)
 
-        # Add all new tokens to history
-        for token in token_batch:
-            self.token_history.append(token)
-            self.game_state.token_history.append(token)
+        # Add all new tokens to the columnar history in one batched write
+        history.push_batch(np.array(type_codes, dtype=np.int16), np.array(node_codes, dtype=np.int32),
+                           np.array(timestamps, dtype=np.float64), np.array(intensities, dtype=np.float32))
+
+    async def process_token_batches(self, batches: List[List[Token]]):
+        """
+        Bulk ingest for simulations and benchmarks.
+
+        Every batch is ingested without yielding, then a single crystallization
+        cycle runs to completion.
+        """
+        for batch in batches:
+            self.process_token_batch(batch)
+        await self._run_crystallization_cycle()
 
     async def update(self):
         # Run slow thinking on a turn-based schedule
-        if self.bridge.get_temporal_state()['turn'] > 0 and self.bridge.get_temporal_state()['turn'] % 40 == 0:
-            choice_package = await self.pipeline.process(self.neuronal_graph, self.current_session)
-            if choice_package:
-                print("\n[SYSTEM] A new power is crystallizing within you, born from your actions!")
-                print("Choose your evolution:")
-                for i, opt in enumerate(choice_package["options"], 1):
-                    ability = opt["ability"]
-                    print(f"  {i}: {ability.name} - {ability.narrative}")
-                
+        turn = self.bridge.get_temporal_state()['turn']
+        if turn > 0 and turn % 40 == 0:
+            self._crystallization_pending = True
+
+        if self._crystallization_worker is None:
+            self._cycle_queue = asyncio.Queue(maxsize=1)
+            self._crystallization_worker = asyncio.create_task(self._crystallization_loop())
+
+        # A frame already over budget defers the request to a later update
+        if self._crystallization_pending:
+            if self._frame_start is None or time.perf_counter() - self._frame_start <= self.frame_budget_s:
+                self._crystallization_pending = False
                 try:
-                    choice = 0 # In sim mode, we'll just pick the first option
-                    print(f"Enter choice (1 or 2): {choice + 1}") 
-                    if choice in [0, 1]:
-                        chosen_ability = choice_package["options"][choice]["ability"]
-                        # The core no longer applies the ability directly.
-                        # It should return the choice to the game head.
-                        print(f"[SYSTEM] Unlocked: {chosen_ability.name}! It is now part of you.")
-                    else:
-                        print("[SYSTEM] Invalid choice. The opportunity fades.")
-                except (ValueError, IndexError):
-                    print("[SYSTEM] Indecision. The opportunity fades.")
+                    self._cycle_queue.put_nowait(turn)
+                except asyncio.QueueFull:
+                    pass  # A cycle is already waiting; it will see the newer tokens anyway
+
+        self._frame_start = None
+
+        now = time.perf_counter()
+        if self._last_update_s is not None:
+            self.player_abilities.tick(now - self._last_update_s)
+        self._last_update_s = now
+
+        # Give the background cycle a slice of the loop
+        await asyncio.sleep(0)
+
+    async def _crystallization_loop(self):
+        while True:
+            await self._cycle_queue.get()
+            try:
+                await self._run_crystallization_cycle()
+            except Exception as e:
+                print(f"[SYSTEM] Crystallization failed: {e}")
+            finally:
+                self._cycle_queue.task_done()
+
+    async def shutdown(self):
+        """Stops the background crystallization worker."""
+        if self._crystallization_worker is not None:
+            self._crystallization_worker.cancel()
+            try:
+                await self._crystallization_worker
+            except asyncio.CancelledError:
+                pass
+            self._crystallization_worker = None
+
+    async def _run_crystallization_cycle(self):
+        async with self._cycle_lock:
+            await self._crystallize()
+
+    async def _crystallize(self):
+        choice_package = await self.pipeline.process(self.neuronal_graph, self.current_session, self.token_history)
+        if choice_package:
+            print("\n[SYSTEM] A new power is crystallizing within you, born from your actions!")
+            print("Choose your evolution:")
+            for i, opt in enumerate(choice_package["options"], 1):
+                ability = opt["ability"]
+                print(f"  {i}: {ability.name} - {ability.narrative}")
+
+            try:
+                choice = 0 # In sim mode, we'll just pick the first option
+                print(f"Enter choice (1 or 2): {choice + 1}") 
+                if choice in [0, 1]:
+                    chosen_ability = choice_package["options"][choice]["ability"]
+                    self.player_abilities.add(chosen_ability)
+                    # The core no longer applies the ability directly.
+                    # It should return the choice to the game head.
+                    print(f"[SYSTEM] Unlocked: {chosen_ability.name}! It is now part of you.")
+                else:
+                    print("[SYSTEM] Invalid choice. The opportunity fades.")
+            except (ValueError, IndexError):
+                print("[SYSTEM] Indecision. The opportunity fades.")
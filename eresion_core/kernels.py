@@ -0,0 +1,338 @@
+# eresion_core/kernels.py
+"""
+Compiled numeric kernels for the Eresion headless core.
+
+The slow-thinking pipeline spends most of its time in tight loops over the
+columnar token history. Those loops live here as numba ``@njit`` functions
+with explicit signatures, so numba compiles them (or loads them from its
+on-disk cache) when this module is imported and no call pays for
+compilation. numba is optional: without it, each kernel falls back to an
+equivalent vectorised numpy implementation.
+"""
+
+from bisect import bisect_right
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit, vectorize
+    from numba import types as nb
+    from numba.typed import Dict as NumbaDict
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Token type codes are packed 16 bits apiece into a uint64 key. Codes are
+# stored as code + 1 so an empty lane (0) marks the end of a shorter motif,
+# which keeps keys of different lengths distinct.
+MAX_PACKED_SEQUENCE_LENGTH = 4
+
+# Above this many distinct types a dense bigram matrix costs more than hashing
+MAX_DENSE_BIGRAM_TYPES = 1024
+_LANE_BITS = np.uint64(16)
+_LANE_MASK = np.uint64(0xFFFF)
+
+# Biometric category boundaries, lowest range first. A reading equal to a
+# boundary falls in the range above it.
+HEART_RATE_THRESHOLDS = (60.0, 80.0, 100.0, 120.0)
+AMBIENT_NOISE_THRESHOLDS = (30.0, 50.0, 70.0)
+FOCUS_THRESHOLDS = (0.4, 0.6, 0.8)
+STRESS_THRESHOLDS = (0.3, 0.6, 0.8)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nb.uint64(nb.int16[:]), cache=True, nogil=True)
+    def motif_key(sequence):
+        """Packs up to four int16 token type codes into one uint64 motif key."""
+        key = np.uint64(0)
+        for j in range(sequence.shape[0]):
+            key = (key << _LANE_BITS) | ((np.uint64(sequence[j]) + np.uint64(1)) & _LANE_MASK)
+        return key
+
+    # Archived sessions arrive as read-only memory maps; writable arrays convert too
+    _READONLY_TYPES = nb.Array(nb.int16, 1, 'A', readonly=True)
+
+    @njit(nb.Tuple((nb.uint64[:], nb.int64[:]))(_READONLY_TYPES, nb.int64, nb.int64), cache=True, nogil=True)
+    def count_ngrams(types, length, min_support):
+        """Counts every length-L window of ``types``; returns (motif keys, support) above min_support."""
+        counts = NumbaDict.empty(key_type=nb.uint64, value_type=nb.int64)
+        for i in range(types.shape[0] - length + 1):
+            key = np.uint64(0)
+            for j in range(length):
+                key = (key << _LANE_BITS) | ((np.uint64(types[i + j]) + np.uint64(1)) & _LANE_MASK)
+            counts[key] = counts.get(key, 0) + 1
+
+        frequent = 0
+        for count in counts.values():
+            if count >= min_support:
+                frequent += 1
+
+        keys = np.empty(frequent, dtype=np.uint64)
+        support = np.empty(frequent, dtype=np.int64)
+        row = 0
+        for key, count in counts.items():
+            if count >= min_support:
+                keys[row] = key
+                support[row] = count
+                row += 1
+        return keys, support
+
+else:
+
+    def motif_key(sequence: np.ndarray) -> np.uint64:
+        """Packs up to four int16 token type codes into one uint64 motif key."""
+        key = np.uint64(0)
+        for code in sequence.astype(np.uint64):
+            key = (key << _LANE_BITS) | ((code + np.uint64(1)) & _LANE_MASK)
+        return key
+
+    def count_ngrams(types: np.ndarray, length: int, min_support: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Counts every length-L window of ``types``; returns (motif keys, support) above min_support."""
+        if types.shape[0] < length:
+            return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+        windows = np.lib.stride_tricks.sliding_window_view(types.astype(np.uint64) + np.uint64(1), length)
+        keys = np.zeros(windows.shape[0], dtype=np.uint64)
+        for j in range(length):
+            keys = (keys << _LANE_BITS) | (windows[:, j] & _LANE_MASK)
+        unique_keys, counts = np.unique(keys, return_counts=True)
+        keep = counts >= min_support
+        return unique_keys[keep], counts[keep].astype(np.int64)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nb.int32[:, :](_READONLY_TYPES, nb.int64), cache=True, nogil=True)
+    def count_bigrams(types, n_types):
+        """Dense (n_types, n_types) count matrix of adjacent type-code pairs."""
+        counts = np.zeros((n_types, n_types), dtype=np.int32)
+        for i in range(types.shape[0] - 1):
+            counts[types[i], types[i + 1]] += 1
+        return counts
+
+else:
+
+    def count_bigrams(types: np.ndarray, n_types: int) -> np.ndarray:
+        """Dense (n_types, n_types) count matrix of adjacent type-code pairs."""
+        # Encode each pair as one flat index so a single bincount does the counting
+        pairs = types[:-1].astype(np.int64) * n_types + types[1:]
+        return np.bincount(pairs, minlength=n_types * n_types).astype(np.int32).reshape(n_types, n_types)
+
+
+def frequent_bigrams(types: np.ndarray, min_support: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Length-2 motif keys and support, like count_ngrams(types, 2, min_support).
+
+    Small vocabularies are counted into a dense matrix, which avoids hashing
+    every window; large ones fall back to count_ngrams.
+    """
+    n_types = int(types.max()) + 1 if types.shape[0] else 0
+    if n_types > MAX_DENSE_BIGRAM_TYPES:
+        return count_ngrams(types, 2, min_support)
+    return bigram_keys(count_bigrams(types, n_types), min_support)
+
+
+def bigram_keys(counts: np.ndarray, min_support: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Packed length-2 motif keys and support for the cells of a bigram matrix meeting min_support."""
+    first, second = np.nonzero(counts >= min_support)
+    keys = ((first.astype(np.uint64) + np.uint64(1)) << _LANE_BITS) | (second.astype(np.uint64) + np.uint64(1))
+    return keys, counts[first, second].astype(np.int64)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nb.void(nb.int64[:], nb.float64[:], nb.boolean[:], nb.float64, nb.float64,
+                  nb.float32[:], nb.float64[:], nb.float64[:], nb.int64[:], nb.int64[:]), cache=True, nogil=True)
+    def ingest_edge_pairs(pair_rows, amounts, co_occurrence, now, decay_per_s,
+                          weight, last_update, total_reinforcement, co_occurrence_count, succession_count):
+        """Decays, reinforces (bounded to [0,1]) and counts every edge pair in a single pass."""
+        for i in range(pair_rows.shape[0]):
+            row = pair_rows[i]
+            # Bring the weight forward once; later pairs on this row see last_update == now
+            if last_update[row] > 0.0 and last_update[row] < now:
+                weight[row] *= np.exp(-decay_per_s * (now - last_update[row]))
+            last_update[row] = now
+            weight[row] = min(1.0, weight[row] + amounts[i])
+            total_reinforcement[row] += amounts[i]
+            if co_occurrence[i]:
+                co_occurrence_count[row] += 1
+            else:
+                succession_count[row] += 1
+
+else:
+
+    def ingest_edge_pairs(pair_rows: np.ndarray, amounts: np.ndarray, co_occurrence: np.ndarray, now: float,
+                          decay_per_s: float, weight: np.ndarray, last_update: np.ndarray,
+                          total_reinforcement: np.ndarray, co_occurrence_count: np.ndarray,
+                          succession_count: np.ndarray):
+        """Decays, reinforces (bounded to [0,1]) and counts every edge pair in a single pass."""
+        rows, pair_edges = np.unique(pair_rows, return_inverse=True)
+        reinforcement = np.zeros(len(rows))
+        np.add.at(reinforcement, pair_edges, amounts)
+        last = last_update[rows]
+        decay = np.exp(-decay_per_s * np.maximum(now - last, 0.0))
+        weight[rows] = np.minimum(1.0, np.where(last > 0.0, weight[rows] * decay, weight[rows]) + reinforcement)
+        last_update[rows] = now
+        total_reinforcement[rows] += reinforcement
+        np.add.at(co_occurrence_count, pair_rows[co_occurrence], 1)
+        np.add.at(succession_count, pair_rows[~co_occurrence], 1)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nb.Tuple((nb.float64[:], nb.float64[:]))(nb.int64[:], nb.int64[:], nb.int64[:], nb.int32[:], nb.int32[:],
+                                                  nb.int64[:], nb.int64, nb.float64, nb.float64),
+          cache=True, nogil=True)
+    def edge_significance(rows, co_occurrence_count, succession_count, source_id, target_id, node_counts,
+                          total_tokens, stability_k, stability_theta):
+        """PMI and sigmoid(chi-squared) stability for each edge row; 0 where counts are missing."""
+        pmi = np.zeros(rows.shape[0])
+        stability = np.zeros(rows.shape[0])
+        for i in range(rows.shape[0]):
+            row = rows[i]
+            source_count = float(node_counts[source_id[row]])
+            target_count = float(node_counts[target_id[row]])
+            chi2 = 0.0
+            if total_tokens > 0 and source_count > 0.0 and target_count > 0.0:
+                joint = float(max(1, co_occurrence_count[row] + succession_count[row]))
+                pmi[i] = np.log(joint * total_tokens / (source_count * target_count))
+                # Squared deviation from the count expected under independence
+                expected = source_count * target_count / total_tokens
+                chi2 = (joint - expected) ** 2 / expected
+            exponent = min(50.0, max(-50.0, -stability_k * (chi2 - stability_theta)))
+            stability[i] = 1.0 / (1.0 + np.exp(exponent))
+        return pmi, stability
+
+else:
+
+    def edge_significance(rows: np.ndarray, co_occurrence_count: np.ndarray, succession_count: np.ndarray,
+                          source_id: np.ndarray, target_id: np.ndarray, node_counts: np.ndarray, total_tokens: int,
+                          stability_k: float, stability_theta: float) -> Tuple[np.ndarray, np.ndarray]:
+        """PMI and sigmoid(chi-squared) stability for each edge row; 0 where counts are missing."""
+        source_counts = node_counts[source_id[rows]].astype(np.float64)
+        target_counts = node_counts[target_id[rows]].astype(np.float64)
+        valid = (total_tokens > 0) & (source_counts > 0) & (target_counts > 0)
+        joint = np.maximum(1, co_occurrence_count[rows] + succession_count[rows]).astype(np.float64)
+        product = np.where(valid, source_counts * target_counts, 1.0)
+        pmi = np.where(valid, np.log(joint * max(total_tokens, 1) / product), 0.0)
+        expected = product / max(total_tokens, 1)
+        chi2 = np.where(valid, (joint - expected) ** 2 / expected, 0.0)
+        stability = 1.0 / (1.0 + np.exp(np.clip(-stability_k * (chi2 - stability_theta), -50.0, 50.0)))
+        return pmi, stability
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nb.Tuple((nb.float64, nb.int64, nb.int64, nb.int64, nb.int64))(nb.float64, nb.float64, nb.float64,
+                                                                         nb.float64),
+          cache=True, nogil=True)
+    def biometric_reading(heart_rate, ambient_noise, focus, health):
+        """Derived stress plus the category index of heart rate, noise, focus and stress, in one call."""
+        stress = max(0.0, (heart_rate - 70) / 50.0) * 0.4 + (1.0 - focus) * 0.3 + (1.0 - health) * 0.3
+        stress = max(0.0, min(1.0, stress))
+        hr_category = noise_category = focus_category = stress_category = 0
+        for threshold in HEART_RATE_THRESHOLDS:
+            hr_category += heart_rate >= threshold
+        for threshold in AMBIENT_NOISE_THRESHOLDS:
+            noise_category += ambient_noise >= threshold
+        for threshold in FOCUS_THRESHOLDS:
+            focus_category += focus >= threshold
+        for threshold in STRESS_THRESHOLDS:
+            stress_category += stress >= threshold
+        return stress, hr_category, noise_category, focus_category, stress_category
+
+else:
+
+    def biometric_reading(heart_rate: float, ambient_noise: float, focus: float,
+                          health: float) -> Tuple[float, int, int, int, int]:
+        """Derived stress plus the category index of heart rate, noise, focus and stress, in one call."""
+        stress = max(0.0, (heart_rate - 70) / 50.0) * 0.4 + (1.0 - focus) * 0.3 + (1.0 - health) * 0.3
+        stress = max(0.0, min(1.0, stress))
+        return (stress, bisect_right(HEART_RATE_THRESHOLDS, heart_rate),
+                bisect_right(AMBIENT_NOISE_THRESHOLDS, ambient_noise), bisect_right(FOCUS_THRESHOLDS, focus),
+                bisect_right(STRESS_THRESHOLDS, stress))
+
+
+if NUMBA_AVAILABLE:
+
+    @vectorize([nb.float64(nb.float64, nb.float64, nb.float64)], cache=True)
+    def stress_levels(heart_rate, focus, health):
+        """Elementwise derived stress in [0, 1], the same weighting as biometric_reading."""
+        stress = max(0.0, (heart_rate - 70) / 50.0) * 0.4 + (1.0 - focus) * 0.3 + (1.0 - health) * 0.3
+        return max(0.0, min(1.0, stress))
+
+else:
+
+    def stress_levels(heart_rate: np.ndarray, focus: np.ndarray, health: np.ndarray) -> np.ndarray:
+        """Elementwise derived stress in [0, 1], the same weighting as biometric_reading."""
+        stress = np.maximum(0.0, (heart_rate - 70) / 50.0) * 0.4 + (1.0 - focus) * 0.3 + (1.0 - health) * 0.3
+        return np.clip(stress, 0.0, 1.0)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nb.UniTuple(nb.float64, 2)(nb.float64, nb.float64, nb.float64, nb.float64, nb.float64, nb.float64,
+                                     nb.float64),
+          cache=True, nogil=True)
+    def trend_step(current, target, trend, dt, response_rate, max_response, noise):
+        """One physiological trend update; returns (unclamped new value, new trend)."""
+        trend += (target - current) * min(dt * response_rate, max_response)
+        return current + trend * dt + noise, trend
+
+else:
+
+    def trend_step(current: float, target: float, trend: float, dt: float, response_rate: float,
+                   max_response: float, noise: float) -> Tuple[float, float]:
+        """One physiological trend update; returns (unclamped new value, new trend)."""
+        trend += (target - current) * min(dt * response_rate, max_response)
+        return current + trend * dt + noise, trend
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nb.float64(nb.float64[:], nb.int64, nb.int64), cache=True, nogil=True)
+    def social_pressure(scores, n_quests, hostile_conversations):
+        """Social pressure in [0, 1] from relationship scores, active quests and hostile conversations."""
+        pressure = 0.0
+        for score in scores:
+            if score < -0.3:
+                pressure -= score * 0.3
+        pressure += n_quests * 0.1 + hostile_conversations * 0.2
+        return min(1.0, pressure)
+
+else:
+
+    def social_pressure(scores: np.ndarray, n_quests: int, hostile_conversations: int) -> float:
+        """Social pressure in [0, 1] from relationship scores, active quests and hostile conversations."""
+        pressure = float(-scores[scores < -0.3].sum()) * 0.3
+        pressure += n_quests * 0.1 + hostile_conversations * 0.2
+        return min(1.0, pressure)
+
+
+def motif_lengths(keys: np.ndarray) -> np.ndarray:
+    """Number of token types packed into each motif key."""
+    lengths = np.zeros(keys.shape[0], dtype=np.int64)
+    for lane in range(MAX_PACKED_SEQUENCE_LENGTH):
+        lengths += ((keys >> np.uint64(16 * lane)) & _LANE_MASK) != 0
+    return lengths
+
+
+def unpack_motif_key(key: int) -> Tuple[int, ...]:
+    """Recovers the token type codes from a packed motif key, oldest first."""
+    key = int(key)
+    codes = []
+    while key:
+        codes.append((key & 0xFFFF) - 1)
+        key >>= 16
+    return tuple(reversed(codes))
+
+
+# Prefer the ahead-of-time build (see build_kernels.py) when it has been compiled
+try:
+    from eresion_core import _kernels_aot
+    count_bigrams = _kernels_aot.count_bigrams
+    ingest_edge_pairs = _kernels_aot.ingest_edge_pairs
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+
@@ -8,11 +8,119 @@ Supports the existing GameState.biometric structure.
 """
 
 import time
-import random
 import math
-from typing import Dict, Any
+import random
+import numpy as np
+from eresion_core.kernels import trend_step
+from typing import Dict, Any, List, Optional, Sequence
 # FIXED: No longer imports concrete GameState - uses generic bridge data
 
+# Per-condition adjustments, looked up once per factor instead of compared per branch.
+# Conditions missing from a table (or an environment without the attribute) add nothing.
+_WEATHER_HR_DELTA = {"Stormy": 8, "Clear": -3}  # Stress from bad weather, calm when clear
+_TIME_OF_DAY_HR_DELTA = {"Night": 5, "Midnight": 5}  # Slightly elevated at night (alertness)
+_TIME_OF_DAY_FOCUS_DELTA = {"Night": -0.15, "Midnight": -0.15}  # Reduced focus at night
+_WEATHER_NOISE_DELTA = {"Rain": 15, "Stormy": 25}  # Rain and storm sounds
+_TIME_OF_DAY_TEMPERATURE_DELTA = {"Night": -5, "Midnight": -5}  # Cooler at night
+_WEATHER_TEMPERATURE_DELTA = {"Rain": -3, "Clear": 2}
+_WEATHER_HUMIDITY_DELTA = {"Rain": 25, "Clear": -10}
+_TIME_OF_DAY_LIGHT_LEVEL = {"Night": 0.1, "Midnight": 0.05, "Morning": 0.6}  # Replaces the base level
+
+
+class _NoisePool:
+    """
+    Uniform random samples drawn from NumPy in bulk.
+    
+    Each refill generates a block of samples at once and keeps them as a plain
+    list, so a single draw is a list index rather than an RNG call. Scalar and
+    array draws read the same stream, in order.
+    
+    With an explicit seed the pool owns its generator. Without one, every
+    refill is seeded from the `random` module, so random.seed() keeps
+    controlling the mock sensor noise as it did before the pool.
+    """
+    
+    def __init__(self, size: int = 4096, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed) if seed is not None else None
+        self._size = size
+        self._samples: List[float] = []
+        self._index = 0
+    
+    def _generator(self) -> np.random.Generator:
+        if self._rng is not None:
+            return self._rng
+        return np.random.default_rng(random.getrandbits(64))
+    
+    def _refill(self):
+        self._samples = self._generator().random(self._size).tolist()
+        self._index = 0
+    
+    def uniform(self, low: float, high: float) -> float:
+        """Next sample, scaled to [low, high)."""
+        if self._index == len(self._samples):
+            self._refill()
+        sample = self._samples[self._index]
+        self._index += 1
+        return low + (high - low) * sample
+    
+    def uniform_array(self, low: float, high: float, size: int) -> np.ndarray:
+        """Next size samples, scaled to [low, high)."""
+        samples = np.empty(size)
+        filled = 0
+        while filled < size:
+            if self._index == len(self._samples):
+                self._refill()
+            chunk = self._samples[self._index:self._index + size - filled]
+            samples[filled:filled + len(chunk)] = chunk
+            filled += len(chunk)
+            self._index += len(chunk)
+        return low + (high - low) * samples
+
+
+# Per-agent columns read and written by BiometricDataProvider.update_biometric_batch
+AGENT_BIOMETRIC_DTYPE = np.dtype([
+    ('heart_rate_bpm', np.float64),
+    ('player_focus_level', np.float64),
+    ('ambient_noise_db', np.float64),
+    ('health_percent', np.float64),
+    ('stamina_percent', np.float64),
+    ('in_combat', np.bool_),
+])
+
+
+# Location category bits; a name can match several keywords
+LOC_TOWN = 1
+LOC_SQUARE = 2
+LOC_FOREST = 4
+LOC_CAVE = 8
+_LOCATION_KEYWORDS = (("town", LOC_TOWN), ("square", LOC_SQUARE), ("forest", LOC_FOREST), ("cave", LOC_CAVE))
+_location_categories: Dict[str, int] = {}
+
+
+def _location_category(location: str) -> int:
+    """Category bits for a location name; the keyword scan runs once per distinct name."""
+    category = _location_categories.get(location)
+    if category is None:
+        lowered = location.lower()
+        category = 0
+        for keyword, bit in _LOCATION_KEYWORDS:
+            if keyword in lowered:
+                category |= bit
+        _location_categories[location] = category
+    return category
+
+
+def _location_base_noise(location: str) -> int:
+    """Ambient noise baseline for a location name."""
+    category = _location_category(location)
+    if category & (LOC_TOWN | LOC_SQUARE):
+        return 50  # Urban ambient noise
+    elif category & LOC_FOREST:
+        return 25  # Quiet forest
+    elif category & LOC_CAVE:
+        return 20  # Very quiet cave
+    return 35  # Quiet environment baseline
+
 
 class BiometricDataProvider:
     """
@@ -22,24 +130,31 @@ class BiometricDataProvider:
     (higher heart rate in combat, lower focus when low health, etc.)
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.baseline_hr = 72  # Baseline heart rate
         self.baseline_focus = 0.7  # Baseline focus level
         self.noise_factor = 0.1  # Random variation
+        self.noise = _NoisePool(seed=seed)
         
         # State tracking for realistic trends
         self.hr_trend = 0.0  # Gradual heart rate trend
         self.focus_trend = 0.0  # Gradual focus trend
         self.last_update = time.time()
+        
+        # Per-agent trends for update_biometric_batch, sized on first use
+        self.batch_hr_trend = np.zeros(0)
+        self.batch_focus_trend = np.zeros(0)
+        self.batch_last_update = self.last_update
     
-    def update_biometric_data(self, game_state: GameState) -> None:
+    def update_biometric_data(self, game_state: Any, now: Optional[float] = None) -> None:
         """
         Update the existing GameState.biometric with context-aware mock data.
         
         Args:
             game_state: Current game state to update
+            now: Tick time shared with the other providers; defaults to time.time()
         """
-        current_time = time.time()
+        current_time = time.time() if now is None else now
         dt = current_time - self.last_update
         self.last_update = current_time
         
@@ -47,7 +162,7 @@ class BiometricDataProvider:
         game_state.biometric.heart_rate_bpm = self._generate_heart_rate(game_state, dt)
         
         # Generate context-aware focus level
-        game_state.biometric.player_focus_level = self._generate_focus_level(game_state, dt)
+        game_state.biometric.player_focus_level = self._generate_focus_level(game_state, dt, current_time)
         
         # Generate context-aware ambient noise
         game_state.biometric.ambient_noise_db = self._generate_ambient_noise(game_state)
@@ -55,13 +170,77 @@ class BiometricDataProvider:
         # Update timestamp
         game_state.biometric.irl_timestamp = current_time
     
-    def _generate_heart_rate(self, game_state: GameState, dt: float) -> int:
+    def update_biometric_batch(self, agents: np.ndarray, environment: Any, locations: Sequence[str],
+                               session_start_time: Optional[float] = None, now: Optional[float] = None) -> None:
+        """
+        Update many agents' biometrics at once, with the same rules as update_biometric_data.
+        
+        Every per-agent branch becomes an array expression, and each noise
+        term is one vector draw for the whole batch.
+        
+        Args:
+            agents: Array of AGENT_BIOMETRIC_DTYPE records, updated in place
+            environment: Shared environment (weather, time_of_day)
+            locations: Location name of each agent
+            session_start_time: Session start, for fatigue; omitted means no fatigue
+            now: Tick time; defaults to time.time()
+        """
+        current_time = time.time() if now is None else now
+        dt = current_time - self.batch_last_update
+        self.batch_last_update = current_time
+        
+        n = len(agents)
+        if len(self.batch_hr_trend) != n:
+            self.batch_hr_trend = np.zeros(n)
+            self.batch_focus_trend = np.zeros(n)
+        
+        weather = getattr(environment, 'weather', None)
+        time_of_day = getattr(environment, 'time_of_day', None)
+        in_combat = agents['in_combat']
+        health = agents['health_percent']
+        stamina = agents['stamina_percent']
+        
+        # Heart rate; combat noise is only drawn when someone is fighting, as in the scalar path
+        target_hr = np.full(n, float(self.baseline_hr))
+        if in_combat.any():
+            target_hr += np.where(in_combat, 35 + self.noise.uniform_array(-5, 10, n), 0.0)
+        target_hr += np.where(health < 0.3, 20 * (1.0 - health), 0.0)
+        target_hr += np.where(stamina < 0.4, 15 * (1.0 - stamina), 0.0)
+        target_hr += _WEATHER_HR_DELTA.get(weather, 0)
+        target_hr += _TIME_OF_DAY_HR_DELTA.get(time_of_day, 0)
+        hr = agents['heart_rate_bpm']
+        self.batch_hr_trend += (target_hr - hr) * min(dt * 2.0, 0.3)
+        new_hr = hr + self.batch_hr_trend * dt + self.noise.uniform_array(-2, 2, n)
+        
+        # Focus
+        target_focus = self.baseline_focus + np.where(in_combat, np.where(health > 0.6, 0.2, -0.3), 0.0)
+        target_focus -= np.where(health < 0.4, 0.4 * (1.0 - health), 0.0)
+        target_focus -= np.where(stamina < 0.3, 0.3 * (1.0 - stamina), 0.0)
+        if session_start_time is not None:
+            session_duration_hours = (current_time - session_start_time) / 3600
+            if session_duration_hours > 1.0:
+                target_focus -= min(0.2, session_duration_hours * 0.05)
+        target_focus += _TIME_OF_DAY_FOCUS_DELTA.get(time_of_day, 0.0)
+        focus = agents['player_focus_level']
+        self.batch_focus_trend += (target_focus - focus) * min(dt * 1.5, 0.2)
+        new_focus = focus + self.batch_focus_trend * dt + self.noise.uniform_array(-0.03, 0.03, n)
+        
+        # Ambient noise
+        base_noise = np.array([_location_base_noise(location) for location in locations], dtype=np.float64)
+        base_noise += _WEATHER_NOISE_DELTA.get(weather, 0) + np.where(in_combat, 20, 0)
+        new_noise = base_noise + self.noise.uniform_array(-5, 8, n)
+        
+        agents['heart_rate_bpm'] = np.clip(np.trunc(new_hr), 45, 180)
+        agents['player_focus_level'] = np.clip(new_focus, 0.0, 1.0)
+        agents['ambient_noise_db'] = np.clip(np.trunc(new_noise), 15, 85)
+    
+    def _generate_heart_rate(self, game_state: Any, dt: float) -> int:
         """Generate realistic heart rate based on game context."""
         target_hr = self.baseline_hr
         
         # Combat significantly increases heart rate
         if game_state.player.in_combat:
-            target_hr += 35 + random.uniform(-5, 10)  # 107 ± 5 BPM in combat
+            target_hr += 35 + self.noise.uniform(-5, 10)  # 107 ± 5 BPM in combat
         
         # Low health increases stress/heart rate
         if game_state.player.health_percent < 0.3:
@@ -72,30 +251,20 @@ class BiometricDataProvider:
             target_hr += 15 * (1.0 - game_state.player.stamina_percent)  # Up to +15 BPM when exhausted
         
         # Environmental factors
-        if hasattr(game_state.environment, 'weather'):
-            if game_state.environment.weather == "Stormy":
-                target_hr += 8  # Stress from bad weather
-            elif game_state.environment.weather == "Clear":
-                target_hr -= 3  # Calm weather
+        target_hr += _WEATHER_HR_DELTA.get(getattr(game_state.environment, 'weather', None), 0)
         
         # Time of day effects
-        if hasattr(game_state.environment, 'time_of_day'):
-            if game_state.environment.time_of_day in ["Night", "Midnight"]:
-                target_hr += 5  # Slightly elevated at night (alertness)
-        
-        # Gradually trend toward target with realistic physiological response time
-        hr_diff = target_hr - game_state.biometric.heart_rate_bpm
-        trend_change = hr_diff * min(dt * 2.0, 0.3)  # 2.0 = response rate
-        self.hr_trend += trend_change
+        target_hr += _TIME_OF_DAY_HR_DELTA.get(getattr(game_state.environment, 'time_of_day', None), 0)
         
-        # Apply trend with natural variation
-        new_hr = game_state.biometric.heart_rate_bpm + self.hr_trend * dt
-        new_hr += random.uniform(-2, 2)  # Natural beat-to-beat variation
+        # Gradually trend toward target with realistic physiological response time (2.0 = response rate),
+        # applying the trend with natural beat-to-beat variation
+        new_hr, self.hr_trend = trend_step(game_state.biometric.heart_rate_bpm, target_hr, self.hr_trend, dt,
+                                           2.0, 0.3, self.noise.uniform(-2, 2))
         
         # Clamp to physiologically plausible range
         return max(45, min(180, int(new_hr)))
     
-    def _generate_focus_level(self, game_state: GameState, dt: float) -> float:
+    def _generate_focus_level(self, game_state: Any, dt: float, current_time: float) -> float:
         """Generate realistic focus level based on game context."""
         target_focus = self.baseline_focus
         
@@ -115,54 +284,36 @@ class BiometricDataProvider:
             target_focus -= 0.3 * (1.0 - game_state.player.stamina_percent)
         
         # Session duration affects focus (fatigue over time)
-        if hasattr(game_state.temporal, 'session_start_time'):
-            session_duration_hours = (time.time() - game_state.temporal.session_start_time) / 3600
+        session_start_time = getattr(game_state.temporal, 'session_start_time', None)
+        if session_start_time is not None:
+            session_duration_hours = (current_time - session_start_time) / 3600
             if session_duration_hours > 1.0:
                 target_focus -= min(0.2, session_duration_hours * 0.05)  # Gradual fatigue
         
         # Environmental factors
-        if hasattr(game_state.environment, 'time_of_day'):
-            if game_state.environment.time_of_day in ["Night", "Midnight"]:
-                target_focus -= 0.15  # Reduced focus at night
-        
-        # Gradually trend toward target
-        focus_diff = target_focus - game_state.biometric.player_focus_level
-        trend_change = focus_diff * min(dt * 1.5, 0.2)  # Slower than heart rate
-        self.focus_trend += trend_change
+        target_focus += _TIME_OF_DAY_FOCUS_DELTA.get(getattr(game_state.environment, 'time_of_day', None), 0.0)
         
-        # Apply trend with variation
-        new_focus = game_state.biometric.player_focus_level + self.focus_trend * dt
-        new_focus += random.uniform(-0.03, 0.03)  # Small natural variation
+        # Gradually trend toward target, slower than heart rate, with small natural variation
+        new_focus, self.focus_trend = trend_step(game_state.biometric.player_focus_level, target_focus,
+                                                 self.focus_trend, dt, 1.5, 0.2, self.noise.uniform(-0.03, 0.03))
         
         # Clamp to valid range
         return max(0.0, min(1.0, new_focus))
     
-    def _generate_ambient_noise(self, game_state: GameState) -> int:
+    def _generate_ambient_noise(self, game_state: Any) -> int:
         """Generate realistic ambient noise level."""
-        base_noise = 35  # Quiet environment baseline
-        
         # Location affects ambient noise
-        location = game_state.player.location.lower()
-        if "town" in location or "square" in location:
-            base_noise = 50  # Urban ambient noise
-        elif "forest" in location:
-            base_noise = 25  # Quiet forest
-        elif "cave" in location:
-            base_noise = 20  # Very quiet cave
+        base_noise = _location_base_noise(game_state.player.location)
         
         # Weather affects noise
-        if hasattr(game_state.environment, 'weather'):
-            if game_state.environment.weather == "Rain":
-                base_noise += 15  # Rain sounds
-            elif game_state.environment.weather == "Stormy":
-                base_noise += 25  # Storm sounds
+        base_noise += _WEATHER_NOISE_DELTA.get(getattr(game_state.environment, 'weather', None), 0)
         
         # Combat increases noise significantly
         if game_state.player.in_combat:
             base_noise += 20  # Combat sounds
         
         # Add realistic variation
-        noise_variation = random.uniform(-5, 8)
+        noise_variation = self.noise.uniform(-5, 8)
         final_noise = base_noise + noise_variation
         
         # Clamp to realistic dB range
@@ -177,66 +328,51 @@ class EnvironmentalDataProvider:
     atmospheric conditions, light levels, etc.
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.base_temperature = 22.0  # Celsius
         self.base_humidity = 45.0  # Percent
         self.base_light_level = 0.7  # Normalized 0-1
+        self.noise = _NoisePool(seed=seed)
     
-    def update_environmental_data(self, game_state: GameState) -> Dict[str, Any]:
+    def update_environmental_data(self, game_state: Any) -> Dict[str, Any]:
         """
         Generate additional environmental sensor data.
         
         Returns:
             Dictionary of environmental sensor readings
         """
+        weather = getattr(game_state.environment, 'weather', None)
+        time_of_day = getattr(game_state.environment, 'time_of_day', None)
+        
         # Temperature varies by time of day and weather
         temperature = self.base_temperature
-        if hasattr(game_state.environment, 'time_of_day'):
-            if game_state.environment.time_of_day in ["Night", "Midnight"]:
-                temperature -= 5  # Cooler at night
-        
-        if hasattr(game_state.environment, 'weather'):
-            if game_state.environment.weather == "Rain":
-                temperature -= 3
-            elif game_state.environment.weather == "Clear":
-                temperature += 2
+        temperature += _TIME_OF_DAY_TEMPERATURE_DELTA.get(time_of_day, 0)
+        temperature += _WEATHER_TEMPERATURE_DELTA.get(weather, 0)
         
         # Add natural variation
-        temperature += random.uniform(-2, 2)
+        temperature += self.noise.uniform(-2, 2)
         
         # Humidity varies with weather
-        humidity = self.base_humidity
-        if hasattr(game_state.environment, 'weather'):
-            if game_state.environment.weather == "Rain":
-                humidity += 25
-            elif game_state.environment.weather == "Clear":
-                humidity -= 10
+        humidity = self.base_humidity + _WEATHER_HUMIDITY_DELTA.get(weather, 0)
         
-        humidity = max(20, min(90, humidity + random.uniform(-5, 5)))
+        humidity = max(20, min(90, humidity + self.noise.uniform(-5, 5)))
         
         # Light level varies by time and location
-        light_level = self.base_light_level
-        if hasattr(game_state.environment, 'time_of_day'):
-            if game_state.environment.time_of_day == "Night":
-                light_level = 0.1
-            elif game_state.environment.time_of_day == "Midnight":
-                light_level = 0.05
-            elif game_state.environment.time_of_day == "Morning":
-                light_level = 0.6
+        light_level = _TIME_OF_DAY_LIGHT_LEVEL.get(time_of_day, self.base_light_level)
         
         # Indoor/outdoor affects light
-        location = game_state.player.location.lower()
-        if "cave" in location:
+        location_category = _location_category(game_state.player.location)
+        if location_category & LOC_CAVE:
             light_level *= 0.1  # Very dark
-        elif "town" in location:
+        elif location_category & LOC_TOWN:
             light_level += 0.2  # Artificial lighting
         
         return {
             "temperature_celsius": round(temperature, 1),
             "humidity_percent": round(humidity, 1),
             "light_level_normalized": round(max(0.0, min(1.0, light_level)), 2),
-            "air_quality_index": random.uniform(0.7, 0.95),  # Generally good air quality
-            "barometric_pressure_hpa": 1013 + random.uniform(-10, 10)  # Standard pressure ± variation
+            "air_quality_index": self.noise.uniform(0.7, 0.95),  # Generally good air quality
+            "barometric_pressure_hpa": 1013 + self.noise.uniform(-10, 10)  # Standard pressure ± variation
         }
 
 
@@ -248,23 +384,34 @@ class MockSessionProvider:
     into the Tier 1 session tracking tokens.
     """
     
+    # Recent-action rate window, kept as one circular bucket per second
+    RATE_WINDOW_S = 60
+
     def __init__(self):
         self.session_start = time.time()
         self.action_history = []
         self.last_action_time = time.time()
+        self._rate_buckets = np.zeros(self.RATE_WINDOW_S, dtype=np.int32)
+        # Whole second each bucket currently counts; -1 marks a never-used bucket
+        self._bucket_seconds = np.full(self.RATE_WINDOW_S, -1, dtype=np.int64)
+        self._bucket_actions = [set() for _ in range(self.RATE_WINDOW_S)]
+        # Every location an action has been taken in; the history is never trimmed
+        self._action_locations = set()
     
-    def update_session_metrics(self, game_state: GameState, action_taken: str = None) -> Dict[str, Any]:
+    def update_session_metrics(self, game_state: Any, action_taken: str = None,
+                               now: Optional[float] = None) -> Dict[str, Any]:
         """
         Update session-level metrics and tracking.
         
         Args:
             game_state: Current game state
             action_taken: Name of action just taken (if any)
+            now: Tick time shared with the other providers; defaults to time.time()
             
         Returns:
             Session metrics dictionary
         """
-        current_time = time.time()
+        current_time = time.time() if now is None else now
         
         # Track action if provided
         if action_taken:
@@ -274,22 +421,34 @@ class MockSessionProvider:
                 'location': game_state.player.location
             })
             self.last_action_time = current_time
+            second = int(current_time)
+            bucket = second % self.RATE_WINDOW_S
+            if self._bucket_seconds[bucket] != second:
+                # The bucket is being reused for a new second; drop what it counted
+                self._bucket_seconds[bucket] = second
+                self._rate_buckets[bucket] = 0
+                self._bucket_actions[bucket].clear()
+            self._rate_buckets[bucket] += 1
+            self._bucket_actions[bucket].add(action_taken)
+            self._action_locations.add(game_state.player.location)
         
         # Calculate session metrics
         session_duration = current_time - self.session_start
         actions_this_session = len(self.action_history)
         
-        # Calculate recent action frequency
-        recent_actions = [a for a in self.action_history if current_time - a['timestamp'] < 60]  # Last minute
-        actions_per_minute = len(recent_actions)
+        # Calculate recent action frequency from the buckets still inside the last minute
+        live = self._bucket_seconds > int(current_time) - self.RATE_WINDOW_S
+        actions_per_minute = int(self._rate_buckets[live].sum())
         
         # Calculate action diversity
-        recent_action_types = set(a['action'] for a in recent_actions)
-        action_diversity = len(recent_action_types) / max(1, len(recent_actions)) if recent_actions else 0
+        if actions_per_minute:
+            recent_action_types = set().union(*(self._bucket_actions[i] for i in np.flatnonzero(live)))
+            action_diversity = len(recent_action_types) / actions_per_minute
+        else:
+            action_diversity = 0
         
         # Calculate location exploration
-        unique_locations = set(a['location'] for a in self.action_history)
-        exploration_score = len(unique_locations) / max(1, actions_this_session)
+        exploration_score = len(self._action_locations) / max(1, actions_this_session)
         
         return {
             "session_duration_s": session_duration,
@@ -308,7 +467,7 @@ _environmental_provider = EnvironmentalDataProvider()
 _session_provider = MockSessionProvider()
 
 
-def update_mock_data(game_state: GameState, action_taken: str = None) -> Dict[str, Any]:
+def update_mock_data(game_state: Any, action_taken: str = None, now: Optional[float] = None) -> Dict[str, Any]:
     """
     Main entry point to update all mock data providers.
     
@@ -318,18 +477,22 @@ def update_mock_data(game_state: GameState, action_taken: str = None) -> Dict[st
     Args:
         game_state: Current game state to update
         action_taken: Name of action just taken (optional)
+        now: Tick time (optional); read once here and shared by every provider
         
     Returns:
         Dictionary containing all generated mock data for debugging/analysis
     """
+    if now is None:
+        now = time.time()
+    
     # Update biometric data in the existing GameState.biometric structure
-    _biometric_provider.update_biometric_data(game_state)
+    _biometric_provider.update_biometric_data(game_state, now)
     
     # Generate additional environmental data
     environmental_data = _environmental_provider.update_environmental_data(game_state)
     
     # Update session metrics
-    session_metrics = _session_provider.update_session_metrics(game_state, action_taken)
+    session_metrics = _session_provider.update_session_metrics(game_state, action_taken, now)
     
     return {
         "biometric": {
@@ -342,7 +505,7 @@ def update_mock_data(game_state: GameState, action_taken: str = None) -> Dict[st
     }
 
 
-def get_mock_data_summary(game_state: GameState) -> str:
+def get_mock_data_summary(game_state: Any) -> str:
     """
     Get a human-readable summary of current mock data state.
     
@@ -1,122 +1,405 @@
+import os
 import time
-from collections import defaultdict
+import json
+import asyncio
+from functools import lru_cache
+from glob import glob
+from string import Template
+from collections import OrderedDict
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from typing import List, Dict, Optional, Tuple, Any
+from eresion_core.kernels import bigram_keys, count_ngrams, frequent_bigrams, motif_key, motif_lengths, unpack_motif_key, MAX_PACKED_SEQUENCE_LENGTH
 from shared.interfaces import (
     NeuronalGraphConfig, DataAnalyticsConfig, BalancerConfig,
-    Token, BehavioralMotif, AssembledAbility, AbilityPrimitive, TriggerCondition,
+    Token, BehavioralMotif, AssembledAbility, AbilityPrimitive, SequenceTrigger,
     INeuronalGraph, IDataAnalytics, IPrimitiveComposer, IBalancer, ILLMConnector, IManifestationDirector
 )
 
 class SimpleNeuronalGraph(INeuronalGraph):
-    def __init__(self, config: NeuronalGraphConfig):
+    """
+    Working-memory graph stored as structure-of-arrays.
+
+    Node names are interned to small ints; each directed (source, destination)
+    pair owns one row across parallel numpy columns, so finding the strongest
+    edge is a single array reduction rather than a walk over nested dicts.
+    """
+
+    COLUMNS = {
+        'succession_weight': np.float64,
+        'cooccurrence_weight': np.float64,
+        'last_update_s': np.float64,
+        'source_id': np.int32,
+        'destination_id': np.int32,
+    }
+
+    def __init__(self, config: NeuronalGraphConfig, capacity: int = 256):
         self.config = config
-        # The graph now stores different edge types
-        self.graph = defaultdict(lambda: defaultdict(lambda: {
-            "succession_weight": 0.0,
-            "cooccurrence_weight": 0.0,
-            "last_update_s": time.time()
-        }))
+        # Read on every reinforced pair, so looked up once here
+        self._reinforcement_base = config.reinforcement_base
+        self.node_ids: Dict[str, int] = {}
+        self.node_names: List[str] = []
+        self.edge_rows: Dict[int, int] = {}  # Packed (source_id << 32 | destination_id) -> row
+        self.size = 0
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        # Co-occurrence weights only ever grow, so the heaviest edge is tracked as they do
+        self._strongest_row = -1
+        self._strongest_weight = 0.0
+
+    def intern_node(self, node: str) -> int:
+        node_id = self.node_ids.get(node)
+        if node_id is None:
+            node_id = self.node_ids[node] = len(self.node_names)
+            self.node_names.append(node)
+        return node_id
+
+    def _edge_row(self, source_id: int, destination_id: int) -> int:
+        """Row of a directed edge, created zeroed on first use."""
+        key = (source_id << 32) | destination_id
+        row = self.edge_rows.get(key)
+        if row is None:
+            if self.size == len(self.last_update_s):
+                # Double every column
+                for name in self.COLUMNS:
+                    column = getattr(self, name)
+                    grown = np.zeros(2 * len(column), dtype=column.dtype)
+                    grown[:self.size] = column[:self.size]
+                    setattr(self, name, grown)
+            row = self.edge_rows[key] = self.size
+            self.source_id[row] = source_id
+            self.destination_id[row] = destination_id
+            self.size += 1
+        return row
 
     def reinforce_sequence(self, sequence: List[Token]):
         # This method satisfies the ABC contract from the interface.
         # In our new design, we call the more specific methods from core.py
         pass
 
-    def reinforce_succession(self, node_a: str, node_b: str):
+    def reinforce_succession(self, node_a: str, node_b: str, now: Optional[float] = None):
         # Directed edge for A -> B
-        self.graph[node_a][node_b]["succession_weight"] += self.config.reinforcement_base
-        self.graph[node_a][node_b]["last_update_s"] = time.time()
+        row = self._edge_row(self.intern_node(node_a), self.intern_node(node_b))
+        self.succession_weight[row] += self._reinforcement_base
+        self.last_update_s[row] = time.time() if now is None else now
+
+    def reinforce_cooccurrence(self, node_a: str, node_b: str, now: Optional[float] = None):
+        # Undirected edge for A <-> B, stored once in canonical order
+        if node_b < node_a:
+            node_a, node_b = node_b, node_a
+        row = self._edge_row(self.intern_node(node_a), self.intern_node(node_b))
+        self.cooccurrence_weight[row] += self._reinforcement_base
+        self.last_update_s[row] = time.time() if now is None else now
+        if self.cooccurrence_weight[row] > self._strongest_weight:
+            self._strongest_row = row
+            self._strongest_weight = float(self.cooccurrence_weight[row])
 
-    def reinforce_cooccurrence(self, node_a: str, node_b: str):
-        # Undirected edge for A <-> B
-        self.graph[node_a][node_b]["cooccurrence_weight"] += self.config.reinforcement_base
-        self.graph[node_b][node_a]["cooccurrence_weight"] += self.config.reinforcement_base
-        self.graph[node_a][node_b]["last_update_s"] = time.time()
-        self.graph[node_b][node_a]["last_update_s"] = time.time()
+    def reinforce_cooccurrences(self, nodes: List[str], now: Optional[float] = None):
+        """
+        Reinforces the undirected edge between every pair of distinct nodes, in one array update.
+
+        An undirected edge is stored once, on the row running from the
+        lexically smaller node to the larger one.
+        """
+        if len(nodes) < 2:
+            return
+        if now is None:
+            now = time.time()
+        ids = [self.intern_node(node) for node in sorted(nodes)]
+        rows = [self._edge_row(a, b) for i, a in enumerate(ids) for b in ids[i + 1:]]
+        # Distinct nodes make every row distinct, so plain fancy indexing is safe
+        rows = np.array(rows, dtype=np.int64)
+        self.cooccurrence_weight[rows] += self._reinforcement_base
+        self.last_update_s[rows] = now
+        weights = self.cooccurrence_weight[rows]
+        best = int(np.argmax(weights))
+        if weights[best] > self._strongest_weight:
+            self._strongest_row = int(rows[best])
+            self._strongest_weight = float(weights[best])
+
+    def strongest_cooccurrence(self) -> Optional[Tuple[str, str, float]]:
+        """(source, destination, weight) of the heaviest co-occurrence edge; the first to reach it on ties."""
+        row = self._strongest_row
+        if row < 0:
+            return None
+        return self.node_names[self.source_id[row]], self.node_names[self.destination_id[row]], self._strongest_weight
 
     def get_active_musical_context(self) -> Dict[str, Any]:
         return {"tempo_bpm": 120, "intensity": 0.5}  # Stub
 
 class SimpleDataAnalytics(IDataAnalytics):
+    MOTIF_CACHE_LIMIT = 1024  # Per-instance cap on remembered motifs
+
     def __init__(self, config: DataAnalyticsConfig):
         self.config = config
         self.last_found_motif_id = ""
-        self.embeddings = {
-            "action:ATTACK": np.array([0.8, 0.2]),
-            "action:DEFEND": np.array([0.2, 0.8]),
-            "health:LOW": np.array([0.9, 0.1]), # low health is an aggressive context
-            "location:DEEP_FOREST": np.array([0.6, 0.4]), # forest is more aggressive
-            "location:TOWN_SQUARE": np.array([0.1, 0.9]), # town is defensive
+        # Sequence motifs are keyed by their packed uint64 type codes. Once full,
+        # the least frequently rediscovered motif is forgotten first (oldest on ties).
+        self.discovered_motifs: Dict[int, BehavioralMotif] = {}
+        self._discovery_hits: Dict[int, int] = {}
+        self.session_motif_keys: Dict[int, np.ndarray] = {}
+        # Archives are immutable once written, so each one is mined only once
+        self.archived_motif_keys: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+        # Stable motifs recur by definition; each id's embedding lookup runs once.
+        # Cached motifs are templates that are never handed out, so callers
+        # always get a fresh motif they can keep.
+        self._motif_cache: "OrderedDict[str, BehavioralMotif]" = OrderedDict()
+        # Sequence mining is CPU-bound; the compiled kernel releases the GIL,
+        # so running it here keeps the game loop responsive.
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eresion-analytics")
+        # Each sequence length is an independent pass over the same array; the
+        # kernels are nogil, so they run on separate cores
+        self.mining_executor = ThreadPoolExecutor(max_workers=MAX_PACKED_SEQUENCE_LENGTH,
+                                                  thread_name_prefix="eresion-mining")
+        # (aggression, defense) per known node, one row each; the last two rows are the fallbacks
+        self.embedding_rows: Dict[str, int] = {
+            "action:ATTACK": 0,
+            "action:DEFEND": 1,
+            "health:LOW": 2,
+            "location:DEEP_FOREST": 3,
+            "location:TOWN_SQUARE": 4,
         }
+        self.embedding_matrix = np.array([
+            [0.8, 0.2],
+            [0.2, 0.8],
+            [0.9, 0.1], # low health is an aggressive context
+            [0.6, 0.4], # forest is more aggressive
+            [0.1, 0.9], # town is defensive
+            [0.5, 0.5], # any weather
+            [0.1, 0.1], # Default neutral
+        ])
+        # Lookups hand out views of shared rows, so the matrix is frozen
+        self.embedding_matrix.flags.writeable = False
+        self._weather_embedding_row = 5
+        self._neutral_embedding_row = 6
 
-    def get_embedding(self, node_id: str) -> np.ndarray:
+    def embedding_row(self, node_id: str) -> int:
         # Simple lookup, with a fallback for generic types
-        if node_id in self.embeddings:
-            return self.embeddings[node_id]
-        
-        generic_type = node_id.split(":")[0]
-        if generic_type == "weather":
-            return np.array([0.5, 0.5])
-        return np.array([0.1, 0.1]) # Default neutral
+        row = self.embedding_rows.get(node_id)
+        if row is not None:
+            return row
+        if node_id.startswith("weather:") or node_id == "weather":
+            return self._weather_embedding_row
+        return self._neutral_embedding_row
+
+    def get_embedding(self, node_id: str) -> np.ndarray:
+        """Read-only view of a node's embedding row."""
+        return self.embedding_matrix[self.embedding_row(node_id)]
+
+    @staticmethod
+    def _count_sequences(types: np.ndarray, length: int, min_support: int,
+                         bigram_counts: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        if length == 2:
+            if bigram_counts is not None:
+                return bigram_keys(bigram_counts, min_support)
+            return frequent_bigrams(types, min_support)
+        return count_ngrams(types, length, min_support)
+
+    def analyze_token_history(self, types: np.ndarray,
+                              bigram_counts: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Counts frequent token-type sequences in a chronological int16 type array; returns (motif keys, support).
+
+        If the caller already maintains adjacent-pair counts for exactly these
+        tokens, pass them as bigram_counts and the length-2 scan is skipped.
+        """
+        min_support = max(1, int(len(types) * self.config.motif_min_support_percent))
+        max_length = min(self.config.motif_max_sequence_length, len(types), MAX_PACKED_SEQUENCE_LENGTH)
+        lengths = range(self.config.motif_min_sequence_length, max_length + 1)
+        if not lengths:
+            return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+        counted = list(self.mining_executor.map(lambda length: self._count_sequences(types, length, min_support, bigram_counts), lengths))
+        return np.concatenate([keys for keys, _ in counted]), np.concatenate([support for _, support in counted])
+
+    def archive_session(self, session_id: int, types: np.ndarray, type_names: List[str]):
+        """Persists one session's int16 type codes (and their names) for cross-session stability."""
+        archive_dir = self.config.session_archive_dir
+        if not archive_dir or not len(types):
+            return
+        os.makedirs(archive_dir, exist_ok=True)
+        base = os.path.join(archive_dir, f"session_{session_id}")
+        np.save(f"{base}.npy", types)
+        with open(f"{base}.types.json", "w") as f:
+            json.dump(list(type_names), f)
+
+    def _mine_archived_sessions(self):
+        """Counts motifs in any archive not seen yet, reading each through a read-only memory map."""
+        archive_dir = self.config.session_archive_dir
+        if not archive_dir:
+            return
+        # Sessions older than this window can no longer count towards stability
+        def session_number(path: str) -> int:
+            stem = os.path.basename(path)[len("session_"):-len(".npy")]
+            return int(stem) if stem.isdigit() else -1
+        window = 2 * self.config.min_sessions_to_stabilize
+        paths = sorted(glob(os.path.join(archive_dir, "session_*.npy")), key=session_number)[-window:]
+        for stale in set(self.archived_motif_keys) - set(paths):
+            del self.archived_motif_keys[stale]
+
+        for path in paths:
+            if path in self.archived_motif_keys:
+                continue
+            try:
+                types = np.load(path, mmap_mode='r')
+                with open(path[:-len(".npy")] + ".types.json") as f:
+                    type_names = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not load session archive {path}: {e}")
+                continue
+            self.archived_motif_keys[path] = (self.analyze_token_history(types)[0], type_names)
+
+    def _archived_keys_for(self, token_history: Any) -> List[np.ndarray]:
+        """Re-packs archived motif keys with the live TokenStore's type codes."""
+        remapped = []
+        for keys, type_names in self.archived_motif_keys.values():
+            local = np.empty(len(keys), dtype=np.uint64)
+            for i, key in enumerate(keys.tolist()):
+                codes = [token_history.intern_type(type_names[code]) for code in unpack_motif_key(key)]
+                local[i] = motif_key(np.array(codes, dtype=np.int16))
+            remapped.append(local)
+        return remapped
+
+    def _remember(self, cache: OrderedDict, key: Any, motif: BehavioralMotif):
+        """Insert into an LRU-ordered motif map, evicting the stalest entry past the cap."""
+        cache[key] = motif
+        cache.move_to_end(key)
+        if len(cache) > self.MOTIF_CACHE_LIMIT:
+            cache.popitem(last=False)
 
-    async def find_stable_motifs(self, graph: Any, current_session: int) -> List[BehavioralMotif]:
+    def _remember_discovery(self, key: int, motif: BehavioralMotif):
+        """Insert into the LFU-bounded discovered motif map."""
+        self.discovered_motifs[key] = motif
+        self._discovery_hits[key] = 1
+        if len(self.discovered_motifs) > self.MOTIF_CACHE_LIMIT:
+            # min() keeps the first (oldest) key among equal hit counts
+            victim = min(self._discovery_hits, key=self._discovery_hits.__getitem__)
+            del self.discovered_motifs[victim]
+            del self._discovery_hits[victim]
+
+    def _build_motif(self, motif_id: str, sequence: Tuple[str, ...], stability: float, current_session: int,
+                     canonical_pair: Optional[Tuple[str, str]] = None) -> BehavioralMotif:
+        template = self._motif_cache.get(motif_id)
+        if template is not None:
+            self._motif_cache.move_to_end(motif_id)
+        else:
+            aggression, defense = self.embedding_matrix.take([self.embedding_row(node) for node in sequence], axis=0).mean(axis=0)
+            template = BehavioralMotif(
+                id=motif_id,
+                sequence=sequence,
+                stability=0.0,
+                feature_vector={"aggression": float(aggression), "defense": float(defense)},
+                session_seen_in=0,
+                canonical_pair=canonical_pair
+            )
+            self._remember(self._motif_cache, motif_id, template)
+        return replace(template, stability=stability, session_seen_in=current_session,
+                       feature_vector=dict(template.feature_vector))
+
+    async def find_stable_motifs(self, graph: Any, current_session: int, token_history: Any = None) -> List[BehavioralMotif]:
         strongest_motif_edge = None
         max_weight = 0.0
 
-        if not hasattr(graph, 'graph'):
+        if not hasattr(graph, 'strongest_cooccurrence'):
             return []
 
         # Find the strongest CO-OCCURRENCE edge
-        for source, destinations in graph.graph.items():
-            for destination, data in destinations.items():
-                if data.get('cooccurrence_weight', 0) > max_weight:
-                    max_weight = data['cooccurrence_weight']
-                    strongest_motif_edge = (source, destination)
+        strongest = graph.strongest_cooccurrence()
+        if strongest is not None:
+            source, destination, max_weight = strongest
+            strongest_motif_edge = (source, destination)
         
         STABILITY_WEIGHT_THRESHOLD = 4.0 # Tuned for the simulation length
         
         if strongest_motif_edge and max_weight > STABILITY_WEIGHT_THRESHOLD:
-            motif_id = "<->".join(sorted(strongest_motif_edge))
+            # Co-occurrence edges are stored lower node first, so the edge is already canonical
+            canonical_pair = strongest_motif_edge if source < destination else (destination, source)
+            motif_id = f"{canonical_pair[0]}<->{canonical_pair[1]}"
             
             # Prevent finding the same motif over and over again
             if motif_id == self.last_found_motif_id:
                 return []
 
-            vec_a = self.get_embedding(strongest_motif_edge[0])
-            vec_b = self.get_embedding(strongest_motif_edge[1])
-            feature_vector = {"aggression": float(np.mean([vec_a[0], vec_b[0]])), "defense": float(np.mean([vec_a[1], vec_b[1]]))} 
-            
-            stable_motif = BehavioralMotif(
-                id=motif_id,
-                sequence=strongest_motif_edge, # Technically not a sequence, but a pair
-                stability=max_weight,
-                feature_vector=feature_vector,
-                session_seen_in=current_session
-            )
+            # Technically not a sequence, but a pair
+            stable_motif = self._build_motif(motif_id, strongest_motif_edge, max_weight, current_session, canonical_pair)
             self.last_found_motif_id = motif_id
             return [stable_motif]
+
+        # Optionally fall back to the most frequent token sequence in the columnar history
+        if self.config.mine_sequence_motifs and token_history is not None and len(token_history):
+            # Every sequence of length >= 2 is at most as frequent as its first
+            # bigram, so if even the top bigram misses support there is nothing to mine
+            min_support = max(1, int(len(token_history) * self.config.motif_min_support_percent))
+            if self.config.motif_min_sequence_length >= 2 and token_history.top_bigram()[1] < min_support:
+                return []
+
+            # EresionCore serializes crystallization cycles under one lock, so the
+            # scratch buffer is not overwritten while the miners read it
+            types = token_history.snapshot_since(reuse_buffer=True)
+            bigram_counts = token_history.bigram_counts.copy()
+            loop = asyncio.get_running_loop()
+            keys, support = await loop.run_in_executor(self.executor, self.analyze_token_history, types, bigram_counts)
+            await loop.run_in_executor(self.executor, self._mine_archived_sessions)
+            if keys.size:
+                # Prefer sequences that were already frequent in earlier sessions
+                self.session_motif_keys[current_session] = keys
+                self.session_motif_keys.pop(current_session - 2, None)
+                earlier_keys = self._archived_keys_for(token_history)
+                if not self.config.session_archive_dir and current_session - 1 in self.session_motif_keys:
+                    earlier_keys.append(self.session_motif_keys[current_session - 1])
+                sessions_seen = np.zeros(keys.size, dtype=np.int64)
+                for previous_keys in earlier_keys:
+                    sessions_seen += np.isin(keys, previous_keys, assume_unique=True)
+
+                best = np.lexsort((motif_lengths(keys), support, sessions_seen))[-1]
+                key = int(keys[best])
+                # Prevent finding the same motif over and over again
+                if key in self.discovered_motifs:
+                    self._discovery_hits[key] += 1
+                    return []
+                sequence = tuple(token_history.type_names[code] for code in unpack_motif_key(key))
+                motif_id = "<->".join(sequence)
+                stable_motif = self._build_motif(motif_id, sequence, int(support[best]) / len(types), current_session)
+                self._remember_discovery(key, stable_motif)
+                self.last_found_motif_id = motif_id
+                return [stable_motif]
             
         return []
 
 class SimplePrimitiveComposer(IPrimitiveComposer):
     def __init__(self):
         self.registry: List[AbilityPrimitive] = []
+        # Motif-independent part of each option: (id suffix, primitive, cooldown, cost)
+        self._variant_templates: List[Tuple[str, AbilityPrimitive, float, float]] = []
 
     def load_primitive_registry(self, registry: List[AbilityPrimitive]):
         self.registry = registry
+        # The registry is fixed from here on, so every distinct variant is baked once
+        self._variant_templates = [(f"_{variant+1}", prim, 5.0 + variant*3, 10.0 - variant*5)
+                                   for variant, prim in enumerate(registry)]
+
+    def prepare_composition_context(self, motif: BehavioralMotif) -> Dict[str, Any]:
+        """Per-motif work shared by every option composed from it."""
+        return {
+            "motif_id": motif.id,
+            "id_stem": f"ability_{motif.id.lower().replace('<->', '_').replace(':','')}",
+            "trigger": SequenceTrigger(motif.sequence, "CO_OCCURRENCE"),
+        }
+
+    @staticmethod
+    def _compose_from_template(context: Dict[str, Any], template: Tuple[str, AbilityPrimitive, float, float]) -> AssembledAbility:
+        suffix, prim, cooldown_s, resource_cost = template
+        return AssembledAbility(id=context['id_stem'] + suffix, name="", narrative="", source_motif_id=context["motif_id"],
+                                trigger=context["trigger"], primitives=[prim],
+                                cooldown_s=cooldown_s, resource_cost=resource_cost)
 
     def compose_ability_options(self, motif: BehavioralMotif, count: int) -> List[AssembledAbility]:
         if not self.registry:
             return []
-        options = []
-        for i in range(count):
-            prim = self.registry[i % len(self.registry)]
-            ability_id = f"ability_{motif.id.lower().replace('<->', '_').replace(':','')}_{i+1}"
-            options.append(AssembledAbility(id=ability_id, name="", narrative="", source_motif_id=motif.id,
-                                            trigger=TriggerCondition("CO_OCCURRENCE", motif.sequence),
-                                            primitives=[prim], cooldown_s=5.0 + i*3, resource_cost=10.0 - i*5))
-        return options
+        # Never offer two options built from the same primitive, so a registry
+        # smaller than count yields fewer options
+        context = self.prepare_composition_context(motif)
+        return [self._compose_from_template(context, template) for template in self._variant_templates[:max(0, count)]]
 
 class SimpleBalancer(IBalancer):
     def balance_ability(self, ability: AssembledAbility) -> Optional[AssembledAbility]:
@@ -125,19 +408,46 @@ class SimpleBalancer(IBalancer):
             return None
         return ability
 
+@lru_cache(maxsize=256)
+def _display_pair(pair: Tuple[str, str]) -> Tuple[str, str]:
+    """Display names for a canonical (lower, higher) node pair."""
+    return pair[0].replace("_", " ").title(), pair[1].replace("_", " ").title()
+
+@lru_cache(maxsize=256)
+def _parse_motif_id(motif_id: str) -> Tuple[str, str]:
+    """Display names of a motif's first two parts, in sorted order, for motifs without a canonical pair."""
+    motif_parts = sorted(motif_id.split("<->"))
+    return _display_pair((motif_parts[0], motif_parts[1]))
+
 class MockLLMConnector(ILLMConnector):
+    NARRATIVE_CACHE_LIMIT = 1024
+    # (name, description) templates, compiled once; keyed by whether the ability is the synergy option
+    _NARRATIVE_TEMPLATES = {
+        True: (Template("$part1 / $part2 Synergy"),
+               Template("A synergistic power born from the connection between $part1 and $part2.")),
+        False: (Template("Focused $part1"),
+                Template("An enhanced ability from your focus on $part1 in the context of $part2.")),
+    }
+
+    def __init__(self):
+        # Narratives depend only on the motif id and the template, so each pair is rendered once
+        self._narratives: "OrderedDict[Tuple[str, bool], Tuple[str, str]]" = OrderedDict()
+
     async def generate_narrative_for_ability(self, ability: AssembledAbility, motif: BehavioralMotif) -> Tuple[str, str]:
-        motif_parts = sorted(motif.id.split("<->"))
-        part1 = motif_parts[0].replace("_", " ").title()
-        part2 = motif_parts[1].replace("_", " ").title()
+        key = (motif.id, "_1" in ability.id)
+        narrative = self._narratives.get(key)
+        if narrative is not None:
+            return narrative
 
-        if "_1" in ability.id:
-            name = f"{part1} / {part2} Synergy"
-            desc = f"A synergistic power born from the connection between {part1} and {part2}."
-        else:
-            name = f"Focused {part1}"
-            desc = f"An enhanced ability from your focus on {part1} in the context of {part2}."
-        return name, desc
+        pair = motif.canonical_pair
+        part1, part2 = _display_pair(pair) if pair is not None else _parse_motif_id(motif.id)
+        parts = {"part1": part1, "part2": part2}
+        name_tpl, desc_tpl = self._NARRATIVE_TEMPLATES[key[1]]
+        narrative = (name_tpl.substitute(parts), desc_tpl.substitute(parts))
+        self._narratives[key] = narrative
+        if len(self._narratives) > self.NARRATIVE_CACHE_LIMIT:
+            self._narratives.popitem(last=False)
+        return narrative
 
 class SimpleManifestationDirector(IManifestationDirector):
     def generate_manifestation_directives(self, ability: AssembledAbility) -> List[Dict]:
@@ -0,0 +1,80 @@
+# eresion_core/test_kernels.py
+"""
+Checks that every build of the exported kernels computes the same results.
+
+kernels.py picks the ahead-of-time extension when it imports, then the numba
+JIT, then numpy. Each variant below reloads the module with the faster
+options hidden, so all of them can be compared in one process.
+"""
+
+# Add project root to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import importlib.util
+
+import numpy as np
+import pytest
+
+from eresion_core import kernels
+
+
+def _load_kernels(monkeypatch, name: str, hidden):
+    """A fresh copy of kernels.py, loaded while the modules in hidden cannot be imported."""
+    spec = importlib.util.spec_from_file_location(name, kernels.__file__)
+    module = importlib.util.module_from_spec(spec)
+    # Only hidden while loading: compiled kernels still import numba internals when called
+    with monkeypatch.context() as patch:
+        for hidden_module in hidden:
+            patch.setitem(sys.modules, hidden_module, None)
+            # "from package import name" finds an already imported submodule on the package first
+            package, _, attribute = hidden_module.rpartition(".")
+            if package:
+                patch.delattr(sys.modules[package], attribute, raising=False)
+        spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def variants(monkeypatch):
+    """(label, module) for the exported kernels and each fallback below them."""
+    jit_kernels = _load_kernels(monkeypatch, "_kernels_jit", ["eresion_core._kernels_aot"])
+    numpy_kernels = _load_kernels(monkeypatch, "_kernels_numpy", ["numba", "eresion_core._kernels_aot"])
+    assert not numpy_kernels.NUMBA_AVAILABLE and not numpy_kernels.AOT_AVAILABLE
+    return [("exported", kernels), ("jit", jit_kernels), ("numpy", numpy_kernels)]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_count_bigrams_variants_agree(variants, seed):
+    rng = np.random.default_rng(seed)
+    n_types = int(rng.integers(1, 40))
+    types = rng.integers(0, n_types, int(rng.integers(0, 500))).astype(np.int16)
+
+    results = [(label, module.count_bigrams(types, n_types)) for label, module in variants]
+    for label, counts in results[1:]:
+        np.testing.assert_array_equal(counts, results[0][1], err_msg=label)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_ingest_edge_pairs_variants_agree(variants, seed):
+    rng = np.random.default_rng(seed)
+    n_edges, n_pairs = int(rng.integers(1, 20)), int(rng.integers(0, 200))
+    pair_rows = rng.integers(0, n_edges, n_pairs)
+    amounts = rng.uniform(0.0, 0.3, n_pairs)
+    co_occurrence = rng.random(n_pairs) < 0.5
+    # Some edges have never been updated (0.0), the rest went idle at various times
+    last_update = np.where(rng.random(n_edges) < 0.3, 0.0, rng.uniform(900.0, 1000.0, n_edges))
+    weight = rng.uniform(0.0, 1.0, n_edges).astype(np.float32)
+
+    results = []
+    for label, module in variants:
+        columns = (weight.copy(), last_update.copy(), np.zeros(n_edges),
+                   np.zeros(n_edges, dtype=np.int64), np.zeros(n_edges, dtype=np.int64))
+        module.ingest_edge_pairs(pair_rows, amounts, co_occurrence, 1000.0, 0.001, *columns)
+        results.append((label, columns))
+    for label, columns in results[1:]:
+        expected = results[0][1]
+        np.testing.assert_allclose(columns[0], expected[0], rtol=1e-6, err_msg=label)
+        for column, expected_column in zip(columns[1:], expected[1:]):
+            np.testing.assert_allclose(column, expected_column, rtol=1e-12, err_msg=label)
@@ -0,0 +1,113 @@
+# eresion_core/test_mock_data_providers.py
+"""
+Checks the mock sensor providers: seeding, and batch updates against the scalar path.
+"""
+
+# Add project root to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from eresion_core import mock_data_providers
+from eresion_core.mock_data_providers import (
+    AGENT_BIOMETRIC_DTYPE, BiometricDataProvider, EnvironmentalDataProvider, _NoisePool
+)
+
+
+def _game_state(rng: random.Random, now: float):
+    """Random player, environment and biometric snapshot."""
+    return SimpleNamespace(
+        player=SimpleNamespace(in_combat=rng.random() < 0.5, health_percent=rng.random(),
+                               stamina_percent=rng.random(),
+                               location=rng.choice(["Town Square", "Deep Forest", "Crystal Cave", "Road"])),
+        environment=SimpleNamespace(weather=rng.choice(["Clear", "Rain", "Stormy", "Overcast"]),
+                                    time_of_day=rng.choice(["Morning", "Afternoon", "Night", "Midnight"])),
+        biometric=SimpleNamespace(heart_rate_bpm=rng.randint(50, 170), player_focus_level=rng.random(),
+                                  ambient_noise_db=rng.randint(20, 80), irl_timestamp=0.0),
+        temporal=SimpleNamespace(session_start_time=now - rng.uniform(0.0, 4 * 3600)),
+    )
+
+
+def _agents(game_state) -> np.ndarray:
+    """One AGENT_BIOMETRIC_DTYPE record mirroring game_state."""
+    agents = np.zeros(1, dtype=AGENT_BIOMETRIC_DTYPE)
+    agents['heart_rate_bpm'] = game_state.biometric.heart_rate_bpm
+    agents['player_focus_level'] = game_state.biometric.player_focus_level
+    agents['ambient_noise_db'] = game_state.biometric.ambient_noise_db
+    agents['health_percent'] = game_state.player.health_percent
+    agents['stamina_percent'] = game_state.player.stamina_percent
+    agents['in_combat'] = game_state.player.in_combat
+    return agents
+
+
+def test_noise_pool_scalar_and_array_share_one_stream():
+    """Array draws continue the scalar stream, across refills."""
+    scalar, array = _NoisePool(size=7, seed=3), _NoisePool(size=7, seed=3)
+
+    expected = [scalar.uniform(-2, 2) for _ in range(20)]
+    drawn = np.concatenate([array.uniform_array(-2, 2, 5), array.uniform_array(-2, 2, 15)])
+
+    assert drawn.tolist() == expected
+
+
+def test_unseeded_pool_follows_random_seed():
+    """Without an explicit seed, random.seed() makes the noise repeatable."""
+    random.seed(11)
+    first = [_NoisePool(size=8).uniform(0, 1) for _ in range(3)]
+    random.seed(11)
+    second = [_NoisePool(size=8).uniform(0, 1) for _ in range(3)]
+
+    assert first == second
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_biometric_batch_of_one_matches_scalar(seed):
+    """update_biometric_batch for one agent reproduces update_biometric_data."""
+    rng = random.Random(seed)
+    start = 1_000_000.0
+    scalar_provider, batch_provider = BiometricDataProvider(seed=seed), BiometricDataProvider(seed=seed)
+    scalar_provider.last_update = batch_provider.batch_last_update = start
+    game_state = _game_state(rng, start)
+    agents = _agents(game_state)
+
+    now = start
+    for _ in range(5):
+        now += rng.uniform(0.05, 2.0)
+        scalar_provider.update_biometric_data(game_state, now)
+        batch_provider.update_biometric_batch(agents, game_state.environment, [game_state.player.location],
+                                              game_state.temporal.session_start_time, now)
+
+        assert agents['heart_rate_bpm'][0] == game_state.biometric.heart_rate_bpm
+        assert agents['player_focus_level'][0] == game_state.biometric.player_focus_level
+        assert agents['ambient_noise_db'][0] == game_state.biometric.ambient_noise_db
+        assert game_state.biometric.irl_timestamp == now
+
+
+def test_seeded_environmental_readings_repeat():
+    """Two providers with the same seed report the same readings."""
+    game_state = _game_state(random.Random(0), 0.0)
+
+    first = EnvironmentalDataProvider(seed=5).update_environmental_data(game_state)
+    second = EnvironmentalDataProvider(seed=5).update_environmental_data(game_state)
+
+    assert first == second
+    assert 20 <= first["humidity_percent"] <= 90
+
+
+def test_update_mock_data_shares_the_tick_time():
+    """Every provider is stamped with the one tick time passed in."""
+    game_state = _game_state(random.Random(1), 0.0)
+    now = mock_data_providers._session_provider.session_start + 30.0
+
+    data = mock_data_providers.update_mock_data(game_state, "attack", now)
+
+    assert game_state.biometric.irl_timestamp == now
+    assert data["session"]["session_duration_s"] == pytest.approx(30.0)
+    assert data["session"]["time_since_last_action"] == 0.0
+    assert data["biometric"]["heart_rate_bpm"] == game_state.biometric.heart_rate_bpm
@@ -0,0 +1,44 @@
+# eresion_core/test_modules.py
+"""
+Checks the core pipeline modules: motif building and ability composition.
+"""
+
+# Add project root to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eresion_core.modules import SimpleDataAnalytics, SimplePrimitiveComposer
+from shared.interfaces import AbilityPrimitive, BehavioralMotif, DataAnalyticsConfig
+
+
+def test_rebuilt_motif_leaves_earlier_copies_alone():
+    """Rediscovering a motif id returns a new motif; ones already handed out keep their values."""
+    analytics = SimpleDataAnalytics(DataAnalyticsConfig())
+    sequence = ("action:Attack", "location:Deep Forest")
+
+    first = analytics._build_motif("a<->b", sequence, 4.5, 1, sequence)
+    first.feature_vector["aggression"] = -1.0
+    second = analytics._build_motif("a<->b", sequence, 7.0, 3, sequence)
+
+    assert second is not first
+    assert (first.stability, first.session_seen_in) == (4.5, 1)
+    assert (second.stability, second.session_seen_in) == (7.0, 3)
+    assert second.feature_vector["aggression"] != -1.0
+    assert (second.id, second.sequence, second.canonical_pair) == ("a<->b", sequence, sequence)
+
+
+def test_options_never_repeat_a_primitive():
+    """A registry smaller than count yields fewer options, each from its own primitive."""
+    composer = SimplePrimitiveComposer()
+    composer.load_primitive_registry([
+        AbilityPrimitive("swift_strike", "VERB", {"aggression": 0.8, "defense": 0.1}, 20.0),
+        AbilityPrimitive("defensive_stance", "ADJECTIVE", {"aggression": 0.1, "defense": 0.9}, 15.0),
+    ])
+    motif = BehavioralMotif("a<->b", ("a", "b"), 5.0, {}, 1)
+
+    options = composer.compose_ability_options(motif, 3)
+
+    assert [option.primitives[0].id for option in options] == ["swift_strike", "defensive_stance"]
+    assert len({option.id for option in options}) == 2
+    assert composer.compose_ability_options(motif, 1)[0].id == options[0].id
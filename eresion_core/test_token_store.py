@@ -0,0 +1,162 @@
+# eresion_core/test_token_store.py
+"""
+Checks the columnar token history: ring wraparound, snapshots, timestamps and
+the incrementally kept bigram counts.
+"""
+
+# Add project root to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from eresion_core.kernels import count_bigrams
+from eresion_core.token_store import TokenStore
+from shared.interfaces import Token
+
+EPOCH = 1_000_000.0
+
+
+def _store(capacity: int) -> TokenStore:
+    store = TokenStore(capacity=capacity)
+    store.rebase(EPOCH)
+    store.intern_types(["A", "B", "C", "D"])
+    return store
+
+
+def _push_all(store: TokenStore, count: int, start: int = 0):
+    """Push tokens start..start+count-1; token i has type i % 4 and timestamp EPOCH + i."""
+    for i in range(start, start + count):
+        store.push(i % 4, i, EPOCH + i, i / 100)
+
+
+def test_ring_keeps_the_newest_rows_in_order():
+    """Past capacity, the views hold the newest tokens, oldest first."""
+    store = _store(8)
+    _push_all(store, 13)
+
+    assert len(store) == 8
+    assert store.nodes_view().tolist() == list(range(5, 13))
+    assert store.types_view().tolist() == [i % 4 for i in range(5, 13)]
+    assert store.timestamps_view().tolist() == [EPOCH + i for i in range(5, 13)]
+
+
+def test_push_batch_matches_push():
+    """Batches, including ones that cross the wrap, store the same rows as single pushes."""
+    single, batched = _store(8), _store(8)
+    _push_all(single, 23)
+    for start, stop in ((0, 3), (3, 10), (10, 15), (15, 23)):
+        rows = np.arange(start, stop)
+        batched.push_batch((rows % 4).astype(np.int16), rows.astype(np.int32), EPOCH + rows, rows / 100)
+
+    assert (batched.head, batched.size) == (single.head, single.size)
+    assert batched.nodes_view().tolist() == single.nodes_view().tolist()
+    assert batched.timestamps_view().tolist() == single.timestamps_view().tolist()
+    np.testing.assert_array_equal(batched.intensity, single.intensity)
+
+
+def test_snapshot_since_across_the_wrap():
+    """snapshot_since finds its start on either side of the wrap point."""
+    store = _store(8)
+    _push_all(store, 13)  # Rows hold tokens 8..12 then 5..7; head is at token 5
+
+    assert store.snapshot_since().tolist() == [i % 4 for i in range(5, 13)]
+    assert store.snapshot_since(EPOCH + 6.5).tolist() == [i % 4 for i in range(7, 13)]
+    assert store.snapshot_since(EPOCH + 10).tolist() == [i % 4 for i in range(10, 13)]
+    assert store.snapshot_since(EPOCH + 20).tolist() == []
+
+
+def test_snapshot_reuse_buffer():
+    """Reusing snapshots share one scratch array; plain snapshots never alias it."""
+    store = _store(8)
+    _push_all(store, 11)
+
+    first = store.snapshot_since(EPOCH + 5, reuse_buffer=True)
+    assert first.tolist() == [i % 4 for i in range(5, 11)]
+    copy = store.snapshot_since(EPOCH + 5)
+    second = store.snapshot_since(EPOCH + 9, reuse_buffer=True)
+
+    assert second.tolist() == [1, 2]
+    assert np.shares_memory(first, second)
+    assert not np.shares_memory(copy, second)
+    assert copy.tolist() == [i % 4 for i in range(5, 11)]
+
+
+def test_out_of_order_timestamps_are_clamped():
+    """A token stamped before its predecessor is recorded at the predecessor's time."""
+    single, batched = _store(8), _store(8)
+    stamps = [EPOCH + t for t in (0.0, 5.0, 3.0, 6.0, 1.0, 7.0)]
+    for i, stamp in enumerate(stamps):
+        single.push(i % 4, i, stamp)
+    batched.push_batch(np.arange(2, dtype=np.int16), np.arange(2, dtype=np.int32), np.array(stamps[:2]),
+                       np.zeros(2))
+    batched.push_batch(np.arange(2, 6, dtype=np.int16) % 4, np.arange(2, 6, dtype=np.int32),
+                       np.array(stamps[2:]), np.zeros(4))
+
+    expected = [EPOCH + t for t in (0.0, 5.0, 5.0, 6.0, 6.0, 7.0)]
+    assert single.timestamps_view().tolist() == expected
+    assert batched.timestamps_view().tolist() == expected
+    assert single.snapshot_since(EPOCH + 5.5).tolist() == [3, 0, 1]
+
+
+def test_rebase_keeps_absolute_times():
+    """Moving the epoch changes the offsets but not the timestamps they stand for."""
+    store = _store(8)
+    _push_all(store, 5)
+    store.rebase(EPOCH + 3)
+
+    assert store.timestamps_view().tolist() == [EPOCH + i for i in range(5)]
+    assert store.snapshot_since(EPOCH + 3).tolist() == [3, 0]
+
+
+def test_token_at_and_append():
+    """token_at restores type, timestamp, node value and intensity of the index-th oldest row."""
+    store = _store(4)
+    for i in range(6):
+        store.append(Token("B" if i % 2 else "A", EPOCH + i, {"intensity": 0.5}), f"node:{i}")
+
+    token = store.token_at(0)
+    assert (token.type, token.timestamp_s, token.metadata) == ("A", EPOCH + 2, {"value": "2", "intensity": 0.5})
+    assert store.token_at(3).metadata["value"] == "5"
+    assert store.last_node_of_type("A") == "node:4"
+    for index in (-1, 4):
+        with pytest.raises(IndexError):
+            store.token_at(index)
+
+
+def _assert_bigrams_match_recount(store: TokenStore):
+    """Incremental bigram counts equal a fresh count, and top_bigram is their maximum."""
+    expected = count_bigrams(store.types_view(), len(store.bigram_counts))
+    np.testing.assert_array_equal(store.bigram_counts, expected)
+    pair, count = store.top_bigram()
+    assert count == expected.max()
+    if count:
+        assert expected[pair] == count
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_bigram_counts_match_recount(seed):
+    """Single and batched pushes past capacity keep bigram counts exact."""
+    rng = np.random.default_rng(seed)
+    capacity = int(rng.integers(2, 12))
+    single, batched = TokenStore(capacity=capacity), TokenStore(capacity=capacity)
+    n_types = int(rng.integers(1, 20))  # Past 16 the count matrix grows
+    single.intern_types([f"T{i}" for i in range(n_types)])
+    batched.intern_types([f"T{i}" for i in range(n_types)])
+
+    pushed = 0
+    for _ in range(12):
+        # Batch sizes from empty to more than the whole ring, so batches cross the wrap
+        n = int(rng.integers(0, 2 * capacity + 2))
+        types = rng.integers(0, n_types, n).astype(np.int16)
+        stamps = EPOCH + pushed + np.arange(n, dtype=np.float64)
+        for i in range(n):
+            single.push(int(types[i]), 0, float(stamps[i]))
+        batched.push_batch(types, np.zeros(n, dtype=np.int32), stamps, np.zeros(n))
+        pushed += n
+
+        _assert_bigrams_match_recount(single)
+        _assert_bigrams_match_recount(batched)
+        assert batched.types_view().tolist() == single.types_view().tolist()
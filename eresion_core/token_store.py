@@ -0,0 +1,268 @@
+# eresion_core/token_store.py
+"""
+Columnar token history for the Eresion headless core.
+
+The slow-thinking pipeline only needs a few scalar fields per token, so the
+history is kept as parallel numpy arrays (structure-of-arrays) instead of a
+deque of Token objects. Token types and graph node ids are interned to small
+integers so pattern mining can scan one contiguous int16 array.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import heapq
+import time
+import numpy as np
+from shared.interfaces import Token, TokenType
+
+
+class TokenStore:
+    """
+    Fixed-capacity ring buffer of token fields.
+
+    Token objects are only used at the API boundary; once appended, a token
+    lives on as one row across the column arrays below.
+    """
+
+    def __init__(self, capacity: int = 200000):
+        self.capacity = capacity
+        # Allocated once; rows past `size` are never read, so no zero-fill
+        self.type_id = np.empty(capacity, dtype=np.int16)
+        self.node_id = np.empty(capacity, dtype=np.int32)
+        # float32 seconds since epoch_s: 4 bytes per token. Spacing is ~1 ms at
+        # 2.3 h from the epoch and ~8 ms at a day, so rebase() moves the epoch
+        # to each session start, where session boundaries are compared.
+        # Offsets never decrease along the ring: a token stamped before its
+        # predecessor is recorded at the predecessor's time, so
+        # snapshot_since() can binary-search them
+        self.epoch_s = time.time()
+        self.elapsed_s = np.empty(capacity, dtype=np.float32)
+        self.intensity = np.empty(capacity, dtype=np.float32)
+        self._snapshot_scratch: Optional[np.ndarray] = None
+        self.head = 0  # Next write index
+        self.size = 0
+
+        # Interning tables (code -> name lists double as reverse lookups)
+        self._type_codes: Dict[TokenType, int] = {}
+        self.type_names: List[TokenType] = []
+        self._node_codes: Dict[str, int] = {}
+        self.node_names: List[str] = []
+
+        # Adjacent-pair counts over the tokens currently in the ring, kept
+        # up to date on every push so bigram mining never rescans history
+        self.bigram_counts = np.zeros((16, 16), dtype=np.int32)
+        # Max-heap of (-count, first, second) with lazy deletion: a pair's
+        # newest entry is exact when pushed and can only overstate it later
+        self._bigram_heap: List[Tuple[int, int, int]] = []
+
+    def __len__(self) -> int:
+        return self.size
+
+    def intern_type(self, token_type: TokenType) -> int:
+        """Return the int16 code for a token type, assigning one if needed."""
+        code = self._type_codes.get(token_type)
+        if code is None:
+            code = len(self.type_names)
+            if code > np.iinfo(np.int16).max:
+                raise OverflowError("TokenStore supports at most 32768 distinct token types")
+            self._type_codes[token_type] = code
+            self.type_names.append(token_type)
+            if code >= len(self.bigram_counts):
+                grown = np.zeros((2 * len(self.bigram_counts),) * 2, dtype=np.int32)
+                grown[:code, :code] = self.bigram_counts
+                self.bigram_counts = grown
+        return code
+
+    def intern_types(self, token_types: List[TokenType]) -> np.ndarray:
+        """Intern several token types at once, e.g. a tokenizer's vocabulary at startup."""
+        return np.array([self.intern_type(token_type) for token_type in token_types], dtype=np.int16)
+
+    def intern_node(self, node_id: str) -> int:
+        """Return the int32 code for a graph node id, assigning one if needed."""
+        code = self._node_codes.get(node_id)
+        if code is None:
+            code = len(self.node_names)
+            self._node_codes[node_id] = code
+            self.node_names.append(node_id)
+        return code
+
+    def push(self, type_code: int, node_code: int, timestamp_s: float, intensity: float = 0.0):
+        """Write already-interned fields into the next ring slot."""
+        head = self.head
+        if self.size == self.capacity:
+            # The oldest token (at head) and its successor stop being a pair
+            self.bigram_counts[self.type_id[head], self.type_id[head + 1 if head + 1 < self.capacity else 0]] -= 1
+        if self.size:
+            previous = int(self.type_id[head - 1])
+            self.bigram_counts[previous, type_code] += 1
+            heapq.heappush(self._bigram_heap, (-int(self.bigram_counts[previous, type_code]), previous, type_code))
+        elapsed = np.float32(timestamp_s - self.epoch_s)
+        if self.size and elapsed < self.elapsed_s[head - 1]:
+            elapsed = self.elapsed_s[head - 1]
+        self.type_id[head] = type_code
+        self.node_id[head] = node_code
+        self.elapsed_s[head] = elapsed
+        self.intensity[head] = intensity
+        self.head = head + 1 if head + 1 < self.capacity else 0
+        if self.size < self.capacity:
+            self.size += 1
+
+    def push_batch(self, type_codes: np.ndarray, node_codes: np.ndarray, timestamps_s: np.ndarray,
+                   intensities: np.ndarray):
+        """
+        Write a batch of already-interned rows; equivalent to push() per row.
+
+        Bigram counts for the whole batch are applied with two scatter-adds
+        instead of one matrix update per token.
+        """
+        n = len(type_codes)
+        if n > self.capacity:
+            # Only the newest `capacity` rows would survive; not worth a fast path
+            for row in range(n):
+                self.push(int(type_codes[row]), int(node_codes[row]), float(timestamps_s[row]), float(intensities[row]))
+            return
+        if n == 0:
+            return
+        type_codes = np.asarray(type_codes, dtype=np.int16)
+        size, capacity = self.size, self.capacity
+        oldest = (self.head - size) % capacity
+
+        # Chronological sequence = ring contents followed by the batch. The
+        # batch adds the pairs ending at each new row and evicts the pairs
+        # starting at each of the `evicted` oldest rows.
+        positions = np.arange(max(size - 1, 0), size + n)
+        evicted = max(0, size + n - capacity)
+        positions = np.concatenate((np.arange(evicted + 1), positions)) if evicted else positions
+        sequence = np.where(positions < size, self.type_id[(oldest + np.minimum(positions, size)) % capacity],
+                            type_codes[np.maximum(positions - size, 0)])
+        if evicted:
+            np.subtract.at(self.bigram_counts, (sequence[:evicted], sequence[1:evicted + 1]), 1)
+            sequence = sequence[evicted + 1:]
+        if len(sequence) > 1:
+            first, second = sequence[:-1], sequence[1:]
+            np.add.at(self.bigram_counts, (first, second), 1)
+            for a, b in set(zip(first.tolist(), second.tolist())):
+                heapq.heappush(self._bigram_heap, (-int(self.bigram_counts[a, b]), a, b))
+
+        elapsed = (np.asarray(timestamps_s, dtype=np.float64) - self.epoch_s).astype(np.float32)
+        if size:
+            # Clamp to the newest stored offset, as push() does
+            elapsed[0] = max(elapsed[0], self.elapsed_s[self.head - 1])
+        np.maximum.accumulate(elapsed, out=elapsed)
+
+        rows = (self.head + np.arange(n)) % capacity
+        self.type_id[rows] = type_codes
+        self.node_id[rows] = node_codes
+        self.elapsed_s[rows] = elapsed
+        self.intensity[rows] = intensities
+        self.head = (self.head + n) % capacity
+        self.size = min(size + n, capacity)
+
+    def rebase(self, epoch_s: float):
+        """Re-anchor the stored offsets at epoch_s, e.g. the start of a new session."""
+        elapsed = self.elapsed_s[:self.size]
+        elapsed[:] = elapsed.astype(np.float64) - (epoch_s - self.epoch_s)
+        self.epoch_s = epoch_s
+
+    def append(self, token: Token, node_id: str):
+        """Intern a token's type and node id, then push it."""
+        self.push(self.intern_type(token.type), self.intern_node(node_id), token.timestamp_s,
+                  token.metadata.get('intensity', 0.0))
+
+    def top_bigram(self) -> Tuple[Optional[Tuple[int, int]], int]:
+        """Most frequent adjacent (type code, type code) pair in the ring and its count."""
+        heap = self._bigram_heap
+        if len(heap) > 8 * max(1, np.count_nonzero(self.bigram_counts)):
+            # Too many stale entries: rebuild from the exact counts
+            first, second = np.nonzero(self.bigram_counts)
+            heap[:] = [(-int(self.bigram_counts[a, b]), int(a), int(b)) for a, b in zip(first, second)]
+            heapq.heapify(heap)
+        while heap:
+            count, first, second = heap[0]
+            current = int(self.bigram_counts[first, second])
+            if -count == current:
+                return (first, second), current
+            # Stale (overstated) entry: repair it in place and look again
+            heapq.heapreplace(heap, (-current, first, second))
+        return None, 0
+
+    def _chronological(self, column: np.ndarray) -> np.ndarray:
+        """Return a column oldest-first; a zero-copy slice until the ring wraps."""
+        if self.size < self.capacity:
+            return column[:self.size]
+        return np.concatenate((column[self.head:], column[:self.head]))
+
+    def types_view(self) -> np.ndarray:
+        """Chronological, contiguous int16 array of token type codes."""
+        return self._chronological(self.type_id)
+
+    def nodes_view(self) -> np.ndarray:
+        """Chronological, contiguous int32 array of node id codes."""
+        return self._chronological(self.node_id)
+
+    def timestamps_view(self) -> np.ndarray:
+        """Chronological float64 array of absolute token timestamps."""
+        return self._chronological(self.elapsed_s).astype(np.float64) + self.epoch_s
+
+    def snapshot_since(self, t0: float = 0.0, reuse_buffer: bool = False) -> np.ndarray:
+        """
+        Int16 copy of the type codes recorded at or after t0.
+
+        Unlike types_view(), the result never aliases the ring, so it can be
+        handed to a worker thread while new tokens keep arriving. At most one
+        copy is made, whether or not the ring has wrapped.
+
+        With reuse_buffer=True the copy is written into a scratch array owned
+        by the store instead of a fresh allocation. It stays valid only until
+        the next reusing snapshot, so use it for one consumer at a time.
+        """
+        if self.size < self.capacity:
+            segments = [(0, self.size)]
+        else:
+            segments = [(self.head, self.capacity), (0, self.head)]
+
+        # Timestamps are non-decreasing within the chronological order
+        parts = []
+        elapsed_t0 = np.float32(t0 - self.epoch_s)
+        for start, stop in segments:
+            first = start + int(np.searchsorted(self.elapsed_s[start:stop], elapsed_t0, side='left'))
+            if first < stop:
+                parts.append(self.type_id[first:stop])
+        if not parts:
+            return np.empty(0, dtype=np.int16)
+        if not reuse_buffer:
+            return np.concatenate(parts)
+
+        if self._snapshot_scratch is None:
+            self._snapshot_scratch = np.empty(self.capacity, dtype=np.int16)
+        count = sum(len(part) for part in parts)
+        return np.concatenate(parts, out=self._snapshot_scratch[:count])
+
+    def token_at(self, index: int) -> Token:
+        """
+        Materialise the index-th oldest row as a Token, for presentation code.
+
+        Only the fields the store keeps are restored: the node id's value part
+        and the intensity go back into metadata.
+        """
+        if not 0 <= index < self.size:
+            raise IndexError("TokenStore index out of range")
+        row = index if self.size < self.capacity else (self.head + index) % self.capacity
+        node = self.node_names[self.node_id[row]]
+        return Token(self.type_names[self.type_id[row]], self.epoch_s + float(self.elapsed_s[row]),
+                     {'value': node.split(':', 1)[-1], 'intensity': float(self.intensity[row])})
+
+    def last_node_of_type(self, token_type: TokenType) -> Optional[str]:
+        """Return the node id of the most recent token of the given type."""
+        code = self._type_codes.get(token_type)
+        if code is None or self.size == 0:
+            return None
+
+        # Search the newest segment first, then the wrapped-around remainder.
+        segments = [(0, self.head)]
+        if self.size == self.capacity:
+            segments.append((self.head, self.capacity))
+        for start, stop in segments:
+            hits = np.flatnonzero(self.type_id[start:stop] == code)
+            if hits.size:
+                return self.node_names[self.node_id[start + hits[-1]]]
+        return None
@@ -1,10 +1,56 @@
 # text_based_RPG/stream_processors/biometric_processor.py
 import time
-from typing import List, Any
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Any, Iterator, Optional, Sequence
 
+import numpy as np
+
+from eresion_core.kernels import (
+    AMBIENT_NOISE_THRESHOLDS, FOCUS_THRESHOLDS, HEART_RATE_THRESHOLDS, STRESS_THRESHOLDS,
+    biometric_reading, stress_levels
+)
 from shared.interfaces import IStreamProcessor, Token, TokenType
+from .token_meta import TokenMeta
 # FIXED: No longer imports concrete GameState
 
+# Category labels, lowest range first, indexed by the kernels' threshold tables
+HEART_RATE_LABELS = ("low", "normal", "elevated", "high", "very_high")
+AMBIENT_NOISE_LABELS = ("quiet", "moderate", "loud", "very_loud")
+FOCUS_LABELS = ("unfocused", "distracted", "focused", "highly_focused")
+STRESS_LABELS = ("calm", "moderate_stress", "high_stress", "extreme_stress")
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class BiometricMeta(TokenMeta):
+    """
+    Read-only token metadata for one biometric reading.
+    
+    Slotted fields instead of a fresh five-key dict per token; "context" is
+    only present when set.
+    """
+    sensor_type: str
+    value: float
+    category: str
+    unit: str
+    context: Optional[str] = None
+    
+    domain = "biometric"  # Shared by every reading, so not stored per token
+    
+    # Zero-argument super() does not work in slotted dataclasses
+    def __getitem__(self, key: str) -> Any:
+        if key == "context" and self.context is None:
+            raise KeyError(key)
+        return TokenMeta.__getitem__(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        for key in TokenMeta.__iter__(self):
+            if key != "context" or self.context is not None:
+                yield key
+    
+    def __len__(self) -> int:
+        return TokenMeta.__len__(self) - (self.context is None)
+
 class BiometricProcessor(IStreamProcessor):
     """
     Processes biometric and physiological data into tokens.
@@ -17,82 +63,103 @@ class BiometricProcessor(IStreamProcessor):
         """Return the domain name for tokens produced by this processor."""
         return "biometric"
         
-    def process(self, bridge_data: Any) -> List[Token]:
+    def process(self, bridge_data: Any, now: Optional[float] = None) -> List[Token]:
         """
         Convert biometric state into domain-specific tokens.
         
         Args:
-            game_state: Current game state to process
+            bridge_data: Biometric and player state from the game bridge
+            now: Tick time to stamp the tokens with; defaults to time.time()
             
         Returns:
             List of tokens representing biometric data
         """
-        tokens = []
-        current_time = time.time()
-        
-        # Heart rate token
-        hr_category = self._categorize_heart_rate(game_state.biometric.heart_rate_bpm)
-        tokens.append(Token(
-            type="BIOMETRIC",
-            timestamp_s=current_time,
-            metadata={
-                "domain": self.get_domain(),
-                "sensor_type": "heart_rate",
-                "value": game_state.biometric.heart_rate_bpm,
-                "category": hr_category,
-                "unit": "bpm"
-            }
-        ))
-        
-        # Ambient noise token  
-        noise_category = self._categorize_ambient_noise(game_state.biometric.ambient_noise_db)
-        tokens.append(Token(
-            type="ENVIRONMENTAL",
-            timestamp_s=current_time,
-            metadata={
-                "domain": self.get_domain(),
-                "sensor_type": "ambient_noise",
-                "value": game_state.biometric.ambient_noise_db,
-                "category": noise_category,
-                "unit": "dB"
-            }
-        ))
-        
-        # Focus level token
-        focus_category = self._categorize_focus_level(game_state.biometric.player_focus_level)
-        tokens.append(Token(
-            type="BIOMETRIC",
-            timestamp_s=current_time,
-            metadata={
-                "domain": self.get_domain(),
-                "sensor_type": "focus_level",
-                "value": game_state.biometric.player_focus_level,
-                "category": focus_category,
-                "unit": "normalized"
-            }
-        ))
+        current_time = time.time() if now is None else now
+        biometric = bridge_data.biometric
+        
+        # Stress and all four categories come from one compiled call
+        stress_level, hr_index, noise_index, focus_index, stress_index = biometric_reading(
+            biometric.heart_rate_bpm, biometric.ambient_noise_db,
+            biometric.player_focus_level, bridge_data.player.health_percent
+        )
+        
+        # (token type, metadata) per reading; every token shares the tick's timestamp
+        readings = [
+            ("BIOMETRIC", BiometricMeta("heart_rate", biometric.heart_rate_bpm, HEART_RATE_LABELS[hr_index], "bpm")),
+            ("ENVIRONMENTAL", BiometricMeta("ambient_noise", biometric.ambient_noise_db,
+                                            AMBIENT_NOISE_LABELS[noise_index], "dB")),
+            ("BIOMETRIC", BiometricMeta("focus_level", biometric.player_focus_level,
+                                        FOCUS_LABELS[focus_index], "normalized")),
+        ]
         
         # Physiological correlation token (derived insight)
-        if game_state.player.in_combat:
-            # Create a token that correlates biometric data with game state
-            stress_level = self._calculate_stress_level(
-                game_state.biometric.heart_rate_bpm,
-                game_state.biometric.player_focus_level,
-                game_state.player.health_percent
-            )
+        if bridge_data.player.in_combat:
+            # Correlates biometric data with game state
+            readings.append(("BIOMETRIC", BiometricMeta("stress_level", stress_level, STRESS_LABELS[stress_index],
+                                                        "normalized", "combat")))
+        
+        return [Token(token_type, current_time, metadata) for token_type, metadata in readings]
+        
+    def process_batch(self, bridge_batch: Sequence[Any], timestamps_s: Optional[Sequence[float]] = None) -> List[Token]:
+        """
+        Convert a batch of biometric states into tokens in one vectorized pass.
+        
+        Produces the same tokens, in the same per-tick order, as calling
+        process() on each state, but categorizes and derives stress for the
+        whole batch with array operations.
+        
+        Args:
+            bridge_batch: Sequence of states shaped like process() input
+            timestamps_s: Optional per-state timestamps; defaults to now for all
             
+        Returns:
+            List of tokens for every state in the batch
+        """
+        if not bridge_batch:
+            return []
+        if timestamps_s is None:
+            timestamps_s = [time.time()] * len(bridge_batch)
+        
+        heart_rates = [state.biometric.heart_rate_bpm for state in bridge_batch]
+        noise_levels = [state.biometric.ambient_noise_db for state in bridge_batch]
+        focus_levels = [state.biometric.player_focus_level for state in bridge_batch]
+        health = np.array([state.player.health_percent for state in bridge_batch], dtype=np.float64)
+        in_combat = [state.player.in_combat for state in bridge_batch]
+        
+        hr = np.array(heart_rates, dtype=np.float64)
+        focus = np.array(focus_levels, dtype=np.float64)
+        hr_categories = np.digitize(hr, HEART_RATE_THRESHOLDS).tolist()
+        noise_categories = np.digitize(np.array(noise_levels, dtype=np.float64), AMBIENT_NOISE_THRESHOLDS).tolist()
+        focus_categories = np.digitize(focus, FOCUS_THRESHOLDS).tolist()
+        
+        # Same weighting as _calculate_stress_level, for every state at once
+        stress = stress_levels(hr, focus, health)
+        stress_categories = np.digitize(stress, STRESS_THRESHOLDS).tolist()
+        stress = stress.tolist()
+        
+        tokens = []
+        for i, current_time in enumerate(timestamps_s):
+            tokens.append(Token(
+                type="BIOMETRIC",
+                timestamp_s=current_time,
+                metadata=BiometricMeta("heart_rate", heart_rates[i], HEART_RATE_LABELS[hr_categories[i]], "bpm")
+            ))
+            tokens.append(Token(
+                type="ENVIRONMENTAL",
+                timestamp_s=current_time,
+                metadata=BiometricMeta("ambient_noise", noise_levels[i], AMBIENT_NOISE_LABELS[noise_categories[i]], "dB")
+            ))
             tokens.append(Token(
                 type="BIOMETRIC",
                 timestamp_s=current_time,
-                metadata={
-                    "domain": self.get_domain(),
-                    "sensor_type": "stress_level",
-                    "value": stress_level,
-                    "category": self._categorize_stress_level(stress_level),
-                    "context": "combat",
-                    "unit": "normalized"
-                }
+                metadata=BiometricMeta("focus_level", focus_levels[i], FOCUS_LABELS[focus_categories[i]], "normalized")
             ))
+            if in_combat[i]:
+                tokens.append(Token(
+                    type="BIOMETRIC",
+                    timestamp_s=current_time,
+                    metadata=BiometricMeta("stress_level", stress[i], STRESS_LABELS[stress_categories[i]], "normalized", "combat")
+                ))
         
         return tokens
         
@@ -102,38 +169,15 @@ class BiometricProcessor(IStreamProcessor):
         
     def _categorize_heart_rate(self, bpm: int) -> str:
         """Categorize heart rate into descriptive ranges."""
-        if bpm < 60:
-            return "low"
-        elif bpm < 80:
-            return "normal"
-        elif bpm < 100:
-            return "elevated"
-        elif bpm < 120:
-            return "high"
-        else:
-            return "very_high"
+        return HEART_RATE_LABELS[bisect_right(HEART_RATE_THRESHOLDS, bpm)]
             
     def _categorize_ambient_noise(self, db: int) -> str:
         """Categorize ambient noise levels."""
-        if db < 30:
-            return "quiet"
-        elif db < 50:
-            return "moderate"
-        elif db < 70:
-            return "loud"
-        else:
-            return "very_loud"
+        return AMBIENT_NOISE_LABELS[bisect_right(AMBIENT_NOISE_THRESHOLDS, db)]
             
     def _categorize_focus_level(self, focus: float) -> str:
         """Categorize focus level into descriptive ranges."""
-        if focus >= 0.8:
-            return "highly_focused"
-        elif focus >= 0.6:
-            return "focused"
-        elif focus >= 0.4:
-            return "distracted"
-        else:
-            return "unfocused"
+        return FOCUS_LABELS[bisect_right(FOCUS_THRESHOLDS, focus)]
             
     def _calculate_stress_level(self, heart_rate: int, focus: float, health: float) -> float:
         """
@@ -157,11 +201,4 @@ class BiometricProcessor(IStreamProcessor):
         
     def _categorize_stress_level(self, stress: float) -> str:
         """Categorize calculated stress level."""
-        if stress < 0.3:
-            return "calm"
-        elif stress < 0.6:
-            return "moderate_stress"
-        elif stress < 0.8:
-            return "high_stress"
-        else:
-            return "extreme_stress"
\ No newline at end of file
+        return STRESS_LABELS[bisect_right(STRESS_THRESHOLDS, stress)]
@@ -1,10 +1,64 @@
 # text_based_RPG/stream_processors/environmental_processor.py
 import time
-from typing import List, Any
+from dataclasses import dataclass
+from typing import List, Any, Optional
 
 from shared.interfaces import IStreamProcessor, Token, TokenType
+from .keywords import KeywordClassifier
+from .token_meta import TokenMeta
 # FIXED: No longer imports concrete GameState
 
+WEATHER_INTENSITY = {
+    "Clear": "calm",
+    "Overcast": "moderate",
+    "Rain": "intense"
+}
+
+DAY_PHASES = {
+    "Morning": "dawn",
+    "Afternoon": "day",
+    "Evening": "dusk",
+    "Night": "night"
+}
+
+# Earlier categories win when a name matches several
+ENTITY_TYPES = KeywordClassifier([
+    ("hostile", ["goblin", "wolf", "orc"]),
+    ("friendly_npc", ["blacksmith", "guard", "merchant"]),
+    ("authority", ["guard"]),
+], default="neutral")
+
+ENTITY_THREAT_LEVELS = KeywordClassifier([
+    ("moderate", ["goblin"]),
+    ("high", ["wolf"]),
+    ("variable", ["guard"]),  # Depends on player actions
+], default="low")
+
+WORLD_EVENT_TYPES = KeywordClassifier([
+    ("weather_event", ["storm", "rain", "weather"]),
+    ("social_event", ["festival", "market", "celebration"]),
+    ("conflict_event", ["invasion", "attack", "raid"]),
+], default="misc_event")
+
+@dataclass(slots=True, frozen=True, eq=False)
+class EntityMeta(TokenMeta):
+    """Metadata of an ENTITY_PRESENCE token, one per nearby entity."""
+    entity_name: str
+    entity_type: str
+    threat_level: str
+    
+    domain = "environmental"
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class WorldEventMeta(TokenMeta):
+    """Metadata of a WORLD_EVENT token, one per active event."""
+    event_name: str
+    event_type: str
+    
+    domain = "environmental"
+
+
 class EnvironmentalProcessor(IStreamProcessor):
     """
     Processes environmental and world conditions into tokens.
@@ -22,90 +76,86 @@ class EnvironmentalProcessor(IStreamProcessor):
         Convert environmental state into domain-specific tokens.
         
         Args:
-            game_state: Current game state to process
+            bridge_data: Environment and player state from the game bridge
             
         Returns:
             List of tokens representing environmental conditions
         """
         tokens = []
+        append = tokens.append
         current_time = time.time()
+        domain = self.get_domain()
+        environment = bridge_data.environment
+        nearby_entities = environment.nearby_entities
+        
+        # Each entity is classified once per tick; hostility is read off these
+        entity_types = [self._classify_entity(entity) for entity in nearby_entities]
+        hostile_count = entity_types.count("hostile")
         
         # Weather token
-        tokens.append(Token(
+        append(Token(
             type="ENVIRONMENTAL",
             timestamp_s=current_time,
             metadata={
-                "domain": self.get_domain(),
+                "domain": domain,
                 "condition_type": "weather",
-                "value": game_state.environment.weather,
-                "intensity": self._get_weather_intensity(game_state.environment.weather)
+                "value": environment.weather,
+                "intensity": self._get_weather_intensity(environment.weather)
             }
         ))
         
         # Time of day token
-        tokens.append(Token(
+        append(Token(
             type="TIME_OF_DAY",
             timestamp_s=current_time,
             metadata={
-                "domain": self.get_domain(),
-                "time_period": game_state.environment.time_of_day,
-                "phase": self._get_day_phase(game_state.environment.time_of_day)
+                "domain": domain,
+                "time_period": environment.time_of_day,
+                "phase": self._get_day_phase(environment.time_of_day)
             }
         ))
         
         # Location context token
         location_context = self._analyze_location_context(
-            game_state.player.location,
-            game_state.environment.nearby_entities
+            bridge_data.player.location,
+            nearby_entities,
+            hostile_count
         )
         
-        tokens.append(Token(
+        append(Token(
             type="LOCATION",
             timestamp_s=current_time,
             metadata={
-                "domain": self.get_domain(),
-                "location": game_state.player.location,
+                "domain": domain,
+                "location": bridge_data.player.location,
                 "context": location_context["context"],
                 "danger_level": location_context["danger_level"],
-                "entity_count": len(game_state.environment.nearby_entities)
+                "entity_count": len(nearby_entities)
             }
         ))
         
         # Entity presence tokens
-        for entity in game_state.environment.nearby_entities:
-            entity_type = self._classify_entity(entity)
-            tokens.append(Token(
-                type="ENTITY_PRESENCE",
-                timestamp_s=current_time,
-                metadata={
-                    "domain": self.get_domain(),
-                    "entity_name": entity,
-                    "entity_type": entity_type,
-                    "threat_level": self._get_entity_threat_level(entity)
-                }
-            ))
+        tokens.extend([
+            Token("ENTITY_PRESENCE", current_time,
+                  EntityMeta(entity, entity_type, self._get_entity_threat_level(entity)))
+            for entity, entity_type in zip(nearby_entities, entity_types)
+        ])
         
         # World events tokens
-        for event in game_state.environment.active_world_events:
-            tokens.append(Token(
-                type="WORLD_EVENT",
-                timestamp_s=current_time,
-                metadata={
-                    "domain": self.get_domain(),
-                    "event_name": event,
-                    "event_type": self._classify_world_event(event)
-                }
-            ))
+        tokens.extend([
+            Token("WORLD_EVENT", current_time, WorldEventMeta(event, self._classify_world_event(event)))
+            for event in environment.active_world_events
+        ])
         
         # Environmental combination token (emergent pattern)
-        if self._is_hostile_environment(game_state.environment):
-            tokens.append(Token(
+        if self._is_hostile_environment(environment, hostile_count):
+            append(Token(
                 type="ENVIRONMENTAL",
                 timestamp_s=current_time,
                 metadata={
-                    "domain": self.get_domain(),
+                    "domain": domain,
                     "condition_type": "hostile_environment",
-                    "factors": self._get_hostility_factors(game_state.environment)
+                    "factors": self._get_hostility_factors(environment, hostile_count)
                 }
             ))
         
@@ -117,35 +167,31 @@ class EnvironmentalProcessor(IStreamProcessor):
         
     def _get_weather_intensity(self, weather: str) -> str:
         """Map weather conditions to intensity levels."""
-        weather_map = {
-            "Clear": "calm",
-            "Overcast": "moderate",
-            "Rain": "intense"
-        }
-        return weather_map.get(weather, "unknown")
+        return WEATHER_INTENSITY.get(weather, "unknown")
         
     def _get_day_phase(self, time_of_day: str) -> str:
         """Map time of day to broader phases."""
-        phase_map = {
-            "Morning": "dawn",
-            "Afternoon": "day",
-            "Evening": "dusk", 
-            "Night": "night"
-        }
-        return phase_map.get(time_of_day, "unknown")
+        return DAY_PHASES.get(time_of_day, "unknown")
+        
+    def _analyze_location_context(self, location: str, nearby_entities: List[str],
+                                  hostile_count: Optional[int] = None) -> dict:
+        """
+        Analyze the current location context and safety level.
+        
+        hostile_count is the number of hostile nearby entities, when the
+        caller has already classified them.
+        """
+        if hostile_count is None:
+            hostile_count = self._count_hostile_entities(nearby_entities)
         
-    def _analyze_location_context(self, location: str, nearby_entities: List[str]) -> dict:
-        """Analyze the current location context and safety level."""
         if location == "Town Square":
             context = "civilized"
             # Determine danger based on entities present
-            hostile_entities = [e for e in nearby_entities if self._is_hostile_entity(e)]
-            danger_level = "low" if not hostile_entities else "moderate"
+            danger_level = "low" if not hostile_count else "moderate"
         elif location == "Deep Forest":
             context = "wilderness"
             # Forest is inherently more dangerous
-            hostile_entities = [e for e in nearby_entities if self._is_hostile_entity(e)]
-            danger_level = "high" if hostile_entities else "moderate"
+            danger_level = "high" if hostile_count else "moderate"
         else:
             context = "unknown"
             danger_level = "moderate"
@@ -157,63 +203,44 @@ class EnvironmentalProcessor(IStreamProcessor):
         
     def _classify_entity(self, entity_name: str) -> str:
         """Classify entity types for better token metadata."""
-        entity_name_lower = entity_name.lower()
-        
-        if any(word in entity_name_lower for word in ["goblin", "wolf", "orc"]):
-            return "hostile"
-        elif any(word in entity_name_lower for word in ["blacksmith", "guard", "merchant"]):
-            return "friendly_npc"
-        elif any(word in entity_name_lower for word in ["guard"]):
-            return "authority"
-        else:
-            return "neutral"
+        return ENTITY_TYPES(entity_name)
             
     def _get_entity_threat_level(self, entity_name: str) -> str:
         """Assess threat level of specific entities."""
-        entity_lower = entity_name.lower()
-        
-        if "goblin" in entity_lower:
-            return "moderate"
-        elif "wolf" in entity_lower:
-            return "high" 
-        elif "guard" in entity_lower:
-            return "variable"  # Depends on player actions
-        else:
-            return "low"
+        return ENTITY_THREAT_LEVELS(entity_name)
             
     def _classify_world_event(self, event_name: str) -> str:
         """Classify types of world events."""
-        event_lower = event_name.lower()
-        
-        if any(word in event_lower for word in ["storm", "rain", "weather"]):
-            return "weather_event"
-        elif any(word in event_lower for word in ["festival", "market", "celebration"]):
-            return "social_event"
-        elif any(word in event_lower for word in ["invasion", "attack", "raid"]):
-            return "conflict_event"
-        else:
-            return "misc_event"
+        return WORLD_EVENT_TYPES(event_name)
             
     def _is_hostile_entity(self, entity_name: str) -> bool:
         """Check if an entity is considered hostile."""
-        return self._classify_entity(entity_name) == "hostile"
+        # Cached by ENTITY_TYPES, so repeat entities cost a dict lookup
+        return ENTITY_TYPES(entity_name) == "hostile"
+        
+    def _count_hostile_entities(self, nearby_entities: List[str]) -> int:
+        """Number of hostile entities among those nearby."""
+        return sum(1 for e in nearby_entities if self._is_hostile_entity(e))
         
-    def _is_hostile_environment(self, env_state) -> bool:
+    def _is_hostile_environment(self, env_state, hostile_count: Optional[int] = None) -> bool:
         """Determine if the current environment is hostile."""
+        if hostile_count is None:
+            hostile_count = self._count_hostile_entities(env_state.nearby_entities)
+        
         # Hostile if bad weather + hostile entities + dangerous location
-        hostile_entities = any(self._is_hostile_entity(e) for e in env_state.nearby_entities)
         bad_weather = env_state.weather == "Rain"
         
-        return hostile_entities and (bad_weather or len(env_state.nearby_entities) > 2)
+        return hostile_count > 0 and (bad_weather or len(env_state.nearby_entities) > 2)
         
-    def _get_hostility_factors(self, env_state) -> List[str]:
+    def _get_hostility_factors(self, env_state, hostile_count: Optional[int] = None) -> List[str]:
         """List the factors contributing to environmental hostility."""
+        if hostile_count is None:
+            hostile_count = self._count_hostile_entities(env_state.nearby_entities)
         factors = []
         
         if env_state.weather == "Rain":
             factors.append("harsh_weather")
             
-        hostile_count = sum(1 for e in env_state.nearby_entities if self._is_hostile_entity(e))
         if hostile_count > 0:
             factors.append(f"hostile_entities_{hostile_count}")
             
@@ -0,0 +1,54 @@
+# eresion_core/tokenization/processors/keywords.py
+"""
+Keyword classifiers shared by the stream processors.
+
+Each classifier compiles all of its keywords into one regex, so labelling a
+name is a single native scan instead of an `any(word in s ...)` loop per
+category. Results are memoized per name, since the same handful of entity,
+event and quest names come back every tick.
+"""
+
+import re
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+
+class KeywordClassifier:
+    """
+    Map a name to the first category whose keywords it contains.
+
+    Categories are tried in the order given, exactly like an if/elif ladder of
+    substring tests: when a name contains keywords of several categories the
+    earliest category wins, wherever the keywords sit in the name.
+    """
+
+    def __init__(self, categories: Sequence[Tuple[str, Sequence[str]]], default: str):
+        self.default = default
+        self._labels = []
+        self._rank = {}
+        for label, words in categories:
+            self._labels.append(label)
+            for word in words:
+                # A keyword repeated in a later category can never reach it
+                self._rank.setdefault(word, len(self._labels) - 1)
+        # Zero-width lookahead so overlapping keywords are all seen; alternatives
+        # are ordered by rank so the best keyword wins at a shared position
+        alternatives = sorted(self._rank, key=self._rank.__getitem__)
+        self._pattern = re.compile(
+            "(?=(" + "|".join(re.escape(word) for word in alternatives) + "))"
+        )
+        self._classify = lru_cache(maxsize=256)(self._scan)
+
+    def __call__(self, name: str) -> str:
+        return self._classify(name)
+
+    def _scan(self, name: str) -> str:
+        rank = self._rank
+        best = len(self._labels)
+        for match in self._pattern.finditer(name.lower()):
+            found = rank[match.group(1)]
+            if found < best:
+                best = found
+                if best == 0:
+                    break
+        return self._labels[best] if best < len(self._labels) else self.default
@@ -1,8 +1,50 @@
 # eresion_core/tokenization/processors/player_processor.py
 import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import List, Any, Any
 
 from shared.interfaces import IStreamProcessor, Token, TokenType
+from .token_meta import TokenMeta
+
+# Lower bound of each category above the first; labels run lowest range first
+HEALTH_THRESHOLDS = (0.2, 0.5, 0.8)
+HEALTH_LABELS = ("critical", "badly_hurt", "injured", "healthy")
+STAMINA_THRESHOLDS = (0.2, 0.4, 0.7)
+STAMINA_LABELS = ("depleted", "exhausted", "tired", "fresh")
+
+# Bridge fields read every tick, with the value used when a bridge lacks one
+PLAYER_FIELDS = (
+    ('location', 'unknown'),
+    ('previous_location', None),
+    ('health_percent', 1.0),
+    ('stamina_percent', 1.0),
+    ('in_combat', False),
+    ('action_modifier', None),
+    ('abilities', {}),
+)
+_get_player_fields = attrgetter(*(name for name, _ in PLAYER_FIELDS))
+
+@dataclass(slots=True, frozen=True, eq=False)
+class PlayerStateMeta(TokenMeta):
+    """Metadata of a PLAYER_STATE token (health or stamina)."""
+    state_type: str
+    value: float
+    category: str
+    
+    domain = "player"
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class AbilityMeta(TokenMeta):
+    """Metadata of an ABILITY_AVAILABLE token, one per unlocked ability."""
+    ability_id: Any
+    ability_name: str
+    source_motif: Any
+    
+    domain = "player"
+
 
 class PlayerProcessor(IStreamProcessor):
     """
@@ -31,14 +73,14 @@ class PlayerProcessor(IStreamProcessor):
         tokens = []
         current_time = time.time()
         
-        # Extract player data from bridge (generic approach)
-        location = getattr(bridge_data, 'location', 'unknown')
-        previous_location = getattr(bridge_data, 'previous_location', None)
-        health_percent = getattr(bridge_data, 'health_percent', 1.0)
-        stamina_percent = getattr(bridge_data, 'stamina_percent', 1.0)
-        in_combat = getattr(bridge_data, 'in_combat', False)
-        action_modifier = getattr(bridge_data, 'action_modifier', None)
-        abilities = getattr(bridge_data, 'abilities', {})
+        # Extract player data from bridge (generic approach): one C-level
+        # fetch for a complete bridge, per-field defaults for a partial one
+        try:
+            fields = _get_player_fields(bridge_data)
+        except AttributeError:
+            fields = tuple(getattr(bridge_data, name, default) for name, default in PLAYER_FIELDS)
+        (location, previous_location, health_percent, stamina_percent,
+         in_combat, action_modifier, abilities) = fields
         
         # Location token
         tokens.append(Token(
@@ -52,29 +94,15 @@ class PlayerProcessor(IStreamProcessor):
         ))
         
         # Health state token
-        health_category = self._categorize_health(health_percent)
         tokens.append(Token(
-            type="PLAYER_STATE",
-            timestamp_s=current_time,
-            metadata={
-                "domain": self.get_domain(),
-                "state_type": "health",
-                "value": health_percent,
-                "category": health_category
-            }
+            "PLAYER_STATE", current_time,
+            PlayerStateMeta("health", health_percent, self._categorize_health(health_percent))
         ))
         
         # Stamina state token
-        stamina_category = self._categorize_stamina(stamina_percent)
         tokens.append(Token(
-            type="PLAYER_STATE",
-            timestamp_s=current_time,
-            metadata={
-                "domain": self.get_domain(),
-                "state_type": "stamina", 
-                "value": stamina_percent,
-                "category": stamina_category
-            }
+            "PLAYER_STATE", current_time,
+            PlayerStateMeta("stamina", stamina_percent, self._categorize_stamina(stamina_percent))
         ))
         
         # Combat state token
@@ -102,17 +130,11 @@ class PlayerProcessor(IStreamProcessor):
             ))
             
         # Ability state tokens
-        for ability_id, ability in abilities.items():
-            tokens.append(Token(
-                type="ABILITY_AVAILABLE",
-                timestamp_s=current_time,
-                metadata={
-                    "domain": self.get_domain(),
-                    "ability_id": ability_id,
-                    "ability_name": getattr(ability, 'name', ability_id),
-                    "source_motif": getattr(ability, 'source_motif_id', None)
-                }
-            ))
+        tokens.extend([
+            Token("ABILITY_AVAILABLE", current_time,
+                  AbilityMeta(ability_id, getattr(ability, 'name', ability_id), getattr(ability, 'source_motif_id', None)))
+            for ability_id, ability in abilities.items()
+        ])
         
         return tokens
         
@@ -122,22 +144,8 @@ class PlayerProcessor(IStreamProcessor):
         
     def _categorize_health(self, health_percent: float) -> str:
         """Categorize health percentage into descriptive ranges."""
-        if health_percent >= 0.8:
-            return "healthy"
-        elif health_percent >= 0.5:
-            return "injured"
-        elif health_percent >= 0.2:
-            return "badly_hurt"
-        else:
-            return "critical"
+        return HEALTH_LABELS[bisect_right(HEALTH_THRESHOLDS, health_percent)]
             
     def _categorize_stamina(self, stamina_percent: float) -> str:
         """Categorize stamina percentage into descriptive ranges."""
-        if stamina_percent >= 0.7:
-            return "fresh"
-        elif stamina_percent >= 0.4:
-            return "tired"
-        elif stamina_percent >= 0.2:
-            return "exhausted"
-        else:
-            return "depleted"
\ No newline at end of file
+        return STAMINA_LABELS[bisect_right(STAMINA_THRESHOLDS, stamina_percent)]
\ No newline at end of file
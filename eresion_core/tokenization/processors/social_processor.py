@@ -1,10 +1,54 @@
 # eresion_core/tokenization/processors/social_processor.py
 import time
-from typing import List, Any, Any
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Any, Optional
 
+import numpy as np
+
+from eresion_core.kernels import social_pressure
 from shared.interfaces import IStreamProcessor, Token, TokenType
+from .keywords import KeywordClassifier
+from .token_meta import TokenMeta
 # FIXED: No longer imports concrete GameState
 
+# Lower bound of each category above the first; labels run lowest range first
+RECENCY_THRESHOLDS = (60.0, 180.0)
+RECENCY_LABELS = ("immediate", "recent", "past")
+RELATIONSHIP_THRESHOLDS = (-0.7, -0.3, 0.3, 0.7)
+RELATIONSHIP_LABELS = ("hostile", "unfriendly", "neutral", "friendly", "trusted_ally")
+PRESSURE_THRESHOLDS = (0.3, 0.6, 0.8)
+PRESSURE_LABELS = ("low_pressure", "moderate_pressure", "high_pressure", "extreme_pressure")
+
+# Earlier categories win when a quest name matches several
+QUEST_TYPES = KeywordClassifier([
+    ("combat_quest", ["kill", "defeat", "slay"]),
+    ("delivery_quest", ["deliver", "bring", "take"]),
+    ("exploration_quest", ["find", "locate", "search"]),
+    ("social_quest", ["talk", "speak", "convince"]),
+], default="misc_quest")
+
+@dataclass(slots=True, frozen=True, eq=False)
+class RelationshipMeta(TokenMeta):
+    """Metadata of a RELATIONSHIP_STATUS token, one per known entity."""
+    entity: str
+    score: float
+    category: str
+    trend: str
+    
+    domain = "social"
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class QuestMeta(TokenMeta):
+    """Metadata of a QUEST_STATUS token, one per active quest."""
+    quest_name: str
+    status: str
+    quest_type: str
+    
+    domain = "social"
+
+
 class SocialProcessor(IStreamProcessor):
     """
     Processes social interactions and relationship dynamics into tokens.
@@ -22,7 +66,7 @@ class SocialProcessor(IStreamProcessor):
         Convert social state into domain-specific tokens.
         
         Args:
-            game_state: Current game state to process
+            bridge_data: Social state from the game bridge
             
         Returns:
             List of tokens representing social interactions and relationships
@@ -31,7 +75,7 @@ class SocialProcessor(IStreamProcessor):
         current_time = time.time()
         
         # Recent conversation tokens
-        for conversation in game_state.social.recent_conversations[-3:]:  # Last 3 conversations
+        for conversation in bridge_data.social.recent_conversations[-3:]:  # Last 3 conversations
             time_since = current_time - conversation.get("timestamp", current_time)
             if time_since < 300:  # Only recent conversations (5 minutes)
                 tokens.append(Token(
@@ -46,36 +90,25 @@ class SocialProcessor(IStreamProcessor):
                     }
                 ))
         
-        # Relationship status tokens
-        for entity, score in game_state.social.relationship_scores.items():
-            relationship_category = self._categorize_relationship(score)
-            tokens.append(Token(
-                type="RELATIONSHIP_STATUS",
-                timestamp_s=current_time,
-                metadata={
-                    "domain": self.get_domain(),
-                    "entity": entity,
-                    "score": score,
-                    "category": relationship_category,
-                    "trend": self._get_relationship_trend(entity, score)
-                }
-            ))
+        # Relationship status tokens, every score categorized in one search
+        relationship_scores = bridge_data.social.relationship_scores
+        scores = self._relationship_score_array(relationship_scores)
+        relationship_levels = np.searchsorted(RELATIONSHIP_THRESHOLDS, scores, side="right")
+        tokens.extend([
+            Token("RELATIONSHIP_STATUS", current_time,
+                  RelationshipMeta(entity, score, RELATIONSHIP_LABELS[level],
+                                   self._get_relationship_trend(entity, score)))
+            for (entity, score), level in zip(relationship_scores.items(), relationship_levels)
+        ])
         
         # Quest status tokens
-        for quest in game_state.social.active_quests:
-            tokens.append(Token(
-                type="QUEST_STATUS",
-                timestamp_s=current_time,
-                metadata={
-                    "domain": self.get_domain(),
-                    "quest_name": quest,
-                    "status": "active",
-                    "quest_type": self._classify_quest_type(quest)
-                }
-            ))
+        tokens.extend([
+            Token("QUEST_STATUS", current_time, QuestMeta(quest, "active", self._classify_quest_type(quest)))
+            for quest in bridge_data.social.active_quests
+        ])
         
         # Social context token (derived insight)
-        social_context = self._analyze_social_context(game_state)
+        social_context = self._analyze_social_context(bridge_data, scores, current_time)
         if social_context:
             tokens.append(Token(
                 type="SOCIAL_CONTEXT",
@@ -89,7 +122,7 @@ class SocialProcessor(IStreamProcessor):
             ))
         
         # Social pressure token (if applicable)
-        pressure_level = self._calculate_social_pressure(game_state)
+        pressure_level = self._calculate_social_pressure(bridge_data, scores)
         if pressure_level > 0.3:  # Only emit if significant
             tokens.append(Token(
                 type="SOCIAL_STATE",
@@ -110,25 +143,11 @@ class SocialProcessor(IStreamProcessor):
         
     def _categorize_recency(self, time_since_seconds: float) -> str:
         """Categorize how recent a conversation was."""
-        if time_since_seconds < 60:
-            return "immediate"
-        elif time_since_seconds < 180:
-            return "recent"
-        else:
-            return "past"
+        return RECENCY_LABELS[bisect_right(RECENCY_THRESHOLDS, time_since_seconds)]
             
     def _categorize_relationship(self, score: float) -> str:
         """Categorize relationship scores into descriptive ranges."""
-        if score >= 0.7:
-            return "trusted_ally"
-        elif score >= 0.3:
-            return "friendly"
-        elif score >= -0.3:
-            return "neutral"
-        elif score >= -0.7:
-            return "unfriendly"
-        else:
-            return "hostile"
+        return RELATIONSHIP_LABELS[bisect_right(RELATIONSHIP_THRESHOLDS, score)]
             
     def _get_relationship_trend(self, entity: str, current_score: float) -> str:
         """
@@ -147,34 +166,34 @@ class SocialProcessor(IStreamProcessor):
             
     def _classify_quest_type(self, quest_name: str) -> str:
         """Classify quest types for better metadata."""
-        quest_lower = quest_name.lower()
-        
-        if any(word in quest_lower for word in ["kill", "defeat", "slay"]):
-            return "combat_quest"
-        elif any(word in quest_lower for word in ["deliver", "bring", "take"]):
-            return "delivery_quest"
-        elif any(word in quest_lower for word in ["find", "locate", "search"]):
-            return "exploration_quest"
-        elif any(word in quest_lower for word in ["talk", "speak", "convince"]):
-            return "social_quest"
-        else:
-            return "misc_quest"
+        return QUEST_TYPES(quest_name)
             
-    def _analyze_social_context(self, game_state: GameState) -> dict:
+    def _relationship_score_array(self, relationship_scores: dict) -> np.ndarray:
+        """Stage relationship scores into a float array, in dict order."""
+        return np.fromiter(relationship_scores.values(), dtype=np.float64, count=len(relationship_scores))
+        
+    def _analyze_social_context(self, bridge_data: Any, scores: Optional[np.ndarray] = None,
+                                now: Optional[float] = None) -> dict:
         """
         Analyze the overall social context and dynamics.
         
         Returns emergent social patterns based on multiple factors.
+        scores is the relationship score array already staged by process().
         """
+        if scores is None:
+            scores = self._relationship_score_array(bridge_data.social.relationship_scores)
+        if now is None:
+            now = time.time()
+        
         # Count relationship types
-        positive_relationships = sum(1 for score in game_state.social.relationship_scores.values() if score > 0.3)
-        negative_relationships = sum(1 for score in game_state.social.relationship_scores.values() if score < -0.3)
+        positive_relationships = int(np.count_nonzero(scores > 0.3))
+        negative_relationships = int(np.count_nonzero(scores < -0.3))
         
         # Recent social activity
-        recent_conversations = len([
-            conv for conv in game_state.social.recent_conversations
-            if time.time() - conv.get("timestamp", 0) < 600  # Last 10 minutes
-        ])
+        recent_conversations = sum(
+            1 for conv in bridge_data.social.recent_conversations
+            if now - conv.get("timestamp", 0) < 600  # Last 10 minutes
+        )
         
         # Determine context
         if positive_relationships >= 2 and negative_relationships == 0:
@@ -195,7 +214,7 @@ class SocialProcessor(IStreamProcessor):
                 "description": "High recent social interaction",
                 "factors": ["frequent_conversations"]
             }
-        elif len(game_state.social.relationship_scores) == 0:
+        elif len(scores) == 0:
             return {
                 "type": "socially_unknown",
                 "description": "No established relationships",
@@ -204,38 +223,24 @@ class SocialProcessor(IStreamProcessor):
             
         return None  # No significant social context
         
-    def _calculate_social_pressure(self, game_state: GameState) -> float:
+    def _calculate_social_pressure(self, bridge_data: Any, scores: Optional[np.ndarray] = None) -> float:
         """
         Calculate social pressure based on relationships and context.
         
         High pressure from hostile relationships, active quests, etc.
         """
-        pressure = 0.0
-        
-        # Pressure from negative relationships
-        for score in game_state.social.relationship_scores.values():
-            if score < -0.3:
-                pressure += abs(score) * 0.3
-                
-        # Pressure from active quests
-        pressure += len(game_state.social.active_quests) * 0.1
+        if scores is None:
+            scores = self._relationship_score_array(bridge_data.social.relationship_scores)
         
         # Pressure from recent conflicts (conversations in hostile environments)
-        hostile_conversations = 0
-        for conv in game_state.social.recent_conversations[-5:]:
-            if conv.get("location") == "Deep Forest":  # Dangerous location
-                hostile_conversations += 1
-        pressure += hostile_conversations * 0.2
+        hostile_conversations = sum(
+            1 for conv in bridge_data.social.recent_conversations[-5:]
+            if conv.get("location") == "Deep Forest"  # Dangerous location
+        )
         
-        return min(1.0, pressure)
+        # Negative relationships, active quests and conflicts combined in one pass
+        return social_pressure(scores, len(bridge_data.social.active_quests), hostile_conversations)
         
     def _categorize_pressure_level(self, pressure: float) -> str:
         """Categorize social pressure levels."""
-        if pressure < 0.3:
-            return "low_pressure"
-        elif pressure < 0.6:
-            return "moderate_pressure"
-        elif pressure < 0.8:
-            return "high_pressure"
-        else:
-            return "extreme_pressure"
\ No newline at end of file
+        return PRESSURE_LABELS[bisect_right(PRESSURE_THRESHOLDS, pressure)]
\ No newline at end of file
@@ -0,0 +1,36 @@
+# eresion_core/tokenization/processors/token_meta.py
+"""
+Slotted, read-only token metadata shared by the stream processors.
+
+Processors that emit one token per entity, event or relationship every tick
+use these instead of building a fresh dict per token.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+
+class TokenMeta(Mapping):
+    """
+    Base for slotted metadata records that still read like a dict.
+    
+    Subclasses are ``@dataclass(slots=True, frozen=True, eq=False)`` records
+    whose fields are the metadata keys. ``domain`` is a class constant, shared
+    by every token of the subclass rather than stored per token, and is always
+    the first key, as in the dicts these records replace.
+    """
+    __slots__ = ()
+    
+    domain: str
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == "domain" or key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        yield "domain"
+        yield from self.__slots__
+    
+    def __len__(self) -> int:
+        return len(self.__slots__) + 1
@@ -0,0 +1,118 @@
+# eresion_core/tokenization/test_processors.py
+"""
+Runs the stream processors on small bridge snapshots and checks their tokens.
+"""
+
+# Add project root to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from eresion_core.tokenization.processors.environmental_processor import EnvironmentalProcessor
+from eresion_core.tokenization.processors.social_processor import SocialProcessor
+
+
+def _bridge_data(location="Deep Forest", weather="Rain", entities=("goblin", "wolf", "merchant"),
+                 events=("goblin raid",)):
+    """Bridge snapshot shaped like the processors' input."""
+    return SimpleNamespace(
+        player=SimpleNamespace(location=location, in_combat=False, health_percent=1.0),
+        environment=SimpleNamespace(weather=weather, time_of_day="Night",
+                                    nearby_entities=list(entities), active_world_events=list(events)),
+    )
+
+
+def test_environmental_process_tokens():
+    """process() emits context, entity and event tokens for the snapshot."""
+    tokens = EnvironmentalProcessor().process(_bridge_data())
+
+    assert [token.type for token in tokens] == [
+        "ENVIRONMENTAL", "TIME_OF_DAY", "LOCATION",
+        "ENTITY_PRESENCE", "ENTITY_PRESENCE", "ENTITY_PRESENCE",
+        "WORLD_EVENT", "ENVIRONMENTAL",
+    ]
+    assert len({token.timestamp_s for token in tokens}) == 1
+    weather, time_of_day, location = tokens[:3]
+    assert weather.metadata["intensity"] == "intense"
+    assert time_of_day.metadata["phase"] == "night"
+    assert location.metadata["context"] == "wilderness"
+    assert location.metadata["danger_level"] == "high"
+    assert location.metadata["entity_count"] == 3
+    assert [dict(token.metadata) for token in tokens[3:6]] == [
+        {"domain": "environmental", "entity_name": "goblin", "entity_type": "hostile", "threat_level": "moderate"},
+        {"domain": "environmental", "entity_name": "wolf", "entity_type": "hostile", "threat_level": "high"},
+        {"domain": "environmental", "entity_name": "merchant", "entity_type": "friendly_npc", "threat_level": "low"},
+    ]
+    assert dict(tokens[6].metadata) == {"domain": "environmental", "event_name": "goblin raid",
+                                        "event_type": "conflict_event"}
+    assert tokens[7].metadata["factors"] == ["harsh_weather", "hostile_entities_2"]
+
+
+def test_environmental_process_calm_town():
+    """A clear, empty town has no entity, event or hostility tokens."""
+    tokens = EnvironmentalProcessor().process(_bridge_data("Town Square", "Clear", (), ()))
+
+    assert [token.type for token in tokens] == ["ENVIRONMENTAL", "TIME_OF_DAY", "LOCATION"]
+    assert tokens[2].metadata["danger_level"] == "low"
+
+
+def _social_data(rng: random.Random, now: float):
+    """Random social snapshot: relationships, quests and conversations."""
+    return SimpleNamespace(social=SimpleNamespace(
+        relationship_scores={f"npc{i}": rng.choice([-1.0, -0.3, 0.3, 1.0, rng.uniform(-1.0, 1.0)])
+                             for i in range(rng.randint(0, 8))},
+        active_quests=[f"quest {i}" for i in range(rng.randint(0, 3))],
+        recent_conversations=[
+            {"target": "npc0", "location": rng.choice(["Deep Forest", "Town Square"]),
+             "timestamp": now - rng.uniform(0.0, 900.0)}
+            for _ in range(rng.randint(0, 7))
+        ],
+    ))
+
+
+def _genexp_pressure(social) -> float:
+    """Social pressure as summed per relationship and conversation."""
+    pressure = sum(abs(score) * 0.3 for score in social.relationship_scores.values() if score < -0.3)
+    pressure += len(social.active_quests) * 0.1
+    pressure += sum(1 for conv in social.recent_conversations[-5:] if conv.get("location") == "Deep Forest") * 0.2
+    return min(1.0, pressure)
+
+
+def _genexp_context_type(social, now: float):
+    """Social context type from generator-expression counts."""
+    positive = sum(1 for score in social.relationship_scores.values() if score > 0.3)
+    negative = sum(1 for score in social.relationship_scores.values() if score < -0.3)
+    recent = sum(1 for conv in social.recent_conversations if now - conv.get("timestamp", 0) < 600)
+    if positive >= 2 and negative == 0:
+        return "socially_connected"
+    if negative >= 2:
+        return "socially_isolated"
+    if recent >= 2:
+        return "socially_active"
+    if not social.relationship_scores:
+        return "socially_unknown"
+    return None
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_social_scoring_matches_genexp(seed):
+    """Vectorised counts and the pressure kernel agree with per-item sums."""
+    processor = SocialProcessor()
+    now = time.time()
+    data = _social_data(random.Random(seed), now)
+
+    pressure = processor._calculate_social_pressure(data)
+    assert pressure == pytest.approx(_genexp_pressure(data.social))
+    context = processor._analyze_social_context(data, now=now)
+    assert (context and context["type"]) == _genexp_context_type(data.social, now)
+
+    tokens = processor.process(data)
+    assert sum(token.type == "RELATIONSHIP_STATUS" for token in tokens) == len(data.social.relationship_scores)
+    assert sum(token.type == "QUEST_STATUS" for token in tokens) == len(data.social.active_quests)
+    assert any(token.type == "SOCIAL_STATE" for token in tokens) == (pressure > 0.3)
@@ -21,6 +21,10 @@ class StreamlinedTokenizer(ITokenizer):
     
     def __init__(self):
         self.known_token_types = self._define_token_types()
+        # Dense, stable codes assigned once here so the core's columnar history
+        # can store int16 ids without interning on the hot path
+        self.type_names: List[TokenType] = sorted(self.known_token_types)
+        self.type_codes: Dict[TokenType, int] = {name: code for code, name in enumerate(self.type_names)}
     
     def _define_token_types(self) -> Set[TokenType]:
         """Define the core token types used for pattern emergence."""
@@ -195,20 +199,21 @@ class StreamlinedTokenizer(ITokenizer):
         This adds higher-level pattern tokens derived from action sequences.
         """
         enriched_tokens = action_tokens.copy()
+        current_time = time.time()
         
         # Add tactical choice analysis
-        tactical_token = self._analyze_tactical_choice(action_tokens)
+        tactical_token = self._analyze_tactical_choice(action_tokens, current_time)
         if tactical_token:
             enriched_tokens.append(tactical_token)
         
         # Add risk assessment analysis  
-        risk_token = self._analyze_risk_assessment(action_tokens)
+        risk_token = self._analyze_risk_assessment(action_tokens, current_time)
         if risk_token:
             enriched_tokens.append(risk_token)
         
         return enriched_tokens
     
-    def _analyze_tactical_choice(self, action_tokens: List[Token]) -> Token:
+    def _analyze_tactical_choice(self, action_tokens: List[Token], timestamp: float) -> Token:
         """Analyze tactical patterns in recent actions."""
         if not action_tokens:
             return None
@@ -232,7 +237,7 @@ class StreamlinedTokenizer(ITokenizer):
         
         return Token(
             type="TACTICAL_CHOICE",
-            timestamp_s=time.time(),
+            timestamp_s=timestamp,
             metadata={
                 "domain": "pattern",
                 "base_action": action_type,
@@ -243,7 +248,7 @@ class StreamlinedTokenizer(ITokenizer):
             }
         )
     
-    def _analyze_risk_assessment(self, action_tokens: List[Token]) -> Token:
+    def _analyze_risk_assessment(self, action_tokens: List[Token], timestamp: float) -> Token:
         """Analyze risk-taking patterns in actions."""
         if not action_tokens:
             return None
@@ -265,7 +270,7 @@ class StreamlinedTokenizer(ITokenizer):
         
         return Token(
             type="RISK_ASSESSMENT",
-            timestamp_s=time.time(),
+            timestamp_s=timestamp,
             metadata={
                 "domain": "pattern",
                 "risk_tolerance": risk_tolerance,
@@ -24,6 +24,7 @@ for, or a client of, the Eresion core.
 ================================================================================
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Any, Literal, Optional, Set
 from abc import ABC, abstractmethod
@@ -47,6 +48,8 @@ class DataAnalyticsConfig:
     motif_min_support_percent: float = 0.05
     motif_stability_threshold: float = 0.7
     min_sessions_to_stabilize: int = 3
+    session_archive_dir: Optional[str] = None  # Per-session .npy token archives; None disables archiving
+    mine_sequence_motifs: bool = False  # Fall back to frequent token-type sequences when no co-occurrence edge is stable
 
 @dataclass
 class BalancerConfig:
@@ -59,20 +62,36 @@ class BalancerConfig:
 
 TokenType = str
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Token:
-    """The atomic unit of meaning; a single, meaningful gameplay event."""
+    """
+    The atomic unit of meaning; a single, meaningful gameplay event.
+
+    Tokens compare by identity: two events with identical fields are still
+    distinct occurrences. Hot paths construct them positionally.
+    """
     type: TokenType
     timestamp_s: float
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class TriggerCondition:
     """A flexible representation of what can trigger an ability."""
     type: Literal["SEQUENCE", "STATE_CHANGED", "COMPOSITE"]
     value: Any
 
-@dataclass
+class SequenceTrigger(TriggerCondition):
+    """A trigger whose value is always a tuple of token types; match with `type(t) is SequenceTrigger`."""
+    __slots__ = ()
+
+    def __init__(self, sequence: Tuple[TokenType, ...], type: str = "SEQUENCE"):
+        TriggerCondition.__init__(self, type, tuple(sequence))
+
+class StateTrigger(TriggerCondition):
+    """A trigger whose value is a single state or aspect name."""
+    __slots__ = ()
+
+@dataclass(slots=True)
 class AbilityPrimitive:
     """A single, atomic "Lego Brick" of gameplay mechanics."""
     id: str
@@ -80,7 +99,7 @@ class AbilityPrimitive:
     feature_vector: Dict[str, float]
     base_power_cost: float
 
-@dataclass
+@dataclass(slots=True)
 class AssembledAbility:
     """A fully formed gameplay mechanic, composed from primitives."""
     id: str
@@ -93,7 +112,7 @@ class AssembledAbility:
     resource_cost: float
     manifestation_directives: List[Dict[str, str]] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class BehavioralMotif:
     """A stable, recurring pattern of play; a "Behavioral Blueprint"."""
     id: str
@@ -101,6 +120,7 @@ class BehavioralMotif:
     stability: float
     feature_vector: Dict[str, float]
     session_seen_in: int
+    canonical_pair: Optional[Tuple[str, str]] = None  # (lower, higher) node for pair motifs; the id is built from it
 
 # ============================================================================
 # SECTION 3: MODULE INTERFACES (THE "API CONTRACTS")
@@ -191,7 +211,7 @@ class IPrimitiveComposer(ABC):
 
     @abstractmethod
     def compose_ability_options(self, motif: BehavioralMotif, count: int) -> List[AssembledAbility]:
-        """Generates a number of distinct ability options from a single motif."""
+        """Generates up to `count` distinct ability options from a motif; fewer if primitives run out."""
         pass
 
 class IBalancer(ABC):
@@ -208,6 +228,15 @@ class ILLMConnector(ABC):
         """Uses the LLM to generate a thematic name and description for an ability."""
         pass
 
+    async def generate_narratives_for_abilities(self, abilities: List[AssembledAbility], motif: BehavioralMotif) -> List[Tuple[str, str]]:
+        """
+        Names and describes several abilities from the same motif in one call.
+
+        Backends that can pack all prompts into a single request should override
+        this; the default runs the per-ability calls concurrently.
+        """
+        return list(await asyncio.gather(*(self.generate_narrative_for_ability(ability, motif) for ability in abilities)))
+
 class IManifestationDirector(ABC):
     """Contract for translating a new ability into game engine directives."""
     @abstractmethod
@@ -9,14 +9,51 @@ All operations are mathematically grounded with linear programming for budget co
 import time
 import math
 import json
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
+import numpy as np
 
-from shared.interfaces import BehavioralMotif, AssembledAbility, AbilityPrimitive, TriggerCondition
+from shared.interfaces import BehavioralMotif, AssembledAbility, AbilityPrimitive, StateTrigger
 from text_based_rpg.config import PipelineConfig
 from text_based_rpg.event_bus import EventBus, GameEvent
 
 
+# Keyword rules for a single token type, tried in order; the first rule with
+# any matching keyword contributes its (aspect, weight) pairs.
+TOKEN_ASPECT_RULES: Tuple[Tuple[Tuple[str, ...], Tuple[Tuple[str, float], ...]], ...] = (
+    # Combat/Aggression patterns
+    (('ACTION_ATTACK', 'OUTCOME_DAMAGE'), (('aggression', 0.9),)),
+    # Defensive combat is still combat-related
+    (('ACTION_DEFEND', 'ACTION_DODGE'), (('tactical', 0.8), ('aggression', 0.3))),
+    # Exploration/Movement patterns; movement requires tactical thinking
+    (('ACTION_MOVE', 'OUTCOME_MOVEMENT'), (('exploration', 0.6), ('tactical', 0.4))),
+    (('ACTION_OBSERVE', 'OUTCOME_DISCOVERY'), (('exploration', 0.8),)),
+    # Social patterns
+    (('ACTION_INTERACT', 'OUTCOME_SOCIAL'), (('social', 0.9),)),
+    # Recovery patterns
+    (('ACTION_REST', 'OUTCOME_RECOVERY'), (('recovery', 0.9),)),
+    # Fallback mappings for legacy patterns
+    (('ATTACK', 'DAMAGE'), (('aggression', 0.8),)),
+    (('OBSERVE', 'DISCOVERY'), (('exploration', 0.7),)),
+    (('SOCIAL', 'INTERACT'), (('social', 0.8),)),
+    (('RECOVERY', 'REST'), (('recovery', 0.8),)),
+    (('DEFEND', 'DODGE'), (('tactical', 0.6),)),
+    (('MOVE',), (('exploration', 0.4), ('tactical', 0.3))),
+)
+
+# Keyword flags used by the two-token sequence patterns
+FLAG_ATTACK, FLAG_DEFEND, FLAG_MOVE, FLAG_OBSERVE, FLAG_INTERACT, FLAG_RECOVERY = (1 << i for i in range(6))
+TOKEN_FLAG_KEYWORDS = (
+    ('ACTION_ATTACK', FLAG_ATTACK),
+    ('ACTION_DEFEND', FLAG_DEFEND),
+    ('ACTION_MOVE', FLAG_MOVE),
+    ('ACTION_OBSERVE', FLAG_OBSERVE),
+    ('ACTION_INTERACT', FLAG_INTERACT),
+    ('OUTCOME_RECOVERY', FLAG_RECOVERY),
+)
+
+
 @dataclass
 class EssenceVector:
     """
@@ -103,12 +140,15 @@ class AbilityCrystallizer:
     5. Validated Ability → Manifestation Directives
     """
     
+    SEQUENCE_CACHE_LIMIT = 1024  # Per-instance cap on cached sequence analyses
+    
     def __init__(self, config: PipelineConfig, event_bus: EventBus):
         self.config = config
         self.event_bus = event_bus
         
         # Ability generation templates
         self.templates = self._load_ability_templates()
+        self._index_templates()
         
         # Primitive library for composition
         self.primitives = self._load_primitive_library()
@@ -116,6 +156,10 @@ class AbilityCrystallizer:
         # Generated abilities tracking
         self.crystallized_abilities: List[AssembledAbility] = []
         self.essence_cache: Dict[str, EssenceVector] = {}
+        # _analyze_sequence results, LRU-bounded; a motif is re-detected with the same sequence every analysis pass
+        self._sequence_analysis_cache: "OrderedDict[Tuple[str, ...], Dict[str, float]]" = OrderedDict()
+        # Keyword classification per token type; the vocabulary is small, so each type is scanned once
+        self._token_classes: Dict[str, Tuple[Tuple[Tuple[str, float], ...], int]] = {}
         
         # Statistics
         self.stats = {
@@ -280,6 +324,24 @@ class AbilityCrystallizer:
             )
         ]
     
+    def _index_templates(self):
+        """
+        Lay the templates' essence requirements out as a (template x aspect) matrix.
+        
+        Lets find_matching_templates score every template with one array
+        expression instead of a dict walk per template.
+        """
+        self._template_aspects = tuple(sorted({aspect for template in self.templates
+                                               for aspect in template.essence_requirements}))
+        column = {aspect: i for i, aspect in enumerate(self._template_aspects)}
+        self._template_requirements = np.zeros((len(self.templates), len(self._template_aspects)))
+        self._template_required = np.zeros(self._template_requirements.shape, dtype=bool)
+        for row, template in enumerate(self.templates):
+            for aspect, required_level in template.essence_requirements.items():
+                self._template_requirements[row, column[aspect]] = required_level
+                self._template_required[row, column[aspect]] = True
+        self._template_aspect_counts = self._template_required.sum(axis=1)
+    
     def _load_primitive_library(self) -> List[AbilityPrimitive]:
         """Load ability primitive building blocks.""" 
         return [
@@ -417,7 +479,14 @@ class AbilityCrystallizer:
         essence = EssenceVector(motif_id=motif.id)
         
         # Extract from motif sequence (token types)
-        sequence_analysis = self._analyze_sequence(motif.sequence)
+        sequence_analysis = self._sequence_analysis_cache.get(motif.sequence)
+        if sequence_analysis is None:
+            sequence_analysis = self._analyze_sequence(motif.sequence)
+            self._sequence_analysis_cache[motif.sequence] = sequence_analysis
+            if len(self._sequence_analysis_cache) > self.SEQUENCE_CACHE_LIMIT:
+                self._sequence_analysis_cache.popitem(last=False)
+        else:
+            self._sequence_analysis_cache.move_to_end(motif.sequence)
         
         # Extract from feature vector (graph statistics)  
         feature_analysis = self._analyze_features(motif.feature_vector)
@@ -469,45 +538,8 @@ class AbilityCrystallizer:
             return analysis
         
         for token_type in sequence:
-            # Enhanced mapping for actual token types from our system
-            token_upper = token_type.upper()
-            
-            # Combat/Aggression patterns
-            if 'ACTION_ATTACK' in token_upper or 'OUTCOME_DAMAGE' in token_upper:
-                analysis['aggression'] += 0.9
-            elif 'ACTION_DEFEND' in token_upper or 'ACTION_DODGE' in token_upper:
-                analysis['tactical'] += 0.8
-                analysis['aggression'] += 0.3  # Defensive combat is still combat-related
-            
-            # Exploration/Movement patterns  
-            elif 'ACTION_MOVE' in token_upper or 'OUTCOME_MOVEMENT' in token_upper:
-                analysis['exploration'] += 0.6
-                analysis['tactical'] += 0.4  # Movement requires tactical thinking
-            elif 'ACTION_OBSERVE' in token_upper or 'OUTCOME_DISCOVERY' in token_upper:
-                analysis['exploration'] += 0.8
-            
-            # Social patterns
-            elif 'ACTION_INTERACT' in token_upper or 'OUTCOME_SOCIAL' in token_upper:
-                analysis['social'] += 0.9
-            
-            # Recovery patterns
-            elif 'ACTION_REST' in token_upper or 'OUTCOME_RECOVERY' in token_upper:
-                analysis['recovery'] += 0.9
-            
-            # Fallback mappings for legacy patterns
-            elif 'ATTACK' in token_upper or 'DAMAGE' in token_upper:
-                analysis['aggression'] += 0.8
-            elif 'OBSERVE' in token_upper or 'DISCOVERY' in token_upper:
-                analysis['exploration'] += 0.7
-            elif 'SOCIAL' in token_upper or 'INTERACT' in token_upper:
-                analysis['social'] += 0.8
-            elif 'RECOVERY' in token_upper or 'REST' in token_upper:
-                analysis['recovery'] += 0.8
-            elif 'DEFEND' in token_upper or 'DODGE' in token_upper:
-                analysis['tactical'] += 0.6
-            elif 'MOVE' in token_upper:
-                analysis['exploration'] += 0.4
-                analysis['tactical'] += 0.3
+            for aspect, weight in self._classify_token_type(token_type)[0]:
+                analysis[aspect] += weight
         
         # Add sequence pattern analysis for more sophisticated detection
         sequence_patterns = self._detect_sequence_patterns(sequence)
@@ -521,6 +553,20 @@ class AbilityCrystallizer:
         
         return analysis
     
+    def _classify_token_type(self, token_type: str) -> Tuple[Tuple[Tuple[str, float], ...], int]:
+        """(aspect contributions, keyword flags) for a token type, matched once per type."""
+        classes = self._token_classes.get(token_type)
+        if classes is None:
+            token_upper = token_type.upper()
+            contributions = next((aspects for keywords, aspects in TOKEN_ASPECT_RULES
+                                  if any(keyword in token_upper for keyword in keywords)), ())
+            flags = 0
+            for keyword, flag in TOKEN_FLAG_KEYWORDS:
+                if keyword in token_upper:
+                    flags |= flag
+            classes = self._token_classes[token_type] = (contributions, flags)
+        return classes
+    
     def _detect_sequence_patterns(self, sequence: Tuple[str, ...]) -> Dict[str, float]:
         """Detect specific behavioral patterns from token sequences."""
         patterns = {
@@ -534,37 +580,33 @@ class AbilityCrystallizer:
         if len(sequence) < 2:
             return patterns
         
-        # Convert to uppercase for pattern matching
-        seq = [token.upper() for token in sequence]
+        flags = [self._classify_token_type(token_type)[1] for token_type in sequence]
         
         # Detect specific behavioral sequences
-        for i in range(len(seq) - 1):
-            current = seq[i]
-            next_token = seq[i + 1]
-            
+        for current, next_token in zip(flags, flags[1:]):
             # Combat patterns
-            if 'ACTION_ATTACK' in current and 'ACTION_DEFEND' in next_token:
+            if current & FLAG_ATTACK and next_token & FLAG_DEFEND:
                 patterns['tactical'] += 0.5  # Attack-Defense shows tactical thinking
                 patterns['aggression'] += 0.3
-            elif 'ACTION_ATTACK' in current and 'ACTION_ATTACK' in next_token:
+            elif current & FLAG_ATTACK and next_token & FLAG_ATTACK:
                 patterns['aggression'] += 0.7  # Repeated attacks = aggressive
             
             # Movement-Observation patterns (scout behavior)
-            elif 'ACTION_MOVE' in current and 'ACTION_OBSERVE' in next_token:
+            elif current & FLAG_MOVE and next_token & FLAG_OBSERVE:
                 patterns['exploration'] += 0.8  # Classic exploration pattern
                 patterns['tactical'] += 0.2
             
             # Social-Combat patterns (diplomacy-then-force)
-            elif 'ACTION_INTERACT' in current and 'ACTION_ATTACK' in next_token:
+            elif current & FLAG_INTERACT and next_token & FLAG_ATTACK:
                 patterns['social'] += 0.4
                 patterns['tactical'] += 0.6  # Talking first = tactical
             
             # Defensive patterns
-            elif 'ACTION_DEFEND' in current and 'ACTION_DEFEND' in next_token:
+            elif current & FLAG_DEFEND and next_token & FLAG_DEFEND:
                 patterns['tactical'] += 0.9  # Sustained defense = highly tactical
             
             # Recovery patterns
-            elif 'ACTION_ATTACK' in current and 'OUTCOME_RECOVERY' in next_token:
+            elif current & FLAG_ATTACK and next_token & FLAG_RECOVERY:
                 patterns['recovery'] += 0.5  # Post-combat recovery
             
         return patterns
@@ -616,19 +658,16 @@ class AbilityCrystallizer:
     
     def find_matching_templates(self, essence: EssenceVector) -> List[Tuple[AbilityTemplate, float]]:
         """Find ability templates that match the essence vector."""
-        matches = []
-        
-        for template in self.templates:
-            match_score = template.matches_essence(essence)
-            
-            # Only consider templates with reasonable match scores
-            if match_score > 0.3:
-                matches.append((template, match_score))
-        
-        # Sort by match score (best first)
-        matches.sort(key=lambda x: x[1], reverse=True)
-        
-        return matches
+        # Same scoring as AbilityTemplate.matches_essence, for every template at once
+        levels = np.array([getattr(essence, aspect, 0.0) for aspect in self._template_aspects])
+        closeness = np.maximum(0.0, 1.0 - np.abs(levels - self._template_requirements))
+        totals = np.where(self._template_required, closeness, 0.0).sum(axis=1)
+        scores = np.where(self._template_aspect_counts > 0,
+                          totals / np.maximum(self._template_aspect_counts, 1), 0.5)  # Default moderate match
+        
+        # Only consider templates with reasonable match scores, best first
+        order = np.argsort(-scores, kind='stable')
+        return [(self.templates[row], float(scores[row])) for row in order.tolist() if scores[row] > 0.3]
     
     def compose_ability(self, motif: BehavioralMotif, essence: EssenceVector, 
                        template: AbilityTemplate, match_score: float) -> Optional[AssembledAbility]:
@@ -654,7 +693,7 @@ class AbilityCrystallizer:
         total_cost = (base_cost + primitive_cost) * intensity_multiplier * complexity_multiplier
         
         # Create trigger condition
-        trigger = TriggerCondition(
+        trigger = StateTrigger(
             type=template.trigger_type,
             value=essence.get_dominant_aspect()
         )
@@ -746,5 +785,6 @@ class AbilityCrystallizer:
     def clear_cache(self):
         """Clear essence cache and abilities (for testing/reset)."""
         self.essence_cache.clear()
+        self._sequence_analysis_cache.clear()
         self.crystallized_abilities.clear()
         self.stats = {k: 0 if isinstance(v, (int, float)) else v for k, v in self.stats.items()}
\ No newline at end of file
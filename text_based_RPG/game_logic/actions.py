@@ -1124,7 +1124,8 @@ class AbilityAction(BaseDnDAction):
         """Enhanced tokenization for ability usage - generates higher-intensity tokens."""
         tokens = super().tokenize(execution_result)  # Get base tokens
         
-        current_time = time.time()
+        # Share the base tokens' timestamp so the whole action is stamped by one clock read
+        current_time = tokens[0].timestamp_s
         
         # Add ability-specific tokens with enhanced intensity
         ability_token = Token(
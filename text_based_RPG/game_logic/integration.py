@@ -48,7 +48,8 @@ class DnDGameEngine:
         
         This replaces the old process_turn() function with a cleaner implementation.
         """
-        self.turn_start_time = time.time()
+        # Turn timing only needs a monotonic interval, not wall-clock time
+        self.turn_start_time = time.perf_counter()
         
         # 1. Advance turn-based timers (readied actions, activities, etc.)
         completion_message = self.context_factory.advance_turn()
@@ -78,7 +79,7 @@ class DnDGameEngine:
             'tokens_generated': action_tokens,
             'completion_message': completion_message,
             'turn_number': self.game_state.temporal.turn,
-            'performance_ms': (time.time() - self.turn_start_time) * 1000,
+            'performance_ms': (time.perf_counter() - self.turn_start_time) * 1000,
             'game_state': self.game_state
         }
         
@@ -49,7 +49,7 @@ class WorldSimulator:
         self.last_update_time = current_time
         
         # Update temporal state
-        self._update_temporal_state(game_state, delta_time)
+        self._update_temporal_state(game_state, current_time, delta_time)
         
         # Update biometric data if enabled
         if self.config.streams.biometric_enabled:
@@ -63,12 +63,12 @@ class WorldSimulator:
         if self.config.streams.social_enabled:
             self._update_social_state(game_state)
             
-    def _update_temporal_state(self, game_state: GameState, delta_time: float) -> None:
+    def _update_temporal_state(self, game_state: GameState, current_time: float, delta_time: float) -> None:
         """Update time-based aspects of the game state."""
         game_state.temporal.total_play_time_s += delta_time
         
-        # Update timestamp for biometric data
-        game_state.biometric.irl_timestamp = time.time()
+        # Update timestamp for biometric data, from the same clock read as this update
+        game_state.biometric.irl_timestamp = current_time
         
     def _update_biometric_state(self, game_state: GameState) -> None:
         """
@@ -37,6 +37,9 @@ from shared.interfaces import (
     AbilityPrimitive, TriggerCondition
 )
 
+# Simulated turns are paced to this period, divided by the configured speed multiplier
+SIM_TURN_INTERVAL_S = 0.1
+
 def _get_simulated_input(game_state: GameState, dnd_engine: DnDGameEngine) -> str:
     """
     Generates intelligent, context-aware simulated input for testing.
@@ -131,10 +134,13 @@ async def run_game(sim_mode=False):
     action_menu = ActionMenu()
 
     print("\nType commands like 'attack goblin' or 'dash'. Type 'quit' to exit.")
+    turn_interval_s = SIM_TURN_INTERVAL_S / max(config.simulation_speed_multiplier, 1e-6)
 
     # --- 3. MAIN GAME LOOP ---
     # The core loop where the head and headless systems interact.
     while game_state.player.health_percent > 0 and game_state.temporal.turn < 1000:
+        # The turn's own work counts against its pacing slot
+        turn_deadline = time.perf_counter() + turn_interval_s
         print(f"\n--- Turn {game_state.temporal.turn} ---")
         
         # 1. Display UI
@@ -182,10 +188,12 @@ async def run_game(sim_mode=False):
         await eresion_core.update()
         
         if sim_mode:
-            time.sleep(0.1)
+            # Sleep out the rest of the turn's slot without blocking the core's background cycle
+            await asyncio.sleep(max(0.0, turn_deadline - time.perf_counter()))
 
     # --- 4. GAME END ---
     print("\n--- Game Over ---")
+    await eresion_core.shutdown()
     # TODO: Add save_game functionality
     # save_game(game_state, eresion_core.current_session)
 
@@ -517,8 +517,8 @@ async def run_event_driven_demo(test_mode: bool = False, num_test_events: int =
         # Generate deterministic test sequence
         create_deterministic_test_sequence(event_bus)
         
-        # Allow time for all events to process
-        await asyncio.sleep(2.0)
+        # The event bus dispatches synchronously, so every event is already processed
+        await asyncio.sleep(0)
         
         # Force process all tokens through the pipeline
         print(f"\n=== PROCESSING TOKENS THROUGH PIPELINE ===")
@@ -529,8 +529,8 @@ async def run_event_driven_demo(test_mode: bool = False, num_test_events: int =
         import time
         temporal_graph._run_analysis(time.time())
         
-        # Allow time for analysis to complete
-        await asyncio.sleep(1.0)
+        # Analysis above ran inline; just yield once to the loop
+        await asyncio.sleep(0)
         
         # Display tokenization results
         print("\n=== TOKENIZATION RESULTS ===")
@@ -589,10 +589,10 @@ async def run_event_driven_demo(test_mode: bool = False, num_test_events: int =
                 print(f"  {motif.id} (stability: {motif.stability:.3f}) - {motif.sequence}")
         
         # Display strongest edges
-        edge_data = temporal_graph.get_edge_data()
+        edge_data = temporal_graph.get_edge_data(limit=5)
         if edge_data:
             print(f"\nStrongest relationships:")
-            for edge in edge_data[:5]:  # Show top 5 edges
+            for edge in edge_data:  # Show top 5 edges
                 print(f"  {edge['source']} → {edge['target']} (weight: {edge['weight']:.3f})")
         
         print(f"\n=== PIPELINE ANALYSIS ===")
@@ -668,8 +668,8 @@ async def run_event_driven_demo(test_mode: bool = False, num_test_events: int =
                 # Increment turn counter
                 game_state.turn += 1
                 
-                # Small delay to allow event processing
-                await asyncio.sleep(0.1)
+                # Events are handled synchronously; yield without a fixed delay
+                await asyncio.sleep(0)
                 
             except KeyboardInterrupt:
                 print("\n\nExiting...")
@@ -11,6 +11,7 @@ import time
 import math
 from typing import Dict, List, Set, Any, Optional, Tuple
 from collections import deque
+from itertools import islice
 
 from text_based_rpg.event_bus import EventBus, GameEvent
 from text_based_rpg.config import PipelineConfig
@@ -28,6 +29,46 @@ class MathematicalTokenizer:
     - Cause-effect correlation tracks action → outcome relationships
     """
     
+    # Map verb to token type
+    ACTION_VERB_TYPES = {
+        'attack': 'ACTION_ATTACK',
+        'fight': 'ACTION_ATTACK', 
+        'strike': 'ACTION_ATTACK',
+        'hit': 'ACTION_ATTACK',
+        'defend': 'ACTION_DEFEND',
+        'dodge': 'ACTION_DEFEND',
+        'block': 'ACTION_DEFEND',
+        'move': 'ACTION_MOVE',
+        'go': 'ACTION_MOVE',
+        'travel': 'ACTION_MOVE',
+        'dash': 'ACTION_MOVE',
+        'rest': 'ACTION_REST',
+        'heal': 'ACTION_REST',
+        'recover': 'ACTION_REST',
+        'look': 'ACTION_OBSERVE',
+        'examine': 'ACTION_OBSERVE',
+        'search': 'ACTION_OBSERVE',
+        'talk': 'ACTION_INTERACT',
+        'speak': 'ACTION_INTERACT',
+        'influence': 'ACTION_INTERACT'
+    }
+    
+    # Map failed verb to corresponding action type (for pattern analysis)
+    FAILURE_VERB_TYPES = {
+        'attack': 'ACTION_ATTACK',
+        'move': 'ACTION_MOVE',
+        'talk': 'ACTION_INTERACT'
+    }
+    
+    # Different movement types have different intensities
+    MOVEMENT_INTENSITIES = {
+        'dash': 0.8,
+        'run': 0.7,
+        'move': 0.5,
+        'walk': 0.3
+    }
+    DEFAULT_MOVEMENT_INTENSITY = 0.5
+    
     def __init__(self, event_bus: EventBus, config: PipelineConfig):
         self.event_bus = event_bus
         self.config = config
@@ -45,6 +86,9 @@ class MathematicalTokenizer:
         # Event-to-token mappings
         self.event_mappings = self._initialize_event_mappings()
         
+        # Movement intensities depend only on constants, so normalize them once
+        self.movement_intensity_table = self._build_movement_intensity_table()
+        
         # Subscribe to all relevant events
         self._setup_event_subscriptions()
         
@@ -149,6 +193,14 @@ class MathematicalTokenizer:
             }
         }
     
+    def _build_movement_intensity_table(self) -> Dict[str, float]:
+        """Precompute the normalized intensity of each known movement type."""
+        base_intensity = self.event_mappings['PlayerMoved']['base_intensity']
+        return {
+            movement_type: self._sigmoid_normalize(base_intensity + bonus)
+            for movement_type, bonus in self.MOVEMENT_INTENSITIES.items()
+        }
+    
     def _setup_event_subscriptions(self):
         """Subscribe to all relevant events for tokenization."""
         for event_type in self.event_mappings.keys():
@@ -163,13 +215,12 @@ class MathematicalTokenizer:
         
         Implements T: S → V* with O(1) complexity per event.
         """
-        if event.type not in self.event_mappings:
+        mapping = self.event_mappings.get(event.type)
+        if mapping is None:
             if self.debug:
                 print(f"[MathTokenizer] Unknown event type: {event.type}")
             return
         
-        mapping = self.event_mappings[event.type]
-        
         try:
             # Generate token using the specified generator function
             token = mapping['token_generator'](event, mapping)
@@ -204,32 +255,7 @@ class MathematicalTokenizer:
     def _generate_action_token(self, event: GameEvent, mapping: Dict[str, Any]) -> Optional[Token]:
         """Generate action token from CommandParsed event."""
         verb = event.get('verb', 'unknown')
-        
-        # Map verb to token type
-        verb_mapping = {
-            'attack': 'ACTION_ATTACK',
-            'fight': 'ACTION_ATTACK', 
-            'strike': 'ACTION_ATTACK',
-            'hit': 'ACTION_ATTACK',
-            'defend': 'ACTION_DEFEND',
-            'dodge': 'ACTION_DEFEND',
-            'block': 'ACTION_DEFEND',
-            'move': 'ACTION_MOVE',
-            'go': 'ACTION_MOVE',
-            'travel': 'ACTION_MOVE',
-            'dash': 'ACTION_MOVE',
-            'rest': 'ACTION_REST',
-            'heal': 'ACTION_REST',
-            'recover': 'ACTION_REST',
-            'look': 'ACTION_OBSERVE',
-            'examine': 'ACTION_OBSERVE',
-            'search': 'ACTION_OBSERVE',
-            'talk': 'ACTION_INTERACT',
-            'speak': 'ACTION_INTERACT',
-            'influence': 'ACTION_INTERACT'
-        }
-        
-        token_type = verb_mapping.get(verb, 'ACTION_INTERACT')  # Default fallback
+        token_type = self.ACTION_VERB_TYPES.get(verb, 'ACTION_INTERACT')  # Default fallback
         
         # Calculate intensity with sigmoid normalization
         base_intensity = mapping['base_intensity']
@@ -242,9 +268,9 @@ class MathematicalTokenizer:
         intensity = self._sigmoid_normalize(raw_intensity)
         
         return Token(
-            type=token_type,
-            timestamp_s=event.timestamp_ms / 1000.0,
-            metadata={
+            token_type,
+            event.timestamp_ms / 1000.0,
+            {
                 'raw_input': event.get('raw_input', ''),
                 'verb': verb,
                 'args': args,
@@ -273,9 +299,9 @@ class MathematicalTokenizer:
         intensity = self._sigmoid_normalize(raw_intensity)
         
         return Token(
-            type='OUTCOME_DAMAGE_DEALT',
-            timestamp_s=event.timestamp_ms / 1000.0,
-            metadata={
+            'OUTCOME_DAMAGE_DEALT',
+            event.timestamp_ms / 1000.0,
+            {
                 'damage_amount': amount,
                 'is_critical': is_critical,
                 'target': event.get('target', 'unknown'),
@@ -294,22 +320,15 @@ class MathematicalTokenizer:
         """Generate outcome token for movement."""
         movement_type = event.get('movement_type', 'move')
         
-        # Different movement types have different intensities
-        movement_intensities = {
-            'dash': 0.8,
-            'run': 0.7,
-            'move': 0.5,
-            'walk': 0.3
-        }
-        
-        movement_intensity = movement_intensities.get(movement_type, 0.5)
-        raw_intensity = mapping['base_intensity'] + movement_intensity
-        intensity = self._sigmoid_normalize(raw_intensity)
+        movement_intensity = self.MOVEMENT_INTENSITIES.get(movement_type, self.DEFAULT_MOVEMENT_INTENSITY)
+        intensity = self.movement_intensity_table.get(movement_type)
+        if intensity is None:
+            intensity = self._sigmoid_normalize(mapping['base_intensity'] + movement_intensity)
         
         return Token(
-            type='OUTCOME_MOVEMENT_SUCCESS',
-            timestamp_s=event.timestamp_ms / 1000.0,
-            metadata={
+            'OUTCOME_MOVEMENT_SUCCESS',
+            event.timestamp_ms / 1000.0,
+            {
                 'new_location': event.get('new_location'),
                 'previous_location': event.get('previous_location'),
                 'movement_type': movement_type,
@@ -342,9 +361,9 @@ class MathematicalTokenizer:
         intensity = self._sigmoid_normalize(raw_intensity)
         
         return Token(
-            type=token_type,
-            timestamp_s=event.timestamp_ms / 1000.0,
-            metadata={
+            token_type,
+            event.timestamp_ms / 1000.0,
+            {
                 'target': event.get('target'),
                 'interaction_type': interaction_type,
                 'outcome': outcome,
@@ -372,9 +391,9 @@ class MathematicalTokenizer:
         intensity = self._sigmoid_normalize(raw_intensity)
         
         return Token(
-            type='OUTCOME_RECOVERY',
-            timestamp_s=event.timestamp_ms / 1000.0,
-            metadata={
+            'OUTCOME_RECOVERY',
+            event.timestamp_ms / 1000.0,
+            {
                 'action_type': action_type,
                 'health_recovered': health_recovered,
                 'stamina_recovered': stamina_recovered,
@@ -398,9 +417,9 @@ class MathematicalTokenizer:
         intensity = self._sigmoid_normalize(raw_intensity)
         
         return Token(
-            type='OUTCOME_DISCOVERY',
-            timestamp_s=event.timestamp_ms / 1000.0,
-            metadata={
+            'OUTCOME_DISCOVERY',
+            event.timestamp_ms / 1000.0,
+            {
                 'action_type': event.get('action_type', 'look'),
                 'target': event.get('target', 'environment'),
                 'information_count': len(information_gained),
@@ -417,15 +436,7 @@ class MathematicalTokenizer:
     def _generate_failure_token(self, event: GameEvent, mapping: Dict[str, Any]) -> Optional[Token]:
         """Generate token for failed actions."""
         verb = event.get('verb', 'unknown')
-        
-        # Map failed verb to corresponding action type (for pattern analysis)
-        verb_mapping = {
-            'attack': 'ACTION_ATTACK',
-            'move': 'ACTION_MOVE',
-            'talk': 'ACTION_INTERACT'
-        }
-        
-        failed_action_type = verb_mapping.get(verb, 'ACTION_INTERACT')
+        failed_action_type = self.FAILURE_VERB_TYPES.get(verb, 'ACTION_INTERACT')
         
         raw_intensity = mapping['base_intensity']  # Failures have consistent intensity
         intensity = self._sigmoid_normalize(raw_intensity)
@@ -554,7 +565,8 @@ class MathematicalTokenizer:
     def get_token_history(self, limit: Optional[int] = None) -> List[Token]:
         """Get recent token history for analysis."""
         if limit:
-            return list(self.token_history)[-limit:]
+            # Walk back from the newest token; never copies the whole deque
+            return list(islice(reversed(self.token_history), limit))[::-1]
         return list(self.token_history)
     
     def get_vocabulary(self) -> Set[TokenType]:
@@ -10,10 +10,11 @@ This implements the dynamic network G_t = (V_t, E_t) where:
 """
 
 import time
-import math
 from typing import Dict, List, Set, Any, Optional, Tuple
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+import numpy as np
+
+from eresion_core.kernels import edge_significance, ingest_edge_pairs
 
 from shared.interfaces import Token, BehavioralMotif
 from text_based_rpg.config import PipelineConfig
@@ -27,53 +28,142 @@ class GraphNode:
     count: int = 0
     total_intensity: float = 0.0
     last_seen_timestamp: float = 0.0
-    sessions_seen: Set[int] = field(default_factory=set)
+    sessions_mask: int = 0  # Bit i set once the type has been seen in session i
     
     @property
     def average_intensity(self) -> float:
         """Average intensity for this token type."""
         return self.total_intensity / max(1, self.count)
     
+    @property
+    def sessions_seen(self) -> Set[int]:
+        """Session ids this token type has been seen in."""
+        mask, session_id, sessions = self.sessions_mask, 0, set()
+        while mask:
+            if mask & 1:
+                sessions.add(session_id)
+            mask >>= 1
+            session_id += 1
+        return sessions
+    
     def update(self, token: Token, session_id: int):
         """Update node statistics with new token."""
         self.count += 1
         intensity = token.metadata.get('intensity', 0.0)
         self.total_intensity += intensity
         self.last_seen_timestamp = token.timestamp_s
-        self.sessions_seen.add(session_id)
+        self.sessions_mask |= 1 << session_id
 
 
-@dataclass
-class GraphEdge:
-    """Edge in the temporal graph representing a relationship between token types."""
-    source: str
-    target: str
-    weight: float = 0.0
-    last_update_timestamp: float = 0.0
-    co_occurrence_count: int = 0
-    succession_count: int = 0
-    total_reinforcement: float = 0.0
-    
-    def apply_decay(self, current_time: float, decay_config: PipelineConfig) -> float:
-        """Apply exponential decay to edge weight."""
-        if self.last_update_timestamp == 0:
-            return self.weight
-        
-        time_diff_ms = (current_time - self.last_update_timestamp) * 1000
-        decay_factor = math.exp(-decay_config.LAMBDA * time_diff_ms / decay_config.TAU)
-        self.weight *= decay_factor
-        return self.weight
-    
-    def reinforce(self, strength: float, fusion_product: float, current_time: float, config: PipelineConfig):
-        """Apply reinforcement to edge weight."""
-        # First apply decay
-        self.apply_decay(current_time, config)
-        
-        # Then apply reinforcement
-        reinforcement = config.BETA * strength * fusion_product
-        self.weight = min(1.0, self.weight + reinforcement)  # Bounded [0,1]
-        self.total_reinforcement += reinforcement
-        self.last_update_timestamp = current_time
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest scores, largest first, without sorting the rest."""
+    if k < len(scores):
+        candidates = np.argpartition(scores, -k)[-k:]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+class EdgeArrays:
+    """
+    Columnar storage for temporal graph edges.
+    
+    Each (source, target) pair owns one row across parallel numpy arrays, so
+    decay and thresholding run as whole-array operations instead of a Python
+    loop over per-edge objects.
+    """
+    
+    COLUMNS = {
+        'weight': np.float32,  # Bounded to [0,1]; halves the bytes every weight scan reads
+        'last_update_timestamp': np.float64,
+        'co_occurrence_count': np.int64,
+        'succession_count': np.int64,
+        'total_reinforcement': np.float64,
+        'source_id': np.int32,
+        'target_id': np.int32,
+    }
+    
+    def __init__(self, capacity: int = 256):
+        self.index: Dict[int, int] = {}  # Packed (source_id << 32 | target_id) -> row
+        self.sources: List[str] = []
+        self.targets: List[str] = []
+        self.size = 0
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def row(self, source_id: int, target_id: int) -> Optional[int]:
+        """Row index of an edge between two interned nodes, or None if it does not exist."""
+        return self.index.get((source_id << 32) | target_id)
+    
+    def add(self, source: str, target: str, source_id: int, target_id: int) -> int:
+        """Create a zeroed edge row between two interned nodes and return its index."""
+        if self.size == len(self.weight):
+            self._grow()
+        row = self.size
+        self.index[(source_id << 32) | target_id] = row
+        self.source_id[row] = source_id
+        self.target_id[row] = target_id
+        self.sources.append(source)
+        self.targets.append(target)
+        self.size += 1
+        return row
+    
+    def _grow(self):
+        """Double the capacity of every column."""
+        capacity = 2 * len(self.weight)
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+    
+    def view(self, name: str) -> np.ndarray:
+        """Live view of a column trimmed to the edges in use."""
+        return getattr(self, name)[:self.size]
+    
+    def effective_weights(self, current_time: float, decay_config: PipelineConfig,
+                          rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Decayed edge weights at current_time, computed in closed form.
+        
+        Stored weights are only brought forward when an edge is reinforced, so
+        reading them never costs a pass over untouched edges.
+        """
+        weights = self.view('weight')
+        last_update = self.view('last_update_timestamp')
+        if rows is not None:
+            weights = weights[rows]
+            last_update = last_update[rows]
+        
+        time_diff_ms = np.maximum(current_time - last_update, 0.0) * 1000
+        decay_factor = np.exp(-decay_config.LAMBDA * time_diff_ms / decay_config.TAU)
+        return np.where(last_update > 0, weights * decay_factor, weights)
+    
+    def ingest(self, pair_rows: np.ndarray, amounts: np.ndarray, co_occurrence: np.ndarray,
+               current_time: float, decay_per_s: float):
+        """
+        Apply a batch of (edge row, reinforcement) pairs in one fused pass.
+        
+        Decay, the [0,1]-bounded reinforcement and the co-occurrence/succession
+        counters are all updated by a single compiled kernel. Reinforcements are
+        non-negative, so clamping after each pair matches clamping the sum.
+        decay_per_s is the graph's decay rate per second of edge idleness.
+        """
+        ingest_edge_pairs(pair_rows, amounts, co_occurrence, current_time, decay_per_s,
+                          self.weight, self.last_update_timestamp, self.total_reinforcement,
+                          self.co_occurrence_count, self.succession_count)
+    
+    def clear(self):
+        """Drop all edges, keeping the allocated capacity."""
+        self.index.clear()
+        self.sources.clear()
+        self.targets.clear()
+        self.size = 0
+        for name in self.COLUMNS:
+            getattr(self, name).fill(0)
 
 
 class TemporalGraph:
@@ -86,16 +176,34 @@ class TemporalGraph:
     - Sigmoid stability functions for motif detection
     """
     
+    RELATIONSHIP_WINDOW = 20  # Consider last 20 tokens for relationships
+    
     def __init__(self, config: PipelineConfig, event_bus: Optional[EventBus] = None):
         self.config = config
         self.event_bus = event_bus
+        # Decay rate per second of edge idleness, derived once from LAMBDA/TAU
+        self._decay_per_s = config.LAMBDA * 1000 / config.TAU
         
         # Graph structure
         self.nodes: Dict[str, GraphNode] = {}
-        self.edges: Dict[str, Dict[str, GraphEdge]] = defaultdict(dict)  # [source][target] -> edge
         
-        # Token processing
-        self.token_buffer: deque[Tuple[Token, int]] = deque(maxlen=1000)  # (token, session_id)
+        # Running counts for PMI, maintained incrementally per token.
+        # Node ids are small ints so edge keys pack two of them into one int.
+        self.node_ids: Dict[str, int] = {}
+        self.node_names: List[str] = []
+        self._nodes_by_id: List[GraphNode] = []  # Same objects as `nodes`, indexed by node id
+        self.node_counts = np.zeros(64, dtype=np.int64)
+        self.total_tokens = 0
+        self.edges = EdgeArrays()  # (source, target) -> row
+        
+        # Token processing: a fixed ring of recent tokens kept as parallel
+        # arrays, so relationship windows are read without touching Token objects
+        self.token_buffer_capacity = 1000
+        self._buf_type = np.empty(self.token_buffer_capacity, dtype=np.int64)
+        self._buf_time = np.empty(self.token_buffer_capacity, dtype=np.float64)
+        self._buf_intensity = np.empty(self.token_buffer_capacity, dtype=np.float64)
+        self._buf_head = 0  # Next write index
+        self._buf_size = 0
         self.current_session = 1
         
         # Analysis state
@@ -108,7 +216,6 @@ class TemporalGraph:
             'tokens_processed': 0,
             'edges_created': 0,
             'reinforcements_applied': 0,
-            'decay_operations': 0,
             'motifs_detected': 0
         }
         
@@ -125,111 +232,187 @@ class TemporalGraph:
         
         This is the main entry point that implements the mathematical model.
         """
+        self.add_tokens([token], session_id)
+    
+    def add_tokens(self, tokens: List[Token], session_id: int = None):
+        """
+        Add a batch of tokens and update all of their relationships at once.
+        
+        Relationship pairs for the whole batch are built with numpy and the
+        reinforcement of every touched edge is accumulated with np.add.at, so
+        the per-token Python overhead is limited to node bookkeeping.
+        
+        Periodic analysis runs at the same point as when tokens were added one
+        at a time: right after the first token of a batch that arrives once
+        the analysis interval has elapsed.
+        """
+        if not tokens:
+            return
         if session_id is None:
             session_id = self.current_session
         
         current_time = time.time()
         
-        # Update node statistics
-        self._update_node(token, session_id)
-        
-        # Add to buffer for relationship analysis
-        self.token_buffer.append((token, session_id))
-        
-        # Update relationships with recent tokens
-        self._update_relationships(token, current_time)
-        
-        # Periodic analysis
         if current_time - self.last_analysis_time > self.analysis_interval_s:
+            self._ingest_tokens(tokens[:1], session_id, current_time)
             self._run_analysis(current_time)
             self.last_analysis_time = current_time
-        
-        self.stats['tokens_processed'] += 1
-        
-        if self.debug:
-            intensity = token.metadata.get('intensity', 0.0)
-            print(f"[TemporalGraph] Added token: {token.type} (intensity: {intensity:.3f})")
+            tokens = tokens[1:]
+            if not tokens:
+                return
+        self._ingest_tokens(tokens, session_id, current_time)
     
-    def _update_node(self, token: Token, session_id: int):
-        """Update or create node for token type."""
-        token_type = token.type
+    def _ingest_tokens(self, tokens: List[Token], session_id: int, current_time: float):
+        """Update nodes, relationships and the token ring for a batch of tokens."""
+        # Each token's type is looked up by string once; everything after uses its id
+        type_ids = np.array([self._intern_node(token.type) for token in tokens], dtype=np.int64)
         
-        if token_type not in self.nodes:
-            self.nodes[token_type] = GraphNode(token_type)
+        # Update node statistics
+        nodes_by_id = self._nodes_by_id
+        for token, node_id in zip(tokens, type_ids.tolist()):
+            nodes_by_id[node_id].update(token, session_id)
+            
             if self.debug:
-                print(f"[TemporalGraph] Created node: {token_type}")
+                intensity = token.metadata.get('intensity', 0.0)
+                print(f"[TemporalGraph] Added token: {token.type} (intensity: {intensity:.3f})")
+        np.add.at(self.node_counts, type_ids, 1)
+        self.total_tokens += len(tokens)
         
-        self.nodes[token_type].update(token, session_id)
-    
-    def _update_relationships(self, current_token: Token, current_time: float):
-        """Update relationships between current token and recent tokens."""
-        current_type = current_token.type
-        current_intensity = current_token.metadata.get('intensity', 0.0)
+        timestamps = np.array([token.timestamp_s for token in tokens], dtype=np.float64)
+        intensities = np.array([token.metadata.get('intensity', 0.0) for token in tokens], dtype=np.float64)
+        
+        # Tokens already in the buffer that fall inside the relationship window
+        history = self._recent_rows(self.RELATIONSHIP_WINDOW - 1)
+        self._update_relationships(np.concatenate((self._buf_type[history], type_ids)),
+                                   np.concatenate((self._buf_time[history], timestamps)),
+                                   np.concatenate((self._buf_intensity[history], intensities)),
+                                   len(history), current_time)
         
-        # Look at recent tokens in buffer for relationships
-        recent_window = 20  # Consider last 20 tokens for relationships
-        recent_tokens = list(self.token_buffer)[-recent_window:-1]  # Exclude current token
+        # Add to buffer for relationship analysis
+        self._buffer_tokens(type_ids, timestamps, intensities)
         
-        for recent_token, recent_session in recent_tokens:
-            recent_type = recent_token.type
-            recent_intensity = recent_token.metadata.get('intensity', 0.0)
+        self.stats['tokens_processed'] += len(tokens)
+    
+    def _intern_node(self, token_type: str) -> int:
+        """Return the node id for a token type, creating its node if needed."""
+        node_id = self.node_ids.get(token_type)
+        if node_id is None:
+            node_id = len(self.node_names)
+            node = self.nodes[token_type] = GraphNode(token_type)
+            self.node_ids[token_type] = node_id
+            self.node_names.append(token_type)
+            self._nodes_by_id.append(node)
+            if len(self.node_names) > len(self.node_counts):
+                self.node_counts = np.concatenate((self.node_counts, np.zeros_like(self.node_counts)))
+            if self.debug:
+                print(f"[TemporalGraph] Created node: {token_type}")
+        return node_id
+    
+    def _recent_rows(self, count: int) -> np.ndarray:
+        """Ring indices of the last `count` buffered tokens, oldest first."""
+        count = min(count, self._buf_size)
+        return (self._buf_head - count + np.arange(count)) % self.token_buffer_capacity
+    
+    def _buffer_tokens(self, type_ids: np.ndarray, timestamps: np.ndarray, intensities: np.ndarray):
+        """Write a batch of token fields into the ring, overwriting the oldest rows."""
+        capacity = self.token_buffer_capacity
+        # Only the newest `capacity` tokens of an oversized batch survive anyway
+        type_ids, timestamps, intensities = type_ids[-capacity:], timestamps[-capacity:], intensities[-capacity:]
+        rows = (self._buf_head + np.arange(len(type_ids))) % capacity
+        self._buf_type[rows] = type_ids
+        self._buf_time[rows] = timestamps
+        self._buf_intensity[rows] = intensities
+        self._buf_head = (self._buf_head + len(type_ids)) % capacity
+        self._buf_size = min(self._buf_size + len(type_ids), capacity)
+    
+    def _update_relationships(self, type_ids: np.ndarray, timestamps: np.ndarray,
+                              intensities: np.ndarray, first_new: int, current_time: float):
+        """Update relationships between each new token and the tokens just before it."""
+        new_positions = np.arange(first_new, len(type_ids))
+        
+        # Pair every new token with each of the previous RELATIONSHIP_WINDOW - 1 tokens
+        sources, targets, strengths, co_occurrence, positions = [], [], [], [], []
+        for offset in range(1, self.RELATIONSHIP_WINDOW):
+            current = new_positions[new_positions >= offset]
+            recent = current - offset
             
-            if recent_type == current_type:
-                continue  # Skip self-relationships
+            # Skip self-relationships
+            distinct = type_ids[recent] != type_ids[current]
+            current, recent = current[distinct], recent[distinct]
             
             # Calculate time difference for succession vs co-occurrence
-            time_diff = current_token.timestamp_s - recent_token.timestamp_s
+            time_diff = timestamps[current] - timestamps[recent]
+            is_co_occurrence = time_diff <= 2.0  # Co-occurrence (within 2 seconds)
+            related = is_co_occurrence | (time_diff <= 10.0)  # Succession (within 10 seconds)
             
-            # Determine relationship type and strength
-            if time_diff <= 2.0:  # Co-occurrence (within 2 seconds)
-                strength = (current_intensity + recent_intensity) / 2.0
-                self._reinforce_edge(recent_type, current_type, strength, 'co_occurrence', current_time)
-                
-            elif time_diff <= 10.0:  # Succession (within 10 seconds)
-                # Stronger weight for closer temporal relationships
-                temporal_decay = math.exp(-time_diff / 5.0)  # 5 second half-life
-                strength = current_intensity * temporal_decay
-                self._reinforce_edge(recent_type, current_type, strength, 'succession', current_time)
-    
-    def _reinforce_edge(self, source_type: str, target_type: str, strength: float, 
-                       relationship_type: str, current_time: float):
-        """Reinforce an edge between two token types."""
-        
-        # Get or create edge
-        if target_type not in self.edges[source_type]:
-            self.edges[source_type][target_type] = GraphEdge(source_type, target_type)
-            self.stats['edges_created'] += 1
-            if self.debug:
-                print(f"[TemporalGraph] Created edge: {source_type} -> {target_type}")
-        
-        edge = self.edges[source_type][target_type]
+            # Stronger weight for closer temporal relationships (5 second half-life)
+            strength = np.where(
+                is_co_occurrence,
+                (intensities[current] + intensities[recent]) / 2.0,
+                intensities[current] * np.exp(-time_diff / 5.0)
+            )
+            
+            sources.append(type_ids[recent][related])
+            targets.append(type_ids[current][related])
+            strengths.append(strength[related])
+            co_occurrence.append(is_co_occurrence[related])
+            positions.append(current[related])
+        
+        positions = np.concatenate(positions)
+        if len(positions) == 0:
+            return
+        # Pairs were built offset by offset; put them back in token order (offsets
+        # ascending within a token) so the batch reinforces edges in the same
+        # sequence as adding its tokens one at a time
+        order = np.argsort(positions, kind="stable")
+        positions = positions[order]
+        sources = np.concatenate(sources)[order]
+        targets = np.concatenate(targets)[order]
+        strengths = np.concatenate(strengths)[order]
+        co_occurrence = np.concatenate(co_occurrence)[order]
+        
+        # Resolve (creating as needed) one row per distinct edge. New rows are
+        # created per token, in key order within it, as single-token ingest does.
+        keys, first_pairs, pair_edges = np.unique((sources << 32) | targets, return_index=True,
+                                                  return_inverse=True)
+        rows = np.empty(len(keys), dtype=np.int64)
+        for edge in np.lexsort((keys, positions[first_pairs])).tolist():
+            key = int(keys[edge])
+            rows[edge] = self._get_or_create_edge(key >> 32, key & 0xFFFFFFFF)
+        pair_rows = rows[pair_edges]
         
         # Calculate fusion product (based on token metadata)
         fusion_product = 1.0  # Default, could be enhanced with context
         
-        # Apply reinforcement
-        edge.reinforce(strength, fusion_product, current_time, self.config)
-        
-        # Update edge type counts
-        if relationship_type == 'co_occurrence':
-            edge.co_occurrence_count += 1
-        elif relationship_type == 'succession':
-            edge.succession_count += 1
+        # Decay, reinforce and count every pair in one pass
+        self.edges.ingest(pair_rows, self.config.BETA * strengths * fusion_product, co_occurrence,
+                          current_time, self._decay_per_s)
         
-        self.stats['reinforcements_applied'] += 1
+        self.stats['reinforcements_applied'] += len(pair_rows)
         
         if self.debug:
-            print(f"[TemporalGraph] Reinforced edge: {source_type} -> {target_type} "
-                  f"(weight: {edge.weight:.3f}, type: {relationship_type})")
+            for row in rows.tolist():
+                print(f"[TemporalGraph] Reinforced edge: {self.edges.sources[row]} -> {self.edges.targets[row]} "
+                      f"(weight: {self.edges.weight[row]:.3f})")
+    
+    def _get_or_create_edge(self, source_id: int, target_id: int) -> int:
+        """Row of the edge between two interned nodes, creating it if needed."""
+        row = self.edges.row(source_id, target_id)
+        if row is None:
+            source_type = self.node_names[source_id]
+            target_type = self.node_names[target_id]
+            row = self.edges.add(source_type, target_type, source_id, target_id)
+            self.stats['edges_created'] += 1
+            if self.debug:
+                print(f"[TemporalGraph] Created edge: {source_type} -> {target_type}")
+        return row
     
     def _run_analysis(self, current_time: float):
         """Run periodic analysis to detect stable motifs."""
         if self.debug:
             print(f"[TemporalGraph] Running periodic analysis...")
         
-        # Apply decay to all edges first
-        self._apply_global_decay(current_time)
-        
+        # Decay is lazy: edges are brought forward when reinforced or read
         # Detect stable motifs
         new_motifs = self._detect_stable_motifs(current_time)
         
@@ -256,22 +439,6 @@ class TemporalGraph:
                         source='TemporalGraph'
                     )
     
-    def _apply_global_decay(self, current_time: float):
-        """Apply exponential decay to all edges."""
-        decay_count = 0
-        
-        for source_edges in self.edges.values():
-            for edge in source_edges.values():
-                old_weight = edge.weight
-                new_weight = edge.apply_decay(current_time, self.config)
-                if new_weight != old_weight:
-                    decay_count += 1
-        
-        self.stats['decay_operations'] += decay_count
-        
-        if self.debug and decay_count > 0:
-            print(f"[TemporalGraph] Applied decay to {decay_count} edges")
-    
     def _detect_stable_motifs(self, current_time: float) -> List[BehavioralMotif]:
         """
         Detect stable behavioral motifs using information theory.
@@ -280,97 +447,74 @@ class TemporalGraph:
         """
         motifs = []
         
-        # Look for strong 2-token motifs first (pairs)
-        for source_type, source_edges in self.edges.items():
-            for target_type, edge in source_edges.items():
-                
-                # Skip weak edges
-                if edge.weight < 0.3:
-                    continue
-                
-                # Calculate Pointwise Mutual Information (PMI)
-                pmi = self._calculate_pmi(source_type, target_type)
+        # Look for strong 2-token motifs first (pairs). Idle edges stay strong for
+        # a long time (weight 1.0 needs ~1200 s to decay below 0.3), so every
+        # edge is decayed and thresholded here rather than only recent ones.
+        weights = self.edges.effective_weights(current_time, self.config)
+        rows = np.flatnonzero(weights >= 0.3)
+        weights = weights[rows]
+        
+        # PMI and sigmoid(χ²) stability for every candidate in one compiled pass
+        edges = self.edges
+        pmis, stabilities = edge_significance(rows, edges.co_occurrence_count, edges.succession_count,
+                                              edges.source_id, edges.target_id, self.node_counts, self.total_tokens,
+                                              self.config.STABILITY_K, self.config.STABILITY_THETA)
+        if not self.debug:
+            # Only debug output needs to see the rejected candidates
+            keep = (pmis >= self.config.PMI_THRESHOLD) & (stabilities >= self.config.MOTIF_STABILITY_THRESHOLD)
+            rows, weights, pmis, stabilities = rows[keep], weights[keep], pmis[keep], stabilities[keep]
+        
+        for row, weight, pmi, stability in zip(rows.tolist(), weights.tolist(), pmis.tolist(), stabilities.tolist()):
+            source_type = self.edges.sources[row]
+            target_type = self.edges.targets[row]
+            
+            # Check PMI significance
+            if pmi < self.config.PMI_THRESHOLD:
+                if self.debug and weight > 0.8:
+                    print(f"[TemporalGraph] Motif {source_type}→{target_type} PMI too low: {pmi:.3f} < {self.config.PMI_THRESHOLD}")
+                continue
+            
+            # Check if motif is stable enough
+            if self.debug:
+                chi2 = self._calculate_chi_squared(source_type, target_type, row)
+                print(f"[TemporalGraph] Checking {source_type}→{target_type}: PMI={pmi:.3f}, χ²={chi2:.3f}, stability={stability:.3f}")
+            
+            if stability >= self.config.MOTIF_STABILITY_THRESHOLD:
+                # Create behavioral motif
+                motif_id = f"{source_type}→{target_type}"
                 
-                # Check PMI significance
-                if pmi < self.config.PMI_THRESHOLD:
-                    if self.debug and edge.weight > 0.8:
-                        print(f"[TemporalGraph] Motif {source_type}→{target_type} PMI too low: {pmi:.3f} < {self.config.PMI_THRESHOLD}")
+                # Skip if we've already detected this motif recently
+                if any(m.id == motif_id for m in self.detected_motifs[-10:]):
                     continue
                 
-                # Calculate Chi-squared statistic
-                chi2 = self._calculate_chi_squared(source_type, target_type, edge)
-                
-                # Apply sigmoid stability function
-                stability = self._calculate_stability(chi2)
+                feature_vector = self._extract_feature_vector(source_type, target_type, row, weight)
                 
-                # Check if motif is stable enough
-                if self.debug:
-                    print(f"[TemporalGraph] Checking {source_type}→{target_type}: PMI={pmi:.3f}, χ²={chi2:.3f}, stability={stability:.3f}")
+                motif = BehavioralMotif(
+                    id=motif_id,
+                    sequence=(source_type, target_type),
+                    stability=stability,
+                    feature_vector=feature_vector,
+                    session_seen_in=self.current_session
+                )
                 
-                if stability >= self.config.MOTIF_STABILITY_THRESHOLD:
-                    # Create behavioral motif
-                    motif_id = f"{source_type}→{target_type}"
-                    
-                    # Skip if we've already detected this motif recently
-                    if any(m.id == motif_id for m in self.detected_motifs[-10:]):
-                        continue
-                    
-                    feature_vector = self._extract_feature_vector(source_type, target_type, edge)
-                    
-                    motif = BehavioralMotif(
-                        id=motif_id,
-                        sequence=(source_type, target_type),
-                        stability=stability,
-                        feature_vector=feature_vector,
-                        session_seen_in=self.current_session
-                    )
-                    
-                    motifs.append(motif)
+                motifs.append(motif)
         
         return motifs
     
-    def _calculate_pmi(self, source_type: str, target_type: str) -> float:
-        """Calculate Pointwise Mutual Information between two token types."""
-        if source_type not in self.nodes or target_type not in self.nodes:
-            return 0.0
-        
-        # Get counts
-        total_tokens = sum(node.count for node in self.nodes.values())
-        source_count = self.nodes[source_type].count
-        target_count = self.nodes[target_type].count
-        
-        # Get co-occurrence count from edge
-        if target_type not in self.edges[source_type]:
-            return 0.0
-        
-        edge = self.edges[source_type][target_type]
-        joint_count = max(1, edge.co_occurrence_count + edge.succession_count)
-        
-        # Calculate PMI: log(P(x,y) / (P(x) * P(y)))
-        if total_tokens == 0 or source_count == 0 or target_count == 0:
-            return 0.0
-        
-        joint_prob = joint_count / total_tokens
-        source_prob = source_count / total_tokens
-        target_prob = target_count / total_tokens
-        
-        # Avoid log(0)
-        if joint_prob == 0 or source_prob == 0 or target_prob == 0:
-            return 0.0
-        
-        pmi = math.log(joint_prob / (source_prob * target_prob))
-        return pmi
+    def _joint_count(self, row: int) -> int:
+        """Total co-occurrence and succession observations for an edge."""
+        return int(self.edges.co_occurrence_count[row] + self.edges.succession_count[row])
     
-    def _calculate_chi_squared(self, source_type: str, target_type: str, edge: GraphEdge) -> float:
+    def _calculate_chi_squared(self, source_type: str, target_type: str, row: int) -> float:
         """Calculate Chi-squared statistic for independence test."""
         if source_type not in self.nodes or target_type not in self.nodes:
             return 0.0
         
         # Get counts
-        total_tokens = sum(node.count for node in self.nodes.values())
+        total_tokens = self.total_tokens
         source_count = self.nodes[source_type].count
         target_count = self.nodes[target_type].count
-        joint_count = max(1, edge.co_occurrence_count + edge.succession_count)
+        joint_count = max(1, self._joint_count(row))
         
         if total_tokens == 0 or source_count == 0 or target_count == 0:
             return 0.0
@@ -385,20 +529,7 @@ class TemporalGraph:
         chi2 = ((joint_count - expected) ** 2) / expected
         return chi2
     
-    def _calculate_stability(self, chi2: float) -> float:
-        """
-        Calculate stability using sigmoid function.
-        
-        Implements σ(χ²) = 1/(1 + e^(-k(χ² - θ)))
-        """
-        exponent = -self.config.STABILITY_K * (chi2 - self.config.STABILITY_THETA)
-        # Clamp to prevent overflow
-        exponent = max(-50, min(50, exponent))
-        
-        stability = 1.0 / (1.0 + math.exp(exponent))
-        return stability
-    
-    def _extract_feature_vector(self, source_type: str, target_type: str, edge: GraphEdge) -> Dict[str, float]:
+    def _extract_feature_vector(self, source_type: str, target_type: str, row: int, weight: float) -> Dict[str, float]:
         """Extract feature vector from motif components."""
         source_node = self.nodes.get(source_type)
         target_node = self.nodes.get(target_type)
@@ -406,29 +537,23 @@ class TemporalGraph:
         if not source_node or not target_node:
             return {}
         
+        co_occurrence_count = int(self.edges.co_occurrence_count[row])
+        joint_count = max(1, self._joint_count(row))
         return {
-            'edge_weight': edge.weight,
+            'edge_weight': weight,
             'source_intensity': source_node.average_intensity,
             'target_intensity': target_node.average_intensity,
-            'co_occurrence_ratio': edge.co_occurrence_count / max(1, edge.co_occurrence_count + edge.succession_count),
-            'temporal_consistency': min(1.0, edge.total_reinforcement / max(1, edge.co_occurrence_count + edge.succession_count)),
-            'session_breadth': len(source_node.sessions_seen.union(target_node.sessions_seen)) / max(1, self.current_session)
+            'co_occurrence_ratio': co_occurrence_count / joint_count,
+            'temporal_consistency': min(1.0, float(self.edges.total_reinforcement[row]) / joint_count),
+            'session_breadth': (source_node.sessions_mask | target_node.sessions_mask).bit_count() / max(1, self.current_session)
         }
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive graph statistics."""
-        total_edges = sum(len(edges) for edges in self.edges.values())
-        strong_edges = 0
-        avg_weight = 0.0
-        
-        if total_edges > 0:
-            weights = []
-            for source_edges in self.edges.values():
-                for edge in source_edges.values():
-                    weights.append(edge.weight)
-                    if edge.weight > 0.5:
-                        strong_edges += 1
-            avg_weight = sum(weights) / len(weights) if weights else 0.0
+        weights = self.edges.effective_weights(time.time(), self.config)
+        total_edges = len(self.edges)
+        strong_edges = int(np.count_nonzero(weights > 0.5))
+        avg_weight = float(weights.mean()) if total_edges > 0 else 0.0
         
         return {
             'nodes': len(self.nodes),
@@ -447,31 +572,37 @@ class TemporalGraph:
             return self.detected_motifs[-limit:]
         return self.detected_motifs.copy()
     
-    def get_edge_data(self) -> List[Dict[str, Any]]:
-        """Get edge data for visualization/analysis."""
-        edge_data = []
-        
-        for source_type, source_edges in self.edges.items():
-            for target_type, edge in source_edges.items():
-                edge_data.append({
-                    'source': source_type,
-                    'target': target_type,
-                    'weight': edge.weight,
-                    'co_occurrence_count': edge.co_occurrence_count,
-                    'succession_count': edge.succession_count,
-                    'total_reinforcement': edge.total_reinforcement,
-                    'last_update': edge.last_update_timestamp
-                })
+    def get_edge_data(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get edge data for visualization/analysis, optionally only the strongest `limit` edges."""
+        edges = self.edges
+        weights = edges.effective_weights(time.time(), self.config)
         
         # Sort by weight (strongest first)
-        edge_data.sort(key=lambda x: x['weight'], reverse=True)
-        return edge_data
+        order = _top_k(weights, limit if limit is not None else len(weights))
+        return [
+            {
+                'source': edges.sources[row],
+                'target': edges.targets[row],
+                'weight': float(weights[row]),
+                'co_occurrence_count': int(edges.co_occurrence_count[row]),
+                'succession_count': int(edges.succession_count[row]),
+                'total_reinforcement': float(edges.total_reinforcement[row]),
+                'last_update': float(edges.last_update_timestamp[row])
+            }
+            for row in order.tolist()
+        ]
     
     def clear(self):
         """Clear all graph data (for testing/reset)."""
         self.nodes.clear()
+        self.node_ids.clear()
+        self.node_names.clear()
+        self._nodes_by_id.clear()
+        self.node_counts.fill(0)
+        self.total_tokens = 0
         self.edges.clear()
-        self.token_buffer.clear()
+        self._buf_head = 0
+        self._buf_size = 0
         self.detected_motifs.clear()
         self.stats = {k: 0 for k in self.stats}
     
@@ -0,0 +1,55 @@
+# text_based_rpg/test_temporal_graph.py
+"""
+Checks that batched token ingest builds the same temporal graph as per-token ingest.
+"""
+
+# Add project root to path for imports
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+import pytest
+
+from shared.interfaces import Token
+from text_based_rpg import temporal_graph
+from text_based_rpg.config import PipelineConfig
+from text_based_rpg.temporal_graph import TemporalGraph
+
+
+def _edge_rows(graph: TemporalGraph):
+    """Every edge row's endpoints, weight and counters, in row order."""
+    size = graph.edges.size
+    return (list(zip(graph.edges.sources, graph.edges.targets)),
+            graph.edges.weight[:size].tolist(),
+            graph.edges.co_occurrence_count[:size].tolist(),
+            graph.edges.succession_count[:size].tolist())
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_batched_ingest_matches_per_token(monkeypatch, seed):
+    """Batched and one-at-a-time ingest of a stream build the same rows and motifs."""
+    rng = random.Random(seed)
+    clock = [1000.0]
+    monkeypatch.setattr(temporal_graph.time, "time", lambda: clock[0])
+    
+    types = [f"T{i}" for i in range(rng.randint(3, 8))]
+    batches = []
+    for _ in range(15):
+        clock[0] += rng.uniform(0.0, 3.0)
+        batches.append((clock[0], [
+            Token(rng.choice(types), clock[0] - rng.uniform(0.0, 4.0), {"intensity": rng.random()})
+            for _ in range(rng.randint(1, 30))
+        ]))
+    
+    per_token, batched = TemporalGraph(PipelineConfig()), TemporalGraph(PipelineConfig())
+    for now, batch in batches:
+        clock[0] = now
+        for token in batch:
+            per_token.add_tokens([token])
+        batched.add_tokens(batch)
+    
+    assert _edge_rows(batched) == _edge_rows(per_token)
+    assert [motif.sequence for motif in batched._detect_stable_motifs(clock[0])] == \
+        [motif.sequence for motif in per_token._detect_stable_motifs(clock[0])]
@@ -94,12 +94,12 @@ class TokenProcessor:
         if self.debug:
             print(f"[TokenProcessor] Processing {len(tokens_to_process)} new tokens")
         
-        # Feed tokens to temporal graph
-        for token in tokens_to_process:
-            self.temporal_graph.add_token(token, self.session_id)
-            self.stats['tokens_added_to_graph'] += 1
-            
-            if self.debug:
+        # Feed tokens to temporal graph in one batch
+        self.temporal_graph.add_tokens(tokens_to_process, self.session_id)
+        self.stats['tokens_added_to_graph'] += len(tokens_to_process)
+        
+        if self.debug:
+            for token in tokens_to_process:
                 intensity = token.metadata.get('intensity', 0.0)
                 print(f"[TokenProcessor] Added to graph: {token.type} (intensity: {intensity:.3f})")
         
@@ -126,9 +126,8 @@ class TokenProcessor:
             return
         
         # Add all tokens to the temporal graph
-        for token in all_tokens:
-            self.temporal_graph.add_token(token, self.session_id)
-            self.stats['tokens_added_to_graph'] += 1
+        self.temporal_graph.add_tokens(all_tokens, self.session_id)
+        self.stats['tokens_added_to_graph'] += len(all_tokens)
         
         self.stats['tokens_processed'] += len(all_tokens)
         self.stats['processing_cycles'] += 1
@@ -143,9 +142,9 @@ class TokenProcessor:
             **self.stats,
             'current_session': self.session_id,
             'last_process_time': self.last_process_time,
-            'tokenizer_tokens': len(self.tokenizer.get_token_history()),
+            'tokenizer_tokens': len(self.tokenizer.token_history),
             'graph_nodes': len(self.temporal_graph.nodes),
-            'graph_edges': sum(len(edges) for edges in self.temporal_graph.edges.values())
+            'graph_edges': len(self.temporal_graph.edges)
         }
     
     def start_new_session(self):
@@ -1,6 +1,7 @@
 import json
 import os
 import random
+from dataclasses import asdict, is_dataclass
 from typing import Optional
 from text_based_rpg.game_logic.state import GameState
 from shared.interfaces import Token, AssembledAbility, AbilityPrimitive, TriggerCondition
@@ -11,8 +12,8 @@ def save_game(game_state: GameState, session_num: int):
     os.makedirs("saves", exist_ok=True)
     # A helper to convert dataclasses to dicts, handling nested structures
     def as_dict_helper(obj):
-        if hasattr(obj, '__dict__'):
-            return obj.__dict__
+        if is_dataclass(obj):
+            return asdict(obj)
         return str(obj)
 
     save_data = {
@@ -20,13 +21,10 @@ def save_game(game_state: GameState, session_num: int):
         "player_location": game_state.player_location,
         "player_health_percent": game_state.player_health_percent,
         "player_stamina_percent": game_state.player_stamina_percent,
-        "abilities": {k: v.__dict__ for k, v in game_state.abilities.items()},
-        "token_history": [t.__dict__ for t in game_state.token_history]
+        # asdict recurses into primitives and the (slotted) trigger
+        "abilities": {k: asdict(v) for k, v in game_state.abilities.items()},
+        "token_history": [asdict(t) for t in game_state.token_history]
     }
-    # Clean up primitives for serialization
-    for ab in save_data["abilities"].values():
-        ab["primitives"] = [p.__dict__ for p in ab["primitives"]]
-        ab["trigger"] = ab["trigger"].__dict__
 
     with open(f"saves/session_{session_num}.json", "w") as f:
         json.dump(save_data, f, indent=2, default=as_dict_helper)